@@ -0,0 +1,32 @@
+/*******************************************************************************
+ * @file boot_timing.h
+ * @brief Cycles spent by the first hart in each boot stage.
+ *
+ * The stages are timed by main_first_hart() through mcycle, which counts the
+ * core clock cycles since reset, and printed by main() as
+ *
+ *     BOOT_CYCLES <stage> <cycles>
+ *
+ * so that the boot of two builds (e.g. running in place from envm or copied
+ * to LIM, see --boot-mode) can be compared with tools/boot_time_compare.py.
+ * Note that the core clock changes during mss_nwc_init(), so cycles are only
+ * comparable between builds of the same design.
+ *
+ */
+
+#ifndef BOOT_TIMING_H_
+#define BOOT_TIMING_H_
+
+#include <stdint.h>
+
+typedef struct
+{
+    uint64_t startup;       /* reset to main_first_hart(): startup code, copy to LIM, L2 setup */
+    uint64_t init_memory;   /* copy of the initialized data, clear of bss */
+    uint64_t nwc_init;      /* clocks, SGMII and IOMUX initialisation */
+    uint64_t ddr_init;      /* DDR training and memory initialisation */
+} boot_timing_t;
+
+extern boot_timing_t g_boot_timing;
+
+#endif /* BOOT_TIMING_H_ */
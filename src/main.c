@@ -14,6 +14,7 @@
 
 #include "mpfs_hal/mss_hal.h"
 #include "drivers/mss/mss_mmuart/mss_uart.h"
+#include "boot_timing.h"
 volatile uint32_t count_sw_ints_h0 = 0U;
 
 
@@ -26,6 +27,47 @@ const uint8_t g_message1[] =
 --------\r\n\r\n BOOTLOADER STARTED \r\n\r\n------------------\
 ---------------------------------------------------\r\n";
 
+/* Format value in decimal, returns the first digit written at the end of buf */
+static char * uint64_to_decimal(uint64_t value, char *buf, uint32_t buf_size)
+{
+    char *digit = &buf[buf_size - 1U];
+
+    *digit = '\0';
+    do
+    {
+        digit--;
+        *digit = (char) ('0' + (value % 10U));
+        value /= 10U;
+    } while (value != 0U);
+
+    return digit;
+}
+
+/* Print the cycles spent in each boot stage, see boot_timing.h */
+static void print_boot_timing(void)
+{
+    static const char * const stages[] =
+    {
+        "startup", "init_memory", "nwc_init", "ddr_init"
+    };
+    const uint64_t cycles[] =
+    {
+        g_boot_timing.startup, g_boot_timing.init_memory,
+        g_boot_timing.nwc_init, g_boot_timing.ddr_init
+    };
+    char digits[21];    /* UINT64_MAX has 20 digits */
+
+    for (uint32_t i = 0U; i < (sizeof(stages) / sizeof(stages[0])); i++)
+    {
+        MSS_UART_polled_tx_string(&g_mss_uart0_lo, (const uint8_t *) "BOOT_CYCLES ");
+        MSS_UART_polled_tx_string(&g_mss_uart0_lo, (const uint8_t *) stages[i]);
+        MSS_UART_polled_tx_string(&g_mss_uart0_lo, (const uint8_t *) " ");
+        MSS_UART_polled_tx_string(&g_mss_uart0_lo,
+                (const uint8_t *) uint64_to_decimal(cycles[i], digits, sizeof(digits)));
+        MSS_UART_polled_tx_string(&g_mss_uart0_lo, (const uint8_t *) "\r\n");
+    }
+}
+
 
 int main(void)
 {
@@ -40,6 +82,8 @@ int main(void)
 
     /* Message on uart0 */
     MSS_UART_polled_tx(&g_mss_uart0_lo, g_message1, sizeof(g_message1));
+
+    print_boot_timing();
 }
 
 /* hart0 software interrupt handler */
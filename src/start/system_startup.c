@@ -15,9 +15,13 @@
 #include "mpfs_hal/mss_hal.h"
 #include "mpfs_hal/common/nwc/mss_nwc_init.h"
 #include "mpfs_hal/startup_gcc/system_startup_defs.h"
+#include "boot_timing.h"
 
 static uint32_t parked_harts = 0U;
 
+/* Cycles spent in each boot stage by the first hart, printed by main() */
+boot_timing_t g_boot_timing;
+
 extern int main();
 static void park_hart(void);
 
@@ -40,9 +44,14 @@ int main_first_hart(HLS_DATA* hls)
     {
         uint8_t hart_id;
         ptrdiff_t stack_top;
+        uint64_t cycles = read_csr(mcycle);
 
         init_memory();
 
+        /* bss is cleared by init_memory(), the first stage is recorded now */
+        g_boot_timing.startup = cycles;
+        g_boot_timing.init_memory = read_csr(mcycle) - cycles;
+
         load_virtual_rom();
         (void)init_bus_error_unit();
         (void)init_mem_protection_unit();
@@ -57,8 +66,13 @@ int main_first_hart(HLS_DATA* hls)
          *      DDR
          *      IOMUX
          */
+        cycles = read_csr(mcycle);
         (void)mss_nwc_init();
+        g_boot_timing.nwc_init = read_csr(mcycle) - cycles;
+
+        cycles = read_csr(mcycle);
         (void)mss_nwc_init_ddr();
+        g_boot_timing.ddr_init = read_csr(mcycle) - cycles;
 
         /* main hart init's the PLIC */
         PLIC_init_on_reset();
@@ -299,7 +313,10 @@ static void park_hart(void)
   */
  void init_memory( void)
  {
+#if !defined(MPFS_HAL_COPY_TO_LIM)
+    /* in the copy-to-LIM boot mode, .text is already copied by mss_entry.S */
     copy_section(&__text_load, &__text_start, &__text_end);
+#endif
     copy_section(&__data_load, &__data_start, &__data_end);
     copy_section(&__srodata_load, &__srodata_start, &__srodata_end);
     copy_section(&__sdata_load, &__sdata_start, &__sdata_end);
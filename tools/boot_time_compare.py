@@ -0,0 +1,105 @@
+# !/usr/bin/python
+
+# pylint: disable=invalid-name
+#
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+# Date: 17/10/2026
+
+"""
+Boot Time Compare
+~~~~~~~
+
+The boot_time_compare script compares the time spent in each boot stage by two builds of the bootloader, typically
+the one executing in place from eNVM and the one copied to LIM at startup, configured with waf configure
+--boot-mode=xip and --boot-mode=copy-to-lim, to show the gain of the latter on the DDR training and memory initialisation loops.
+
+The bootloader prints, on the UART, the core clock cycles spent by the first hart in each boot stage (see
+boot_timing.h), as lines shaped as follows:
+
+        BOOT_CYCLES <stage> <cycles>
+
+The stages are:
+
+        1. startup, from reset to main_first_hart(): startup code, copy to LIM and L2 configuration
+        2. init_memory, copy of the initialized data and clear of bss
+        3. nwc_init, clocks, SGMII and IOMUX initialisation
+        4. ddr_init, DDR training and memory initialisation
+
+The UART output of each build is captured in a log file (e.g. trough picocom --logfile, or minicom -C), any other
+line in the log is ignored. When a log holds several boots, the last one is used.
+As the core clock changes during nwc_init, the cycles are only comparable between builds of the same design.
+
+This script accepts the following parameters:
+
+        1. The UART log of the baseline build
+        2. The UART log of the build to compare
+        3. Optional, --labels and the names of the two builds, defaulting to xip and copy-to-lim
+
+An example through command line:
+
+ python3 tools/boot_time_compare.py boot_xip.log boot_lim.log
+
+Note: This script can also be called as a python module in other scripts.
+"""
+
+import argparse
+import re
+import sys
+
+# Boot stages, in the order they are run
+BOOT_STAGES = ('startup', 'init_memory', 'nwc_init', 'ddr_init')
+
+# Regular expressions
+_boot_cycles_re = re.compile(r'BOOT_CYCLES\s+(?P<stage>\w+)\s+(?P<cycles>\d+)')
+
+
+def parse_boot_log(log_path) -> dict:
+    # Parse the cycles of each boot stage from a UART log. Returns a dictionary of cycles by
+    # stage, for the last boot of the log. Each boot starts with the line of the first stage,
+    # so that the stages of an earlier boot are not mixed with a last boot which was cut short.
+    cycles = {}
+    with open(log_path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            match = _boot_cycles_re.search(line)
+            if match:
+                if match['stage'] == BOOT_STAGES[0]:
+                    cycles = {}
+                cycles[match['stage']] = int(match['cycles'])
+
+    missing = [stage for stage in BOOT_STAGES if stage not in cycles]
+    if missing:
+        raise ValueError(f'{log_path}: no BOOT_CYCLES for {", ".join(missing)} in the last boot')
+    return cycles
+
+
+def compare_boot_times(baseline_path, compared_path) -> list:
+    # Compare the boot stages of two UART logs. Returns a list of
+    # (stage, baseline cycles, compared cycles, speedup) tuples, with a last total entry.
+    baseline = parse_boot_log(baseline_path)
+    compared = parse_boot_log(compared_path)
+
+    rows = [(stage, baseline[stage], compared[stage]) for stage in BOOT_STAGES]
+    rows.append(('total', sum(row[1] for row in rows), sum(row[2] for row in rows)))
+    return [(stage, before, after, before / after if after else float('inf')) for stage, before, after in rows]
+
+
+def print_comparison(rows, labels=('xip', 'copy-to-lim')):
+    print(f'{"Stage":<14}{labels[0]:>16}{labels[1]:>16}{"Delta":>16}{"Speedup":>10}')
+    for stage, before, after, speedup in rows:
+        print(f'{stage:<14}{before:>16}{after:>16}{after - before:>+16}{speedup:>9.2f}x')
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Compare the boot stages of two bootloader builds')
+    parser.add_argument('baseline', help='UART log of the baseline build')
+    parser.add_argument('compared', help='UART log of the build to compare')
+    parser.add_argument('--labels', nargs=2, default=['xip', 'copy-to-lim'], help='names of the two builds')
+    args = parser.parse_args()
+
+    try:
+        result = compare_boot_times(args.baseline, args.compared)
+    except (OSError, ValueError) as error:
+        sys.exit(str(error))
+
+    print_comparison(result, args.labels)
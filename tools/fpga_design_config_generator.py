@@ -0,0 +1,288 @@
+# !/usr/bin/python
+
+# pylint: disable=invalid-name
+#
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+# Date: 17/10/2026
+
+"""
+FPGA Design Config Generator
+~~~~~~~
+
+The fpga_design_config_generator script generates the fpga_design_config headers (clocks, DDR, IO, memory map,
+PMP/MPU, SGMII...) from the MSS configuration exported by Libero, in place of the external header generator.
+The XML is streamed trough iterparse, and every section is turned into its header as soon as it has been read, so
+only one section at a time is held in memory.
+
+A header is only written if its content changes, so the headers which are unaffected by a new export of the design
+keep their modification time, and only the sources including the headers which really changed are compiled again.
+
+This script accepts the following parameters:
+
+        1. The XML file exported by the MSS Configurator
+        2. The directory where the fpga_design_config headers are generated
+
+An example through command line:
+
+ python3 tools/fpga_design_config_generator.py confs/xml/PF_SOC_MSS_mss_cfg.xml include/fpga_design_config
+
+Note: This script can also be called as a python module in other scripts.
+"""
+
+import argparse
+import os
+import sys
+import textwrap
+import xml.etree.ElementTree as ET
+
+# Version of the external header generator the output of this script is compatible with
+HEADER_GENERATOR_VERSION = '0.6.4'
+
+# Header generated for each section of the XML, in the order they are included by fpga_design_config.h, together
+# with the prefix added to the name of the registers of the section
+SECTION_HEADERS = {
+    'map': ('memory_map/hw_memory.h', ''),
+    'apb_split': ('memory_map/hw_apb_split.h', ''),
+    'cache': ('memory_map/hw_cache.h', ''),
+    'pmp_h0': ('memory_map/hw_pmp_hart0.h', 'HART0_'),
+    'pmp_h1': ('memory_map/hw_pmp_hart1.h', 'HART1_'),
+    'pmp_h2': ('memory_map/hw_pmp_hart2.h', 'HART2_'),
+    'pmp_h3': ('memory_map/hw_pmp_hart3.h', 'HART3_'),
+    'pmp_h4': ('memory_map/hw_pmp_hart4.h', 'HART4_'),
+    'mpu_fic0': ('memory_map/hw_mpu_fic0.h', 'FIC0_'),
+    'mpu_fic1': ('memory_map/hw_mpu_fic1.h', 'FIC1_'),
+    'mpu_fic2': ('memory_map/hw_mpu_fic2.h', 'FIC2_'),
+    'mpu_crypto': ('memory_map/hw_mpu_crypto.h', 'CRYPTO_'),
+    'mpu_gem0': ('memory_map/hw_mpu_gem0.h', 'GEM0_'),
+    'mpu_gem1': ('memory_map/hw_mpu_gem1.h', 'GEM1_'),
+    'mpu_usb': ('memory_map/hw_mpu_usb.h', 'USB_'),
+    'mpu_mmc': ('memory_map/hw_mpu_mmc.h', 'MMC_'),
+    'mpu_scb': ('memory_map/hw_mpu_scb.h', 'SCB_'),
+    'mpu_trace': ('memory_map/hw_mpu_trace.h', 'TRACE_'),
+    'nvm_map': ('memory_map/hw_nvm_map.h', ''),
+    'io_mux': ('io/hw_mssio_mux.h', ''),
+    'io_mux_alt': ('io/hw_mssio_mux_alternate.h', ''),
+    'hsio': ('io/hw_hsio_mux.h', ''),
+    'tip': ('sgmii/hw_sgmii_tip.h', ''),
+    'options': ('ddr/hw_ddr_options.h', ''),
+    'io_bank': ('ddr/hw_ddr_io_bank.h', ''),
+    'mode': ('ddr/hw_ddr_mode.h', ''),
+    'off_mode': ('ddr/hw_ddr_off_mode.h', ''),
+    'segs': ('ddr/hw_ddr_segs.h', ''),
+    'ddrc': ('ddr/hw_ddrc.h', ''),
+    'clocks': ('clocks/hw_mss_clks.h', ''),
+    'mss_sys': ('clocks/hw_clk_sysreg.h', 'MSS_'),
+    'mss_pll': ('clocks/hw_clk_mss_pll.h', 'MSS_'),
+    'sgmii_pll': ('clocks/hw_clk_sgmii_pll.h', 'SGMII_'),
+    'ddr_pll': ('clocks/hw_clk_ddr_pll.h', 'DDR_'),
+    'mss_cfm': ('clocks/hw_clk_mss_cfm.h', 'MSS_'),
+    'sgmii_cfm': ('clocks/hw_clk_sgmii_cfm.h', 'SGMII_'),
+    'mss_peripherals': ('general/hw_gen_peripherals.h', ''),
+}
+
+# Sections whose settings, such as clock rates and page numbers, are emitted as plain decimal numbers
+DECIMAL_SECTIONS = ('clocks', 'nvm_map')
+
+# Name of the umbrella header, including all the generated ones
+DESIGN_CONFIG_HEADER = 'fpga_design_config.h'
+
+# Design information reported by the umbrella header, as (define, tag of design_information)
+DESIGN_INFORMATION = (
+    ('MSS_CONFIGURATOR_VERSION', 'libero_version'),
+    ('DESIGN_NAME', 'design_name'),
+    ('MPFS_PART', 'mpfs_part_no'),
+    ('GENERATION_DATE', 'creation_date_time'),
+)
+
+# Lines opening every generated header. Trailing whitespaces are kept as the external header generator emits them,
+# so that the generated headers are identical to the ones it generates.
+HEADER_PROLOGUE = '\n'.join([
+    '/*******************************************************************************',
+    ' * Copyright 2019-{year} Microchip FPGA Embedded Systems Solutions.',
+    ' *',
+    ' * SPDX-License-Identifier: MIT',
+    ' *',
+    ' * @file {file}',
+    ' * @author {author}',
+    ' *',
+    ' *',
+    ' * Note 1: This file should not be edited. If you need to modify a parameter',
+    ' * without going through regenerating using the MSS Configurator Libero flow ',
+    ' * or editing the associated xml file',
+    ' * the following method is recommended: ',
+    '',
+    ' * 1. edit the following file ',
+    ' * boards/your_board/platform_config/mpfs_hal_config/mss_sw_config.h',
+    '',
+    ' * 2. define the value you want to override there.',
+    ' * (Note: There is a commented example in the platform directory)',
+    '',
+    ' * Note 2: The definition in mss_sw_config.h takes precedence, as',
+    ' * mss_sw_config.h is included prior to the generated header files located in',
+    ' * boards/your_board/fpga_design_config',
+    ' *',
+    ' */',
+    '',
+    '#ifndef {guard}',
+    '#define {guard}',
+    '',
+    '',
+])
+
+HEADER_EPILOGUE = """\
+
+#ifdef __cplusplus
+}}
+#endif
+
+
+#endif /* #ifdef {guard} */
+
+"""
+
+
+def _header_guard(path):
+    return os.path.basename(path).replace('.', '_').upper() + '_'
+
+
+def _description_comment(description):
+    # Descriptions are wrapped at 79 columns, with runs of whitespaces collapsed
+    return textwrap.fill('/*' + ' '.join(description.split()) + ' */', width=79)
+
+
+def register_value(register):
+    # Value of a register element, made of the values of its read/write fields
+    value = 0
+    for field in register.findall('field'):
+        if field.get('Type') == 'RW':
+            value |= int(field.text.strip(), 0) << int(field.get('offset'))
+    return value
+
+
+def _register_lines(register, prefix, decimal):
+    name = f'LIBERO_SETTING_{prefix}{register.get("name")}'
+    fields = register.findall('field')
+    value = register_value(register)
+    wide = any(int(field.get('offset')) + int(field.get('width')) > 32 for field in fields)
+
+    lines = [f'#if !defined ({name})', _description_comment(register.get('description', ''))]
+    if decimal:
+        lines.append(f'#define {name}    {value}')
+    elif wide:
+        lines.append(f'#define {name}    0x{value:016X}ULL')
+    else:
+        lines.append(f'#define {name}    0x{value:08X}UL')
+    for field in fields:
+        # Field names are padded to 34 columns, names longer than 30 characters are followed by 8 spaces instead
+        field_name = field.get('name')
+        field_name += ' ' * (34 - len(field_name) if len(field_name) <= 30 else 8)
+        bits = f'[{field.get("offset")}:{field.get("width")}]'
+        # Only the value of the read/write fields is part of the register setting, and reported
+        value_text = f' value= {field.text.strip()}' if field.get('Type') == 'RW' else ''
+        lines.append(f'    /* {field_name}{bits:<8}{field.get("Type")}{value_text} */')
+    lines.append('#endif')
+    return lines
+
+
+def _mem_lines(mem, prefix):
+    name = f'LIBERO_SETTING_{prefix}{mem.get("name")}'
+    return [f'#if !defined ({name})',
+            f'/*{mem.get("description", "")} */',
+            f'#define {name}    {mem.text.strip()}',
+            f'#define {name}_SIZE    {mem.get("size")}    /* Length of memory block*/ ',
+            '#endif']
+
+
+def _render_header(path, body, year, author='Microchip-FPGA Embedded Systems Solutions'):
+    guard = _header_guard(path)
+    return (HEADER_PROLOGUE.format(year=year, file=os.path.basename(path), author=author, guard=guard)
+            + body
+            + HEADER_EPILOGUE.format(guard=guard))
+
+
+def _section_body(section, prefix, decimal):
+    lines = ['', '#ifdef __cplusplus', 'extern  "C" {', '#endif', '']
+    for element in section.iter():
+        if element.tag == 'register':
+            lines.extend(_register_lines(element, prefix, decimal))
+        elif element.tag == 'mem':
+            lines.extend(_mem_lines(element, prefix))
+    return '\n'.join(lines) + '\n'
+
+
+def _design_config_body(information):
+    defines = [(define, f'"{information.get(tag, "")}"') for define, tag in DESIGN_INFORMATION]
+    for define, version in (('XML_VERSION', information.get('xml_format_version', '0.0.0')),
+                            ('HEADER_GENERATOR_VERSION', HEADER_GENERATOR_VERSION)):
+        defines.append((define, f'"{version}"'))
+        for suffix, number in zip(('MAJOR', 'MINOR', 'PATCH'), version.split('.')):
+            defines.append((f'{define}_{suffix}', number))
+
+    lines = [f'#define  {f"LIBERO_SETTING_{define}":<59}{value}' for define, value in defines]
+    lines.append('')
+    lines.extend(f'#include "{path}"' for path, _ in SECTION_HEADERS.values())
+    lines.extend(['', '#ifdef __cplusplus', 'extern  "C" {', '#endif', '',
+                  '/* No content in this file, used for referencing header */'])
+    return '\n'.join(lines) + '\n'
+
+
+def iter_design_config_sections(xml_path):
+    # Stream the XML, yielding the tag and the element of design_information and of each section listed in
+    # SECTION_HEADERS as soon as it has been read. Elements are cleared once the caller is done with them.
+    depth = 0
+    for event, element in ET.iterparse(xml_path, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            continue
+        depth -= 1
+        if (depth == 1 and element.tag == 'design_information') or (depth == 2 and element.tag in SECTION_HEADERS):
+            yield element.tag, element
+            element.clear()
+
+
+def iter_design_config_headers(xml_path):
+    # Stream the XML, yielding the path, relative to the fpga_design_config directory, and the content of each
+    # header as soon as the corresponding section has been read. The umbrella header is yielded last.
+    information = {}
+    year = ''
+    for tag, element in iter_design_config_sections(xml_path):
+        if tag == 'design_information':
+            information = {child.tag: (child.text or '').strip() for child in element}
+            year = information.get('creation_date_time', '').split('_')[0].split('-')[-1]
+        else:
+            path, prefix = SECTION_HEADERS[tag]
+            yield path, _render_header(path, _section_body(element, prefix, tag in DECIMAL_SECTIONS), year)
+
+    yield DESIGN_CONFIG_HEADER, _render_header(DESIGN_CONFIG_HEADER, _design_config_body(information), year,
+                                               author='Embedded Software')
+
+
+def generate_fpga_design_config(xml_path, out_dir) -> list:
+    # Generate the fpga_design_config headers from xml_path into out_dir. Headers whose content is unchanged are not
+    # written, so that their modification time is preserved. Returns the list of the written headers.
+    written = []
+    for path, content in iter_design_config_headers(xml_path):
+        header_path = os.path.join(out_dir, path)
+        try:
+            with open(header_path, 'rb') as f:
+                if f.read() == content.encode('utf-8'):
+                    continue
+        except OSError:
+            pass
+        os.makedirs(os.path.dirname(header_path), exist_ok=True)
+        with open(header_path, 'wb') as f:
+            f.write(content.encode('utf-8'))
+        written.append(header_path)
+    return written
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Generate the fpga_design_config headers from the MSS configuration')
+    parser.add_argument('xml', help='XML file exported by the MSS Configurator')
+    parser.add_argument('out_dir', help='directory where the headers are generated')
+    args = parser.parse_args()
+
+    for header in generate_fpga_design_config(args.xml, args.out_dir):
+        print(f'Generated {header}')
+    sys.exit(0)
@@ -0,0 +1,195 @@
+# !/usr/bin/python
+
+# pylint: disable=invalid-name
+#
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+# Date: 17/10/2026
+
+"""
+Header Dependencies Benchmark
+~~~~~~~
+
+The header_deps_benchmark script compares the build times of the two header dependencies modes of the c task:
+scan, where waf runs its python preprocessor over the sources and the headers they include, and compiler, where the
+dependencies are read from the depfiles written by the compiler (-MMD).
+
+For each mode three builds are timed: a clean build, a no-op build (averaged over several runs) and the rebuild
+following a change to a header included by every source. Note that waf only runs the preprocessor scan of a task when
+one of its dependencies changed, so the no-op build is not where the two modes differ the most.
+
+The benchmark runs on a synthetic tree, built with the host compiler, made of a configurable number of headers shaped
+as the ones generated from the FPGA design (a guard followed by many #if !defined blocks), all included by each source
+trough an umbrella header. If a configured project is given with --project, the no-op build and the rebuild of that
+project are timed too, touching the given header.
+
+This script accepts the following parameters:
+
+        1. Optional, --headers N, the number of headers of the synthetic tree
+        2. Optional, --sources N, the number of sources of the synthetic tree
+        3. Optional, --project DIR, a configured project to be benchmarked too, e.g. the current tree
+        4. Optional, --touch HEADER, the header touched in the project, relative to it
+
+An example through command line:
+
+ python3 tools/header_deps_benchmark.py --headers 500 --sources 40
+ python3 tools/header_deps_benchmark.py --project . --touch include/fpga_design_config/fpga_design_config.h
+
+Which prints something like:
+
+   Tree                     Mode     Clean [s]     No-op [s]   Rebuild [s]
+   synthetic                scan         13.13          0.30         14.64
+   synthetic            compiler          2.66          0.35          2.48
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Root of the repository
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The waf executable shipped with the build system
+WAF = os.path.join(ROOT, 'wbuild', 'waf')
+
+# Number of no-op builds the no-op time is averaged over
+NOOP_RUNS = 5
+
+# Number of #if !defined blocks in each synthetic header
+BLOCKS_PER_HEADER = 50
+
+_SYNTHETIC_WSCRIPT = f'''
+import os
+import sys
+
+sys.path.insert(0, {ROOT!r})
+
+
+def options(opt):
+    opt.load('gcc')
+
+
+def configure(conf):
+    conf.load('gcc')
+    conf.load('c', tooldir={os.path.join(ROOT, 'wbuild', 'wafconf')!r})
+
+
+def build(bld):
+    bld.env.HEADER_DEPS = os.environ['HEADER_DEPS']
+    bld.env.CC_DEPS_F = ['-MMD'] if bld.env.HEADER_DEPS == 'compiler' else []
+    bld.program(source=bld.path.ant_glob('src/*.c'), target='app', includes='include', cflags=['-O0'])
+'''
+
+
+def _generate_synthetic_tree(path, headers, sources):
+    # Generate a waf project with the given number of headers and sources
+    os.makedirs(os.path.join(path, 'include'))
+    os.makedirs(os.path.join(path, 'src'))
+
+    for index in range(headers):
+        with open(os.path.join(path, 'include', f'hw_{index}.h'), 'w', encoding='utf-8') as f:
+            f.write(f'#ifndef HW_{index}_H_\n#define HW_{index}_H_\n')
+            for block in range(BLOCKS_PER_HEADER):
+                f.write(f'#if !defined (LIBERO_SETTING_{index}_{block})\n'
+                        f'#define LIBERO_SETTING_{index}_{block}    0x{block:08X}UL\n#endif\n')
+            f.write('#endif\n')
+
+    with open(os.path.join(path, 'include', 'design_config.h'), 'w', encoding='utf-8') as f:
+        f.writelines(f'#include "hw_{index}.h"\n' for index in range(headers))
+
+    for index in range(sources):
+        with open(os.path.join(path, 'src', f'source_{index}.c'), 'w', encoding='utf-8') as f:
+            f.write(f'#include "design_config.h"\nint source_{index}(void) {{ return {index}; }}\n')
+    with open(os.path.join(path, 'src', 'main.c'), 'w', encoding='utf-8') as f:
+        f.write('int main(void) { return 0; }\n')
+
+    with open(os.path.join(path, 'wscript'), 'w', encoding='utf-8') as f:
+        f.write(_SYNTHETIC_WSCRIPT)
+
+
+def _waf(path, args, env=None):
+    # Run waf in path and return the elapsed time
+    start = time.perf_counter()
+    subprocess.run([sys.executable, WAF] + args, cwd=path, env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def _touch(path):
+    # Change the content of a header, so that every source including it has to be rebuilt
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(f'\n/* {time.time()} */\n')
+
+
+def _print_row(tree, mode, clean, noop, rebuild):
+    clean = f'{clean:.2f}' if clean is not None else '-'
+    print(f'{"   " + tree:<22s}{mode:>10s}{clean:>14s}{noop:>14.2f}{rebuild:>14.2f}')
+
+
+def benchmark_synthetic(headers, sources):
+    """
+    Time the clean, no-op and rebuild builds of a synthetic tree, in both the header dependencies modes.
+
+    Args:
+        headers:        Number of headers of the synthetic tree
+        sources:        Number of sources of the synthetic tree
+    """
+    with tempfile.TemporaryDirectory() as tempdir:
+        _generate_synthetic_tree(tempdir, headers, sources)
+        _waf(tempdir, ['configure'])
+
+        for mode in ('scan', 'compiler'):
+            env = dict(os.environ, HEADER_DEPS=mode)
+            _waf(tempdir, ['clean'], env)
+            clean = _waf(tempdir, ['build'], env)
+            noop = sum(_waf(tempdir, ['build'], env) for _ in range(NOOP_RUNS)) / NOOP_RUNS
+            _touch(os.path.join(tempdir, 'include', 'hw_0.h'))
+            rebuild = _waf(tempdir, ['build'], env)
+            _print_row('synthetic', mode, clean, noop, rebuild)
+
+
+def benchmark_project(project, header):
+    """
+    Time the no-op and rebuild builds of a configured project, in both the header dependencies modes. The project is
+    built once in each mode before timing, as switching mode rebuilds every source. The touched header is restored
+    at the end.
+
+    Args:
+        project:        Path to the configured project
+        header:         Header touched before the rebuild, relative to the project
+    """
+    header_path = os.path.join(project, header)
+    with open(header_path, encoding='utf-8') as f:
+        original = f.read()
+
+    try:
+        for mode in ('scan', 'compiler'):
+            args = ['build_release', f'--header-deps={mode}']
+            _waf(project, args)
+            noop = sum(_waf(project, args) for _ in range(NOOP_RUNS)) / NOOP_RUNS
+            _touch(header_path)
+            rebuild = _waf(project, args)
+            _print_row(os.path.basename(os.path.abspath(project)), mode, None, noop, rebuild)
+    finally:
+        # Leave the project as it was found
+        with open(header_path, 'w', encoding='utf-8') as f:
+            f.write(original)
+
+
+# Allows us to use this python file as either a script or a module
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Compare the build times of the header dependencies modes')
+    parser.add_argument('--headers', type=int, default=2000, help='number of headers of the synthetic tree')
+    parser.add_argument('--sources', type=int, default=100, help='number of sources of the synthetic tree')
+    parser.add_argument('--project', help='configured project to be benchmarked too')
+    parser.add_argument('--touch', default=os.path.join('include', 'fpga_design_config', 'fpga_design_config.h'),
+                        help='header touched in the project before the rebuild, relative to it')
+    args = parser.parse_args()
+
+    print(f'{"   Tree":<22s}{"Mode":>10s}{"Clean [s]":>14s}{"No-op [s]":>14s}{"Rebuild [s]":>14s}')
+    benchmark_synthetic(args.headers, args.sources)
+    if args.project:
+        benchmark_project(args.project, args.touch)
@@ -0,0 +1,142 @@
+# !/usr/bin/python
+
+# pylint: disable=invalid-name
+#
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+# Date: 17/10/2026
+
+"""
+L2 Way Advisor
+~~~~~~~
+
+The l2_way_advisor script cross-references the L2 cache configuration of the design (hw_cache.h, as exported by the
+MSS Configurator XML) with the LIM and scratchpad usage of an application, read from its link map (the .map file
+generated trough -Wl,-Map=), to report the minimum number of L2 ways the application needs as LIM and as scratchpad.
+
+The L2 cache is made of 16 ways of 128 KiB each. The ways not needed by the application are left to the cache, which
+the next boot stage benefits from, and a way-mask configuration is suggested accordingly: ways 0 to WAY_ENABLE are
+enabled for the cache, the first NUM_SCRATCH_PAD_WAYS of them are reserved for the scratchpad and masked out of every
+master, while the ways above WAY_ENABLE are left as LIM.
+The suggested configuration is printed as LIBERO_SETTING_* overrides, ready to be pasted in mss_sw_config.h, which
+takes precedence over the generated headers.
+
+The LIM and scratchpad usage is the usage of the memory regions of the link map starting at the LIM and scratchpad
+base addresses, so it accounts for everything the linker script places there (code and data copied from eNVM, bss,
+heap, per hart stacks and hart local storage).
+
+This script accepts the following parameters:
+
+        1. The map file of the application
+        2. Optional, --xml and the XML exported by the MSS Configurator, defaulting to the one of this project
+        3. Optional, --headroom N, the bytes to keep free in LIM on top of the current usage
+        4. Optional, --output and the path of the file where the overrides are written
+
+An example through command line:
+
+ python3 tools/l2_way_advisor.py build/release/bvfboot.map
+ python3 tools/l2_way_advisor.py build/release/bvfboot.map --headroom 16384 --output l2_overrides.h
+
+Note: This script can also be called as a python module in other scripts.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from wbuild.support.design_config_support import (L2_LIM_ORIGIN, L2_SCRATCHPAD_ORIGIN, L2_WAY_SIZE, L2_WAYS,
+                                                  get_l2_allocation, parse_design_xml)
+from wbuild.support.map_support import parse_map_file
+
+# XML exported by the MSS Configurator for this project
+DEFAULT_XML = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'confs', 'xml', 'PF_SOC_MSS_mss_cfg.xml')
+
+
+def _ways_for(size):
+    return -(-size // L2_WAY_SIZE)
+
+
+def _region_usage(parsed_map, origin):
+    # Bytes used in the memory regions of the map starting at origin
+    return sum(mem_data['used'] for mem_data in parsed_map['memory'].values() if mem_data['origin'] == origin)
+
+
+def advise_l2_allocation(map_path, xml_path=DEFAULT_XML, headroom=0) -> dict:
+    # Compute the L2 allocation needed by the application linked into map_path, against the one of the design.
+    # Returns the current and suggested allocations, the LIM and scratchpad usage and the suggested settings.
+    design = parse_design_xml(xml_path)
+    parsed_map = parse_map_file(map_path)
+
+    lim_used = _region_usage(parsed_map, L2_LIM_ORIGIN)
+    scratchpad_used = _region_usage(parsed_map, L2_SCRATCHPAD_ORIGIN)
+    lim_ways = _ways_for(lim_used + headroom) if lim_used else 0
+    scratchpad_ways = _ways_for(scratchpad_used)
+
+    # Way 0 is always allocated to the cache, and the scratchpad ways are taken from the cache ones
+    if lim_ways + scratchpad_ways > L2_WAYS - 1:
+        raise ValueError(f'The application needs {lim_ways} LIM ways and {scratchpad_ways} scratchpad ways, '
+                         f'only {L2_WAYS - 1} are available')
+
+    way_enable = L2_WAYS - lim_ways - 1
+    way_mask = ((1 << (way_enable + 1)) - 1) & ~((1 << scratchpad_ways) - 1)
+
+    settings = {'WAY_ENABLE': way_enable, 'NUM_SCRATCH_PAD_WAYS': scratchpad_ways}
+    settings.update((name, way_mask) for name in design['registers'] if name.startswith('WAY_MASK_'))
+
+    return {
+        'current': get_l2_allocation(design),
+        'suggested': {'cache_ways': way_enable + 1 - scratchpad_ways, 'scratchpad_ways': scratchpad_ways,
+                      'lim_ways': lim_ways},
+        'lim_used': lim_used,
+        'scratchpad_used': scratchpad_used,
+        'settings': settings,
+        'changed': [name for name, value in settings.items() if design['registers'][name]['value'] != value],
+    }
+
+
+def format_overrides(advice) -> str:
+    # Format the suggested settings as LIBERO_SETTING_* overrides for mss_sw_config.h
+    suggested = advice['suggested']
+    lines = [f'/* L2 allocation: {suggested["cache_ways"]} cache ways, {suggested["lim_ways"]} LIM ways '
+             f'({advice["lim_used"]} bytes used), {suggested["scratchpad_ways"]} scratchpad ways '
+             f'({advice["scratchpad_used"]} bytes used) */']
+    for name, value in advice['settings'].items():
+        lines.append(f'#define LIBERO_SETTING_{name}    0x{value:08X}UL')
+    return '\n'.join(lines) + '\n'
+
+
+def print_advice(advice):
+    current, suggested = advice['current'], advice['suggested']
+    print(f'{"":<20}{"Current":>10}{"Suggested":>12}')
+    for key, label in (('cache_ways', 'Cache ways'), ('lim_ways', 'LIM ways'), ('scratchpad_ways', 'Scratchpad ways')):
+        print(f'{label:<20}{current[key]:>10}{suggested[key]:>12}')
+    print(f'\nLIM used: {advice["lim_used"]} bytes of {suggested["lim_ways"] * L2_WAY_SIZE}, '
+          f'scratchpad used: {advice["scratchpad_used"]} bytes of {suggested["scratchpad_ways"] * L2_WAY_SIZE}')
+    if not advice['changed']:
+        print('\nThe L2 configuration of the design already matches the needs of the application.')
+    else:
+        print(f'\n{len(advice["changed"])} settings change, to be overridden in mss_sw_config.h:\n')
+        print(format_overrides(advice))
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Suggest the L2 cache / LIM / scratchpad split an application needs')
+    parser.add_argument('map', help='map file of the application')
+    parser.add_argument('--xml', default=DEFAULT_XML, help='XML exported by the MSS Configurator')
+    parser.add_argument('--headroom', type=int, default=0, help='bytes to keep free in LIM')
+    parser.add_argument('--output', help='file where the LIBERO_SETTING_* overrides are written')
+    args = parser.parse_args()
+
+    try:
+        result = advise_l2_allocation(args.map, args.xml, args.headroom)
+    except ValueError as error:
+        sys.exit(str(error))
+
+    print_advice(result)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(format_overrides(result))
@@ -10,43 +10,229 @@ MSS Header Binder
 ~~~~~~~
 
 The mss_header_binder script is used to create a header definition for the
-supplied binary file, if supported. This script requires two parameters:
+supplied binary file, if supported. This script accepts up to two parameters:
 
         1. The BIN file we want to add a header to
-        2. The path to objdump
+        2. Optional, the path to objcopy. If given, objcopy is used to generate the intel hex file
+           in place of the builtin encoder
 
 This script will return a -bm1-p0.hex file which can be programmed on the hardware board either using Libero SoC or as
 ENVM client or directly using the Microchip fpgenprog utility.
 
 An example through command line:
 
+ python3 mss_header_binder.py c3boot.bin
  python3 mss_header_binder.py c3boot.bin riscv64-unknown-elf-objcopy
 
 Note: This script can also be called as a python module in other scripts.
 """
 
+import mmap
+import os
 import subprocess
 import sys
 
+# Maximum number of data bytes per Intel HEX record. This is the same value used by the
+# BFD ihex backend, hence by objcopy.
+IHEX_RECORD_LENGTH = 16
 
-def bind_mss_header_to_bin(file, objcopy):
+# Intel HEX record types
+IHEX_DATA = 0x00
+IHEX_END_OF_FILE = 0x01
+IHEX_EXTENDED_SEGMENT_ADDRESS = 0x02
+IHEX_EXTENDED_LINEAR_ADDRESS = 0x04
+
+# Number of bytes which are formatted in bulk by the Intel HEX encoder
+BULK_RECORDS_LENGTH = 4096 * IHEX_RECORD_LENGTH
+
+# ENVM base address
+ENVM_BASE_ADDRESS = 0x20220000
+
+# Size of the chunks in which the payload is read, when not memory mapped
+READ_CHUNK_SIZE = 64 * 1024
+
+# Size of the windows in which the payload is memory mapped. Mapping one window at a time,
+# instead of the whole file, keeps the resident set size constant whatever the payload size.
+MMAP_WINDOW_SIZE = 1024 * 1024
+
+
+class IntelHexWriter:
+    """
+    Streaming Intel HEX encoder. Data is pushed trough the write method in chunks of any size,
+    and the records are emitted on the fly, so that the whole image never needs to be held in
+    memory. The record layout (16 bytes per record, no record crossing a 64K boundary, extended
+    segment address records below 1 MiB and extended linear address records above, CRLF line
+    terminators) mimics the BFD ihex backend, so the output is byte-identical to:
+
+        objcopy -I binary -O ihex --change-section-lma *+base_address in.bin out.hex
+
+    Args:
+        out:            Text stream in which the records are written
+        base_address:   Load address of the first byte written
+
+    Examples:
+        with open('c3boot.hex', 'w', encoding='ascii', newline='') as f:
+            writer = IntelHexWriter(f, 0x20220000)
+            writer.write(header)
+            writer.write(payload)
+            writer.close()
+    """
+
+    def __init__(self, out, base_address):
+        self._out = out
+        self._where = base_address
+        self._pending = bytearray()
+        self._segbase = 0
+        self._extbase = 0
+
+    def _write_record(self, record_type, address, data):
+        checksum = len(data) + (address >> 8) + (address & 0xff) + record_type + sum(data)
+        self._out.write(f':{len(data):02X}{address:04X}{record_type:02X}{data.hex().upper()}'
+                        f'{-checksum & 0xff:02X}\r\n')
+
+    def _write_data(self, data):
+        # Emit a data record, preceded by a new base address record if the current one does
+        # not cover the address of the data
+        where = self._where
+        if where > self._segbase + self._extbase + 0xffff:
+            if self._extbase == 0 and where <= 0xfffff:
+                self._segbase = where & 0xf0000
+                self._write_record(IHEX_EXTENDED_SEGMENT_ADDRESS, 0,
+                                   (self._segbase >> 4).to_bytes(2, 'big'))
+            else:
+                # The extended segment and extended linear address records are combined by
+                # some readers, so zero out the former before switching to the latter
+                if self._segbase != 0:
+                    self._segbase = 0
+                    self._write_record(IHEX_EXTENDED_SEGMENT_ADDRESS, 0, bytes(2))
+                self._extbase = where & 0xffff0000
+                if self._extbase > 0xffff0000:
+                    raise ValueError(f'Address 0x{where:x} out of range for Intel HEX')
+                self._write_record(IHEX_EXTENDED_LINEAR_ADDRESS, 0,
+                                   (self._extbase >> 16).to_bytes(2, 'big'))
+
+        # Records shall not cross 64K boundaries
+        record_address = where - (self._extbase + self._segbase)
+        length = min(len(data), 0x10000 - record_address)
+        self._write_record(IHEX_DATA, record_address, data[:length])
+        self._where += length
+        return length
+
+    def _write_full_records(self, data):
+        # Emit as many full data records as possible from data in one go, formatting them in
+        # bulk. Falls back to _write_data when a new base address record is needed or the
+        # first record would cross a 64K boundary.
+        record_address = self._where - (self._extbase + self._segbase)
+        count = min(len(data), 0x10000 - record_address) // IHEX_RECORD_LENGTH
+        if record_address > 0xffff or count == 0:
+            return self._write_data(bytes(data[:IHEX_RECORD_LENGTH]))
+
+        length = count * IHEX_RECORD_LENGTH
+        block = bytes(data[:length])
+        hexed = block.hex().upper()
+        records = []
+        for start in range(0, length, IHEX_RECORD_LENGTH):
+            address = record_address + start
+            checksum = IHEX_RECORD_LENGTH + (address >> 8) + (address & 0xff) + \
+                sum(block[start:start + IHEX_RECORD_LENGTH])
+            records.append(f':{IHEX_RECORD_LENGTH:02X}{address:04X}{IHEX_DATA:02X}'
+                           f'{hexed[2 * start:2 * (start + IHEX_RECORD_LENGTH)]}{-checksum & 0xff:02X}\r\n')
+        self._out.write(''.join(records))
+        self._where += length
+        return length
+
+    def write(self, data):
+        """
+        Append data to the image, emitting all the records which are complete.
+
+        Args:
+            data:           Bytes-like object holding the data to be appended
+        """
+        data = memoryview(data).cast('B')
+        offset = 0
+
+        while True:
+            if self._pending or len(data) - offset < IHEX_RECORD_LENGTH:
+                # Accumulate the bytes which are not enough to fill a full record
+                length = min(IHEX_RECORD_LENGTH - len(self._pending), len(data) - offset)
+                self._pending += data[offset:offset + length]
+                offset += length
+                if len(self._pending) < IHEX_RECORD_LENGTH:
+                    return
+                del self._pending[:self._write_data(bytes(self._pending))]
+            else:
+                offset += self._write_full_records(data[offset:offset + BULK_RECORDS_LENGTH])
+
+    def close(self):
+        """
+        Flush the last (short) record and terminate the image with the end of file record.
+        """
+        while self._pending:
+            del self._pending[:self._write_data(bytes(self._pending))]
+        self._write_record(IHEX_END_OF_FILE, 0, b'')
+
+
+def iter_payload_chunks(file_obj, use_mmap=True):
+    """
+    Generator which streams the content of a binary file. If use_mmap is set, the file is memory mapped one window
+    at a time and each window is yielded as a memoryview, so that the payload is never copied into the Python heap.
+    Otherwise, the file is read in chunks of READ_CHUNK_SIZE bytes.
+    The yielded memoryviews are released as soon as the next chunk is requested, so the caller must copy any data it
+    needs to retain.
+
+    Args:
+        file_obj:       Binary file object opened for reading
+        use_mmap:       Whether to memory map the file or not
+
+    Returns:
+        chunk:          Bytes-like object holding the next chunk of the file
+
+    Examples:
+        with open('build/release/c3boot.bin', 'rb') as f:
+            for chunk in iter_payload_chunks(f):
+                out.write(chunk)
+    """
+    size = os.fstat(file_obj.fileno()).st_size
+
+    # Empty files cannot be memory mapped
+    if not use_mmap or size == 0:
+        while chunk := file_obj.read(READ_CHUNK_SIZE):
+            yield chunk
+        return
+
+    for offset in range(0, size, MMAP_WINDOW_SIZE):
+        length = min(MMAP_WINDOW_SIZE, size - offset)
+        with mmap.mmap(file_obj.fileno(), length, access=mmap.ACCESS_READ, offset=offset) as window:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                window.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(window) as chunk:
+                yield chunk
+
+
+def bind_mss_header_to_bin(file, objcopy=None, use_mmap=True):
     """
     Procedure which is done trough this function has been reverse engineered from mpfsbootmodeprogrammer jar source
     code. Once the bootloader binary file is created, we need to prepend to the bin a small header which tells the
     pre-boot firmware of the board to start the ENVM client in BOOTMODE 1. To know more about Polarfire SoC bootmode,
     please, have a look at Polarfire SoC official documentation.
-    Once we have attached the header to the payload, we need to convert the whole thing to intel hex format, passing
-    to objcopy the --change-section-lma *+0x20220000 parameter, where 0x20220000 is the ENVM base address.
+    Once we have attached the header to the payload, we need to convert the whole thing to intel hex format, loaded
+    at 0x20220000, which is the ENVM base address. This is done in the same pass which writes the binary, trough the
+    IntelHexWriter encoder. If objcopy is given, the conversion is instead done by passing to objcopy the
+    --change-section-lma *+0x20220000 parameter.
+    By default the payload is memory mapped and streamed trough memoryviews, so peak memory usage does not depend
+    on the payload size. Set use_mmap to False to read it in chunks instead.
 
     Args:
         file:           The binary file we want to add a header to
-        objcopy:        Objcopy executable
+        objcopy:        Optional, objcopy executable to be used in place of the builtin encoder
+        use_mmap:       Optional, whether to memory map the payload or not
 
     Returns:
         file:           A .hex file is created in the same directory where the supplied file lives
 
     Examples:
-        bind_mss_header_to_bin('build/release/c3boot.bin'', 'riscv64-unknown-elf-objcopy')
+        bind_mss_header_to_bin('build/release/c3boot.bin')
+        bind_mss_header_to_bin('build/release/c3boot.bin', 'riscv64-unknown-elf-objcopy')
     """
     # This has been reverse engineered from *-bm1-dummySbic.bin which is produced by fpgenprog tool.
     # If you need to extract it again:
@@ -71,32 +257,44 @@ def bind_mss_header_to_bin(file, objcopy):
                 b'\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00' \
                 b'\x00\x00\x00\x00\x00\x00'
 
-    # ENVM base address
-    envm_base_address = str(20220000)
-
     # Strip extension from file to manipulate it in the following steps
     filename_wo_ext = file.rsplit('.', 1)[0]
     # Variable holding file names
     bootmode1_bin = filename_wo_ext + '-bm1-p0.bin'
     bootmode1_hex = filename_wo_ext + '-bm1-p0.hex'
 
-    # Concatenate the bootloader bin with the MSS header
+    if objcopy:
+        # Concatenate the bootloader bin with the MSS header
+        with open(file, "rb") as old, \
+                open(bootmode1_bin, "wb") as new:
+            new.write(bootmode1)
+            for chunk in iter_payload_chunks(old, use_mmap):
+                new.write(chunk)
+
+        subprocess.check_call([objcopy, '-I', 'binary', '-O', 'ihex',
+                               f'--change-section-lma=*+0x{ENVM_BASE_ADDRESS:x}',
+                               bootmode1_bin, bootmode1_hex])
+        return
+
+    # Concatenate the bootloader bin with the MSS header, encoding the intel hex on the fly
     with open(file, "rb") as old, \
-            open(bootmode1_bin, "wb") as new:
+            open(bootmode1_bin, "wb") as new, \
+            open(bootmode1_hex, "w", encoding='ascii', newline='') as new_hex:
+        hex_writer = IntelHexWriter(new_hex, ENVM_BASE_ADDRESS)
         new.write(bootmode1)
-        new.write(old.read())
-
-    # This is utterly ugly, but I need to do it like this until I have the time to learn how to do it better
-    subprocess.call(objcopy + ' -I binary -O ihex --change-section-lma *+0x' + envm_base_address + ' ' +
-                    bootmode1_bin + ' ' + bootmode1_hex, shell=True)
+        hex_writer.write(bootmode1)
+        for chunk in iter_payload_chunks(old, use_mmap):
+            new.write(chunk)
+            hex_writer.write(chunk)
+        hex_writer.close()
 
 
 # Allows us to use this python file as either a script or a module
 if __name__ == "__main__":
 
-    if len(sys.argv) < 3 or len(sys.argv) > 3:
-        print("You must provide this with at least two parameters, read the documentation to understand how it works.")
+    if len(sys.argv) < 2 or len(sys.argv) > 3:
+        print("You must provide this with one or two parameters, read the documentation to understand how it works.")
         sys.exit(1)
 
     # Do sys argv handling here
-    bind_mss_header_to_bin(sys.argv[1], sys.argv[2])
+    bind_mss_header_to_bin(*sys.argv[1:])
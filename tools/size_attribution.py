@@ -0,0 +1,170 @@
+# !/usr/bin/python
+
+# pylint: disable=invalid-name
+#
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+# Date: 17/10/2026
+
+"""
+Size Attribution
+~~~~~~~
+
+The size_attribution script attributes the bytes placed in memory by the linker to the symbols, object files and
+libraries they come from, reading the per input section contributions listed in the link map (the .map file
+generated trough -Wl,-Map=). The map file is streamed, so even the biggest maps are handled in constant memory.
+Only the output sections placed in a memory region of the linker script are taken into account, so debug sections
+are ignored.
+
+Bytes are attributed to symbols as follows: each global symbol listed by the map gets the bytes from its address to
+the next symbol or to the end of its input section. The bytes of input sections listing no symbols, as it is the case
+for static functions and data, are attributed to the name of the input section, stripped of its .text., .rodata.,
+.data., .bss. and similar prefix, which is the function or data name when building with -ffunction-sections and
+-fdata-sections.
+
+Object files are grouped in libraries as follows: archive members are grouped by archive, objects built from lib/ or
+ext/ are grouped by module (e.g. lib/libplatform), while the other objects are grouped by their top level directory
+(e.g. src).
+
+This script accepts the following parameters:
+
+        1. The map file to analyse
+        2. Optional, --diff and a second map file, to compare the first map against
+        3. Optional, --by object|library|symbol, to restrict the report to one grouping
+        4. Optional, --top N, to limit every table to N rows
+
+An example through command line:
+
+ python3 tools/size_attribution.py build/release/bvfboot.map --by library
+ python3 tools/size_attribution.py build/release/bvfboot.map --diff baseline/bvfboot.map --top 20
+
+Note: This script can also be called as a python module in other scripts.
+"""
+
+import argparse
+import collections
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from wbuild.support.map_support import iter_input_sections, parse_map_file
+
+# Prefixes stripped from input section names to get the name of the function or data they hold
+SECTION_PREFIXES = ('.text.', '.rodata.', '.srodata.', '.data.', '.sdata.', '.bss.', '.sbss.', '.ram_codetext.')
+
+# Groupings supported by the attribution
+GROUPINGS = ('library', 'object', 'symbol')
+
+
+def _section_symbol_name(section_name):
+    for prefix in SECTION_PREFIXES:
+        if section_name.startswith(prefix):
+            return section_name[len(prefix):]
+    return section_name
+
+
+def _library_name(object_path):
+    if object_path.endswith(')') and '(' in object_path:
+        return os.path.basename(object_path[:object_path.index('(')])
+    if os.path.isabs(object_path):
+        return os.path.dirname(object_path)
+    components = os.path.normpath(object_path).split(os.sep)
+    if components[0] in ('lib', 'ext') and len(components) > 2:
+        return os.path.join(components[0], components[1])
+    return components[0]
+
+
+def _symbol_contributions(input_section):
+    # Split the bytes of an input section among the symbols it defines
+    start = input_section['start']
+    end = start + input_section['size']
+    symbols = sorted((address, name) for address, name in input_section['symbols'] if start <= address < end)
+
+    if not symbols or symbols[0][0] > start:
+        first = symbols[0][0] if symbols else end
+        yield _section_symbol_name(input_section['section']), first - start
+
+    for index, (address, name) in enumerate(symbols):
+        following = symbols[index + 1][0] if index + 1 < len(symbols) else end
+        yield name, following - address
+
+
+def attribute_sizes(map_path):
+    """
+    Attribute the bytes placed in memory by the linker to symbols, object files and libraries.
+
+    Args:
+        map_path:       Path to the map file
+
+    Returns:
+        sizes:          Dictionary holding, for each grouping in GROUPINGS, a Counter of the bytes attributed to
+                        each name
+
+    Examples:
+        sizes = attribute_sizes('build/release/bvfboot.map')
+        print(sizes['library'].most_common(5))
+    """
+    out_sect = parse_map_file(map_path)['sections']
+    sizes = {grouping: collections.Counter() for grouping in GROUPINGS}
+
+    for input_section in iter_input_sections(map_path):
+        if not input_section['size'] or not out_sect.get(input_section['output'], {}).get('memory'):
+            continue
+
+        sizes['object'][input_section['object']] += input_section['size']
+        sizes['library'][_library_name(input_section['object'])] += input_section['size']
+        for name, size in _symbol_contributions(input_section):
+            sizes['symbol'][name] += size
+
+    return sizes
+
+
+def print_attribution(sizes, baseline=None, groupings=GROUPINGS, top=None):
+    """
+    Print the attribution tables, biggest first. If a baseline is given, the difference against it is printed too,
+    and rows are sorted by the absolute value of the difference.
+
+    Args:
+        sizes:          Attribution, as returned by attribute_sizes
+        baseline:       Optional, attribution to compare against, as returned by attribute_sizes
+        groupings:      Optional, groupings to be printed
+        top:            Optional, maximum number of rows printed for each grouping
+    """
+    for grouping in groupings:
+        current = sizes[grouping]
+        tilde = '~' * (100 if baseline else 72)
+        print(tilde)
+        if baseline:
+            base = baseline[grouping]
+            print(f'{"   " + grouping.capitalize():<58s}{"Baseline":>14s}{"Current":>14s}{"Delta":>14s}')
+            print(tilde)
+            names = sorted(set(current) | set(base), key=lambda name: (-abs(current[name] - base[name]), name))
+            names = [name for name in names if current[name] != base[name]][:top]
+            for name in names:
+                print(f'{"   " + name:<58s}{base[name]:>14d}{current[name]:>14d}{current[name] - base[name]:>+14d}')
+            print(f'{"   Total":<58s}{sum(base.values()):>14d}{sum(current.values()):>14d}'
+                  f'{sum(current.values()) - sum(base.values()):>+14d}')
+        else:
+            print(f'{"   " + grouping.capitalize():<58s}{"Size [byte]":>14s}')
+            print(tilde)
+            for name, size in current.most_common(top):
+                print(f'{"   " + name:<58s}{size:>14d}')
+            print(f'{"   Total":<58s}{sum(current.values()):>14d}')
+        print(tilde + '\n')
+
+
+# Allows us to use this python file as either a script or a module
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Attribute the memory footprint of a build from its link map')
+    parser.add_argument('map', help='map file to analyse')
+    parser.add_argument('--diff', metavar='BASELINE_MAP', help='map file of the build to compare against')
+    parser.add_argument('--by', choices=GROUPINGS, help='only print the given grouping')
+    parser.add_argument('--top', type=int, default=None, help='maximum number of rows for each grouping')
+    args = parser.parse_args()
+
+    print_attribution(attribute_sizes(args.map),
+                      attribute_sizes(args.diff) if args.diff else None,
+                      (args.by,) if args.by else GROUPINGS,
+                      args.top)
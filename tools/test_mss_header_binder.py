@@ -0,0 +1,112 @@
+# !/usr/bin/python
+
+# pylint: disable=invalid-name
+#
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+# Date: 17/10/2026
+
+"""
+MSS Header Binder Tests
+~~~~~~~
+
+Checks that the intel hex files generated by the builtin IntelHexWriter encoder of mss_header_binder are byte-identical
+to the ones generated by objcopy -O ihex, on payloads sized around the record, 64K and mmap window boundaries. The
+tests are skipped if objcopy is not found, either the one of the toolchain or the one of the host.
+
+An example through command line:
+
+ python3 -m unittest tools/test_mss_header_binder.py
+ OBJCOPY=riscv64-unknown-elf-objcopy python3 -m pytest tools/test_mss_header_binder.py
+"""
+
+import io
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from tools.mss_header_binder import ENVM_BASE_ADDRESS, MMAP_WINDOW_SIZE, IntelHexWriter, bind_mss_header_to_bin
+
+OBJCOPY = shutil.which(os.environ.get('OBJCOPY', 'riscv64-unknown-elf-objcopy')) or shutil.which('objcopy')
+
+# Payload sizes: empty, around a record, just below and above 64K, and spanning several mmap windows, which also
+# crosses the 1 MiB boundary where the extended segment address records switch to extended linear address records
+PAYLOAD_SIZES = (0, 1, 15, 16, 17, 64 * 1024 - 256, 64 * 1024 + 5, 2 * MMAP_WINDOW_SIZE + 37)
+
+
+def _payload(size) -> bytes:
+    return random.Random(size).randbytes(size)
+
+
+def _objcopy_ihex(tempdir, data, base_address) -> bytes:
+    bin_path = os.path.join(tempdir, 'objcopy.bin')
+    hex_path = os.path.join(tempdir, 'objcopy.hex')
+    with open(bin_path, 'wb') as f:
+        f.write(data)
+    subprocess.check_call([OBJCOPY, '-I', 'binary', '-O', 'ihex', f'--change-section-lma=*+0x{base_address:x}',
+                           bin_path, hex_path])
+    with open(hex_path, 'rb') as f:
+        return f.read()
+
+
+def _writer_ihex(data, base_address, chunk_size) -> bytes:
+    out = io.StringIO(newline='')
+    writer = IntelHexWriter(out, base_address)
+    for offset in range(0, len(data), chunk_size):
+        writer.write(data[offset:offset + chunk_size])
+    writer.close()
+    return out.getvalue().encode('ascii')
+
+
+@unittest.skipIf(OBJCOPY is None, 'objcopy not found')
+class IntelHexWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.tempdir = self._tempdir.name
+
+    def tearDown(self):
+        self._tempdir.cleanup()
+
+    def test_matches_objcopy(self):
+        # Both at the eNVM base address, and from 0 to go trough the extended segment address records. Data is
+        # written both in one go and in odd sized chunks, which do not fill whole records.
+        for size in PAYLOAD_SIZES[1:]:
+            data = _payload(size)
+            for base_address in (ENVM_BASE_ADDRESS, 0):
+                expected = _objcopy_ihex(self.tempdir, data, base_address)
+                for chunk_size in (max(size, 1), 7, 4099):
+                    with self.subTest(size=size, base_address=hex(base_address), chunk_size=chunk_size):
+                        self.assertEqual(_writer_ihex(data, base_address, chunk_size), expected)
+
+    def test_empty(self):
+        # objcopy refuses empty inputs, an empty image is made of the end of file record only
+        self.assertEqual(_writer_ihex(b'', ENVM_BASE_ADDRESS, 1), b':00000001FF\r\n')
+
+    def test_bind_matches_objcopy(self):
+        # The hex file bound by the builtin encoder, from a memory mapped or read payload, is the one objcopy makes.
+        # The MSS header is prepended to the payload, so the image is never empty.
+        for size in PAYLOAD_SIZES:
+            payload_path = os.path.join(self.tempdir, f'payload_{size}.bin')
+            with open(payload_path, 'wb') as f:
+                f.write(_payload(size))
+
+            bind_mss_header_to_bin(payload_path, OBJCOPY)
+            with open(os.path.join(self.tempdir, f'payload_{size}-bm1-p0.hex'), 'rb') as f:
+                expected = f.read()
+
+            for use_mmap in (True, False):
+                with self.subTest(size=size, use_mmap=use_mmap):
+                    bind_mss_header_to_bin(payload_path, use_mmap=use_mmap)
+                    with open(os.path.join(self.tempdir, f'payload_{size}-bm1-p0.hex'), 'rb') as f:
+                        self.assertEqual(f.read(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
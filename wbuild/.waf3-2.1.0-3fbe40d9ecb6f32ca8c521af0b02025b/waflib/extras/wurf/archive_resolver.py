@@ -0,0 +1,23 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+import hashlib
+class ArchiveResolver(object):
+	def __init__(self,ctx,archive_extractor,resolver,cwd):
+		self.ctx=ctx
+		self.archive_extractor=archive_extractor
+		self.resolver=resolver
+		self.cwd=cwd
+	def resolve(self):
+		path=self.resolver.resolve()
+		assert os.path.isfile(path)
+		extract_hash=hashlib.sha1(path.encode("utf-8")).hexdigest()[:6]
+		extract_folder="extract-"+extract_hash
+		extract_path=os.path.join(self.cwd,extract_folder)
+		if os.path.exists(extract_path)and len(os.listdir(extract_path))!=0:
+			self.ctx.to_log(f"wurf: ArchiveResolver: {extract_path} is not empty. ""Skipping extraction.")
+			return extract_path
+		self.archive_extractor(path=path,to_path=extract_path)
+		return extract_path
@@ -0,0 +1,20 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+from.error import DependencyError
+class CheckLockCacheResolver(object):
+	def __init__(self,resolver,lock_cache_from,dependency):
+		self.resolver=resolver
+		self.lock_cache=lock_cache_from
+		self.dependency=dependency
+	def resolve(self):
+		if self.dependency not in self.lock_cache:
+			raise DependencyError(msg=f"Not found in lock cache: {self.lock_cache}",dependency=self.dependency,)
+		if self.lock_cache.check_sha1(dependency=self.dependency):
+			raise DependencyError(msg=("Locked dependency inconsistent with the ""dependency specified in the project."),dependency=self.dependency,)
+		path=self.resolver.resolve()
+		self.dependency.resolver_info=self.lock_cache.resolver_info(dependency=self.dependency)
+		if self.lock_cache.check_content(dependency=self.dependency,path=path):
+			raise DependencyError(msg=("The content does not match the data ""when the dependency was locked."),dependency=self.dependency,)
+		return path
@@ -0,0 +1,31 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import configparser
+import os
+LOCAL_CONFIG_FILE=os.path.abspath(".wurf_config")
+USER_CONFIG_FILE=os.path.abspath(os.path.expanduser("~/.wurf_config"))
+class ConfigFile(object):
+	def __init__(self,ctx):
+		self.default_resolve_path=None
+		self.ctx=ctx
+		if os.path.isfile(LOCAL_CONFIG_FILE):
+			config_file=LOCAL_CONFIG_FILE
+		elif os.path.isfile(USER_CONFIG_FILE):
+			config_file=USER_CONFIG_FILE
+		else:
+			return
+		log=self.ctx.logger is not None
+		if log:
+			self.ctx.start_msg("Using config file")
+		config=configparser.ConfigParser()
+		try:
+			config.read(config_file)
+		except configparser.Error as e:
+			if log:
+				self.ctx.end_msg("ERROR: "+e.message,color="RED")
+			return
+		if log:
+			self.ctx.end_msg(config_file)
+		self.default_resolve_path=config.get("DEFAULT","resolve_path",fallback=None)
@@ -0,0 +1,48 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+from.lock_path_cache import LockPathCache
+from.lock_version_cache import LockVersionCache
+class Configuration(object):
+	RESOLVE="resolve"
+	LOAD="load"
+	HELP="help"
+	RESOLVE_FROM_PATH_LOCK="resolve_from_path_lock"
+	RESOLVE_FROM_VERSION_LOCK="resolve_from_version_lock"
+	def __init__(self,project_path,args,options,waf_lock_file):
+		self.project_path=project_path
+		self.args=args
+		self.options=options
+		self.waf_lock_file=waf_lock_file
+	def resolver_chain(self):
+		if self.choose_help():
+			return Configuration.HELP
+		elif self.choose_resolve_from_lock(LockPathCache.LOCK_FILE):
+			return Configuration.RESOLVE_FROM_PATH_LOCK
+		elif self.choose_resolve_from_lock(LockVersionCache.LOCK_FILE):
+			return Configuration.RESOLVE_FROM_VERSION_LOCK
+		elif self.choose_resolve():
+			return Configuration.RESOLVE
+		else:
+			return Configuration.LOAD
+	def choose_help(self):
+		if"-h"in self.args or"--help"in self.args:
+			return True
+		if self.choose_resolve():
+			return False
+		waf_lock_path=os.path.join(self.project_path,self.waf_lock_file)
+		if not os.path.isfile(waf_lock_path):
+			return True
+		return False
+	def lock_paths(self):
+		return"configure"in self.args and self.options.lock_paths()
+	def lock_versions(self):
+		return"configure"in self.args and self.options.lock_versions()
+	def choose_resolve_from_lock(self,lock_file):
+		if not self.choose_resolve():
+			return False
+		return os.path.exists(os.path.join(self.project_path,lock_file))
+	def choose_resolve(self):
+		return any([c in self.args for c in["configure","resolve"]])
@@ -0,0 +1,40 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+class ContextMsgResolver(object):
+	def __init__(self,resolver,ctx,dependency):
+		self.resolver=resolver
+		self.ctx=ctx
+		self.dependency=dependency
+	def resolve(self):
+		start_msg=f'{self.dependency.resolver_chain} "{self.dependency.name}"'
+		if self.dependency.resolver_action:
+			start_msg+=f" ({self.dependency.resolver_action})"
+		self.ctx.start_msg(start_msg)
+		path=self.resolver.resolve()
+		if not path:
+			self.ctx.end_msg("Unavailable",color="RED")
+		else:
+			if self.dependency.is_symlink:
+				symlink_path=path
+				symlink_node=self.ctx.root.find_node(str(path))
+				if symlink_node.is_child_of(self.ctx.srcnode):
+					symlink_path=symlink_node.path_from(self.ctx.srcnode)
+				real_path=self.dependency.real_path
+				real_node=self.ctx.root.find_node(str(real_path))
+				if real_node.is_child_of(self.ctx.srcnode):
+					real_path=real_node.path_from(self.ctx.srcnode)
+				detail=f"{symlink_path} => {real_path}"
+			else:
+				detail=path
+			if self.dependency.resolver_info is not None:
+				info=self.dependency.resolver_info
+				if len(info)>10:
+					info=info[:7]+"..."
+				else:
+					info=info.ljust(10)
+				self.ctx.end_msg(f"{info} ({detail})")
+			else:
+				self.ctx.end_msg(f"{detail}")
+		return path
@@ -0,0 +1,86 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+import json
+from.dependency import Dependency
+from.error import WurfError
+from.lock_version_cache import LockVersionCache
+class DependencyManager(object):
+	RESOLVE_FILE="resolve.json"
+	def __init__(self,registry,dependency_cache,ctx,git,options,skip_internal):
+		self.registry=registry
+		self.dependency_cache=dependency_cache
+		self.ctx=ctx
+		self.git=git
+		self.options=options
+		self.skip_internal=skip_internal
+		self.seen_dependencies={}
+		self.post_resolve_actions=[]
+		self.enabled_dependencies=set()
+		self.locked_versions={}
+	def load_dependencies(self,path):
+		resolve_json_path=os.path.join(path,DependencyManager.RESOLVE_FILE)
+		if not os.path.isfile(resolve_json_path):
+			return
+		with open(resolve_json_path,"r")as resolve_file:
+			resolve_json=json.load(resolve_file)
+		resolve_lock_version_path=os.path.join(path,LockVersionCache.LOCK_FILE)
+		if self.ctx.is_toplevel()and os.path.isfile(resolve_lock_version_path):
+			with open(resolve_lock_version_path,"r")as f:
+				self.locked_versions=json.load(f)
+		for dependency in resolve_json:
+			self.add_dependency(dependency_args=dependency)
+	def add_dependency(self,dependency_args):
+		dependency=Dependency(**dependency_args)
+		if self.__skip_dependency(dependency):
+			return
+		locked_version=self.locked_versions.get(dependency.name,None)
+		if locked_version is not None:
+			dependency.locked_version=locked_version
+			dependency.resolver_info=locked_version.get("resolver_info",None)
+		self.seen_dependencies[dependency.name]=dependency
+		self.options.add_dependency(dependency)
+		with self.registry.provide_temporary()as tmp:
+			tmp.provide_value("dependency",dependency)
+			resolver=self.registry.require("dependency_resolver")
+		path=resolver.resolve()
+		if not path:
+			return
+		if dependency.recurse:
+			self.ctx.recurse([str(path)],mandatory=False)
+		self.dependency_cache[dependency.name]={"path":path,"recurse":dependency.recurse,"added_by":self.ctx.path.abspath(),}
+	def __skip_dependency(self,dependency):
+		if dependency.internal:
+			if not self.ctx.is_toplevel():
+				return True
+			if self.skip_internal:
+				return True
+		if dependency.name in self.seen_dependencies:
+			seen_dependency=self.seen_dependencies[dependency.name]
+			current=self.ctx.path.abspath()
+			added_by=self.dependency_cache[dependency.name]["added_by"]
+			if seen_dependency.sha1!=dependency.sha1:
+				raise WurfError(f"Adding {dependency.name} in {current}:\n"f"First added by {added_by}:\n"f"SHA1 mismatch\n"f"As seen in {current}\n:{dependency}\n"f"the previous definition from {added_by} was:\n{seen_dependency}")
+			return True
+		if not self.__is_toggled_on(dependency):
+			return True
+		return False
+	def post_resolve(self):
+		for action in self.post_resolve_actions:
+			action(dependency_manager=self)
+	def add_post_resolve_action(self,action):
+		self.post_resolve_actions.append(action)
+	def __is_toggled_on(self,dependency):
+		if self.options.lock_paths()or self.options.lock_versions():
+			return True
+		if not dependency.optional:
+			return True
+		if dependency.name in self.enabled_dependencies:
+			return True
+		return False
+	def enable_dependency(self,name):
+		if name in self.enabled_dependencies:
+			raise WurfError(f"Dependency already enabled: {name}")
+		self.enabled_dependencies.add(name)
@@ -0,0 +1,36 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+class WurfError(Exception):
+	def __init__(self,*args):
+		super(WurfError,self).__init__(*args)
+	def __str__(self):
+		return"\n".join(map(str,self.args))
+class CmdAndLogError(WurfError):
+	def __init__(self,error):
+		self.error=error
+		msg=str(error)
+		if hasattr(error,"stdout")and len(error.stdout):
+			msg+=f"\nstdout:\n{error.stdout}"
+		if hasattr(error,"stderr")and len(error.stderr):
+			msg+=f"\nstderr:\n{error.stderr}"
+		super(CmdAndLogError,self).__init__(msg)
+class DependencyError(WurfError):
+	def __init__(self,msg,dependency):
+		super(DependencyError,self).__init__(msg,help_message(dependency))
+class TopLevelError(WurfError):
+	def __init__(self,msg,dependency):
+		if isinstance(dependency.error_messages,list)and len(dependency.error_messages):
+			msg+="\n"
+			msg+="\n".join(dependency.error_messages)
+		super(TopLevelError,self).__init__(msg,help_message(dependency))
+def help_message(dependency):
+	text=f'ERROR: the "{dependency.name}" dependency is not available.'
+	if dependency.resolver=="git":
+		if"steinwurf"in dependency.source:
+			text+=("\nPlease check that you have a valid Steinwurf ""license and you can access the repository at: "f"{dependency.source}")
+	return text
+class RelativeSymlinkError(WurfError):
+	def __init__(self,*args):
+		super(RelativeSymlinkError,self).__init__("Relative symlinks are not supported on this platform",*args)
@@ -0,0 +1,112 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+import re
+class Git(object):
+	def __init__(self,git_binary,ctx):
+		self.git_binary=git_binary
+		self.ctx=ctx
+	def version(self):
+		args=[self.git_binary,"version"]
+		output=self.ctx.cmd_and_log(args).strip()
+		int_list=[int(s)for s in re.findall("\\d+",output)]
+		return tuple(int_list)
+	def is_git_repository(self,cwd):
+		git_dir=os.path.join("cwd",".git")
+		if os.path.isdir(git_dir):
+			return True
+		try:
+			args=[self.git_binary,"rev-parse","--git-dir"]
+			self.ctx.cmd_and_log(args,cwd=cwd)
+			return True
+		except Exception:
+			return False
+	def current_commit(self,cwd):
+		args=[self.git_binary,"rev-parse","HEAD"]
+		output=self.ctx.cmd_and_log(args,cwd=cwd).strip()
+		return output
+	def current_tag(self,cwd):
+		args=[self.git_binary,"tag","--points-at",self.current_commit(cwd)]
+		output=self.ctx.cmd_and_log(args,cwd=cwd).strip()
+		if not output:
+			return None
+		else:
+			return output.splitlines()[0]
+	def clone(self,repository,directory,cwd,branch=None,depth=None):
+		args=[self.git_binary,"clone",repository,directory]
+		if depth:
+			args+=["--depth",str(depth)]
+		if branch:
+			args+=["--branch",branch]
+		self.ctx.cmd_and_log(args,cwd=cwd)
+	def pull(self,cwd):
+		args=[self.git_binary,"pull"]
+		self.ctx.cmd_and_log(args,cwd=cwd)
+	def branch(self,cwd):
+		args=[self.git_binary,"branch"]
+		o=self.ctx.cmd_and_log(args,cwd=cwd)
+		branch=o.split("\n")
+		branch=[b for b in branch if b!=""]
+		current=""
+		others=[]
+		for b in branch:
+			if b.startswith("*"):
+				current=b[1:].strip()
+			else:
+				others.append(b)
+		if current=="":
+			self.ctx.fatal("Failed to locate current branch")
+		args=[self.git_binary,"branch","-r"]
+		o=self.ctx.cmd_and_log(args,cwd=cwd)
+		lines=o.split("\n")
+		for line in lines:
+			if line.startswith("origin/HEAD"):
+				continue
+			branch=line.strip().split("/")[-1]
+			if branch not in others and branch!=current:
+				others.append(branch)
+		return current,others
+	def branches(self,cwd):
+		current,branches=self.branch(cwd=cwd)
+		branches.append(current)
+		return branches
+	def current_branch(self,cwd):
+		current,_=self.branch(cwd=cwd)
+		return current
+	def is_detached_head(self,cwd):
+		current,_=self.branch(cwd=cwd)
+		return current.startswith("(")and current.endswith(")")
+	def checkout(self,branch,cwd):
+		args=[self.git_binary,"checkout","--force",branch]
+		self.ctx.cmd_and_log(args,cwd=cwd)
+	def has_submodules(ctx,cwd):
+		return os.path.isfile(os.path.join(cwd,".gitmodules"))
+	def sync_submodules(self,cwd):
+		args=[self.git_binary,"submodule","sync","--recursive"]
+		self.ctx.cmd_and_log(args,cwd=cwd)
+	def update_submodules(self,cwd):
+		args=[self.git_binary,"submodule","update","--recursive","--init"]
+		self.ctx.cmd_and_log(args,cwd=cwd)
+	def pull_submodules(self,cwd):
+		if self.has_submodules(cwd=cwd):
+			self.sync_submodules(cwd=cwd)
+			self.update_submodules(cwd=cwd)
+	def tags(self,cwd):
+		args=[self.git_binary,"tag","-l"]
+		output=self.ctx.cmd_and_log(args,cwd=cwd)
+		tags=output.split("\n")
+		return[t for t in tags if t!=""]
+	def remote_origin_url(self,cwd):
+		args=[self.git_binary,"config","--get","remote.origin.url"]
+		output=self.ctx.cmd_and_log(args,cwd=cwd)
+		return output.strip()
+	def checkout_to_commit_id(self,cwd,checkout):
+		args=[self.git_binary,"rev-list","-1",checkout]
+		output=self.ctx.cmd_and_log(args,cwd=cwd)
+		return output.strip()
+	def default_branch(self,cwd):
+		args=[self.git_binary,"symbolic-ref","refs/remotes/origin/HEAD","--short",]
+		output=self.ctx.cmd_and_log(args,cwd=cwd)
+		return output.strip().split("/")[-1]
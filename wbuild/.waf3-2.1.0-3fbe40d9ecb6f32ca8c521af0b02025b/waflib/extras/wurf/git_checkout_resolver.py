@@ -0,0 +1,62 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+import shutil
+from.directory import copy_directory
+class GitCheckoutResolver(object):
+	@staticmethod
+	def commit_folder_name(commit_id):
+		return"%s"%commit_id[:10]
+	@staticmethod
+	def branch_folder_name(branch):
+		return"branch-%s"%branch
+	def __init__(self,git,resolver,ctx,dependency,checkout,cwd):
+		self.git=git
+		self.resolver=resolver
+		self.ctx=ctx
+		self.dependency=dependency
+		self.checkout=checkout
+		self.cwd=cwd
+	def resolve(self):
+		path=self.resolver.resolve()
+		assert os.path.isdir(path)
+		is_branch=self.checkout in self.git.branches(cwd=path)
+		if is_branch:
+			folder_name=GitCheckoutResolver.branch_folder_name(self.checkout)
+		else:
+			commit_id=self.git.checkout_to_commit_id(cwd=path,checkout=self.checkout,)
+			folder_name=GitCheckoutResolver.commit_folder_name(commit_id)
+		checkout_path=os.path.join(self.cwd,folder_name)
+		self.ctx.to_log(f"wurf: GitCheckoutResolver name {self.dependency.name} -> {checkout_path}")
+		if not os.path.isdir(checkout_path):
+			try:
+				copy_directory(path=path,to_path=checkout_path)
+				self.git.checkout(branch=self.checkout,cwd=checkout_path)
+			except Exception:
+				def onerror(func,path,exc_info):
+					import stat
+					if not os.access(path,os.W_OK):
+						os.chmod(path,stat.S_IWUSR)
+						func(path)
+					else:
+						raise
+				shutil.rmtree(checkout_path,onerror=onerror)
+				raise
+		elif not self.git.is_detached_head(cwd=checkout_path):
+			self.git.pull(cwd=checkout_path)
+		if self.dependency.pull_submodules:
+			self.git.pull_submodules(cwd=checkout_path)
+		self.dependency.commit_id=self.git.current_commit(cwd=checkout_path)
+		if is_branch:
+			self.dependency.resolver_info=self.checkout
+			return checkout_path
+		current_tag=self.git.current_tag(cwd=checkout_path)
+		if current_tag is not None:
+			self.dependency.resolver_info=current_tag
+		else:
+			self.dependency.resolver_info=self.dependency.commit_id[:10]
+		return checkout_path
+	def __repr__(self):
+		return"%s(%r)"%(self.__class__.__name__,self.__dict__)
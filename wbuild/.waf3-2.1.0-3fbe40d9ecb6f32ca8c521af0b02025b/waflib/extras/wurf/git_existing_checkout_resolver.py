@@ -0,0 +1,42 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+from.git_resolver import GitResolver
+from.git_checkout_resolver import GitCheckoutResolver
+class GitExistingCheckoutResolver(object):
+	def __init__(self,ctx,git,dependency,resolver,checkout,cwd):
+		self.ctx=ctx
+		self.git=git
+		self.dependency=dependency
+		self.resolver=resolver
+		self.checkout=checkout
+		self.cwd=cwd
+	def resolve(self):
+		path=self.__resolve_path()
+		if path:
+			return path
+		return self.resolver.resolve()
+	def __resolve_path(self):
+		default_branch_cwd=os.path.join(self.cwd,GitResolver.DEFAULT_BRANCH)
+		if not os.path.isdir(default_branch_cwd):
+			return None
+		checkout_path=os.path.join(self.cwd,GitCheckoutResolver.branch_folder_name(self.checkout))
+		if os.path.isdir(checkout_path):
+			self.git.pull(cwd=checkout_path)
+			self.dependency.resolver_info=self.checkout
+			return checkout_path
+		try:
+			commit_id=self.git.checkout_to_commit_id(cwd=default_branch_cwd,checkout=self.checkout)
+		except Exception as e:
+			self.ctx.to_log(f"resolve: GitExistingCheckoutResolver {self.dependency.name} "f"failed to resolve {self.checkout} to commit id: {e}")
+			return None
+		checkout_path=os.path.join(self.cwd,GitCheckoutResolver.commit_folder_name(commit_id))
+		if os.path.isdir(checkout_path):
+			self.dependency.resolver_info=self.checkout
+			return checkout_path
+		self.ctx.to_log(f"resolve: GitExistingCheckoutResolver {self.dependency.name} "f"no stored checkout for {self.checkout}")
+		return None
+	def __repr__(self):
+		return"%s(%r)"%(self.__class__.__name__,self.__dict__)
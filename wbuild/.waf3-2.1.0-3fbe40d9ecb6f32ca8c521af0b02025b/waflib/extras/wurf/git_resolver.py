@@ -0,0 +1,48 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+from.symlink import create_symlink
+from.error import RelativeSymlinkError
+from.git_checkout_resolver import GitCheckoutResolver
+class GitResolver(object):
+	DEFAULT_BRANCH="default"
+	def __init__(self,git,ctx,dependency,git_url_rewriter,cwd):
+		self.git=git
+		self.ctx=ctx
+		self.dependency=dependency
+		self.git_url_rewriter=git_url_rewriter
+		self.cwd=cwd
+	def resolve(self):
+		repo_url=self.git_url_rewriter.rewrite_url(self.dependency.source)
+		default_repo_path=os.path.join(self.cwd,self.DEFAULT_BRANCH)
+		if not os.path.isdir(default_repo_path):
+			self.git.clone(repository=repo_url,directory=default_repo_path,cwd=self.cwd,)
+			self.__create_symlink_to_default_branch(default_repo_path)
+		else:
+			try:
+				self.git.pull(cwd=default_repo_path)
+			except Exception as e:
+				self.ctx.to_log("Exception when executing git pull:")
+				self.ctx.to_log(e)
+		if self.dependency.pull_submodules:
+			self.git.pull_submodules(cwd=default_repo_path)
+		return default_repo_path
+	def __create_symlink_to_default_branch(self,default_repo_path):
+		default_branch=self.git.default_branch(cwd=default_repo_path)
+		link_path=os.path.join(self.cwd,GitCheckoutResolver.branch_folder_name(default_branch))
+		self.ctx.to_log(f"wurf: GitResolver Create symlink {link_path} -> {default_repo_path}")
+		try:
+			try:
+				create_symlink(from_path=default_repo_path,to_path=link_path,overwrite=True,relative=True,)
+			except RelativeSymlinkError:
+				self.ctx.to_log("wurf: Using relative symlink failed - fallback to absolute.")
+				create_symlink(from_path=default_repo_path,to_path=link_path,overwrite=True,relative=False,)
+		except Exception as ex:
+			msg=f"Symlink creation for {self.dependency.name}'s default branch\n"
+			if hasattr(ex,"output"):
+				msg+=str(ex.output)
+			self.ctx.logger.debug(msg,exc_info=True)
+	def __repr__(self):
+		return"%s(%r)"%(self.__class__.__name__,self.__dict__)
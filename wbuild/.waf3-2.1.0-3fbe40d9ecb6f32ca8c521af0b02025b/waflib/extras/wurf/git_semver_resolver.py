@@ -0,0 +1,36 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+from.error import DependencyError
+from.directory import copy_directory
+from.git_checkout_resolver import GitCheckoutResolver
+class GitSemverResolver(object):
+	def __init__(self,git,resolver,ctx,semver_selector,dependency,cwd):
+		self.git=git
+		self.git_resolver=resolver
+		self.ctx=ctx
+		self.semver_selector=semver_selector
+		self.dependency=dependency
+		self.cwd=cwd
+	def resolve(self):
+		path=self.git_resolver.resolve()
+		assert os.path.isdir(path)
+		tags=self.git.tags(cwd=path)
+		tag=self.semver_selector.select_tag(major=self.dependency.major,tags=tags)
+		if not tag:
+			raise DependencyError(msg=(f"No tag found for major version {self.dependency.major}, "f"candidates were {tags}"),dependency=self.dependency,)
+		commit_id=self.git.checkout_to_commit_id(cwd=path,checkout=tag)
+		self.dependency.resolver_info=tag
+		folder_name=GitCheckoutResolver.commit_folder_name(commit_id)
+		tag_path=os.path.join(self.cwd,folder_name)
+		self.ctx.to_log(f"wurf: GitSemverResolver name {self.dependency.name} -> {tag_path}")
+		if not os.path.isdir(tag_path):
+			copy_directory(path=path,to_path=tag_path)
+			self.git.checkout(branch=tag,cwd=tag_path)
+			if self.dependency.pull_submodules:
+				self.git.pull_submodules(cwd=tag_path)
+		return tag_path
+	def __repr__(self):
+		return"%s(%r)"%(self.__class__.__name__,self.__dict__)
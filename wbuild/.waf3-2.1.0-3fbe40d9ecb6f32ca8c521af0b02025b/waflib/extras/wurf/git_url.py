@@ -0,0 +1,6 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import collections
+GitUrl=collections.namedtuple("GitUrl","protocol host path")
@@ -0,0 +1,20 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+from.error import DependencyError
+class PathResolver(object):
+	def __init__(self,dependency,path):
+		self.dependency=dependency
+		self.path=path
+	def resolve(self):
+		self.path=os.path.abspath(os.path.expanduser(self.path))
+		if self.dependency.resolver=="http":
+			if not os.path.exists(self.path):
+				raise DependencyError(f'Path error: "{self.path}" does not exist.',dependency=self.dependency,)
+		else:
+			if not os.path.isdir(self.path):
+				raise DependencyError(f'Path error: "{self.path}" is not a directory.',dependency=self.dependency,)
+		self.dependency.resolver_info="path"
+		return self.path
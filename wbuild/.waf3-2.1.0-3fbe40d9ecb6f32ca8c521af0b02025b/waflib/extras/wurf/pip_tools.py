@@ -0,0 +1,25 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+import hashlib
+def compile(ctx,requirements_in,requirements_txt):
+	if not os.path.isfile(requirements_in):
+		ctx.fatal(f"Checking if {requirements_txt} is up to date. However,"f" {requirements_in} does not exist")
+	sha1=hashlib.sha1((open(requirements_in,"r").read()).encode("utf-8")).hexdigest()[:6]
+	signature_in=f"# Added by: github.com/steinwurf/waf pip-compile {sha1}\n"
+	if os.path.isfile(requirements_txt):
+		with open(requirements_txt,"r")as f:
+			signature_txt=f.readline()
+			if signature_in==signature_txt:
+				return
+		os.remove(requirements_txt)
+	with ctx.create_virtualenv()as venv:
+		venv.run("python -m pip install pip-tools")
+		venv.run(f"pip-compile {requirements_in} --output-file {requirements_txt}")
+	with open(requirements_txt,"r+")as f:
+		lines=f.readlines()
+		lines.insert(0,signature_in)
+		f.seek(0)
+		f.writelines(lines)
@@ -0,0 +1,28 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+from.error import WurfError
+from.lock_path_cache import LockPathCache
+class StoreLockPathResolver(object):
+	def __init__(self,resolver,lock_cache_to:LockPathCache,project_path,dependency):
+		self.resolver=resolver
+		self.lock_cache_to:LockPathCache=lock_cache_to
+		self.project_path=project_path
+		self.dependency=dependency
+	def resolve(self):
+		path=self.resolver.resolve()
+		self.__check_path(path=path)
+		if self.dependency.is_symlink:
+			lock_path=self.dependency.real_path
+		else:
+			lock_path=path
+		lock_path=os.path.relpath(path=lock_path,start=self.project_path)
+		self.lock_cache_to.add_path(dependency=self.dependency,path=lock_path)
+		return path
+	def __check_path(self,path):
+		child=os.path.realpath(path)
+		parent=os.path.realpath(self.project_path)
+		if not child.startswith(parent):
+			raise WurfError(f"Locked paths must be a within parent project {parent} {child}")
@@ -0,0 +1,14 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+from.lock_version_cache import LockVersionCache
+class StoreLockVersionResolver(object):
+	def __init__(self,resolver,lock_cache_to:LockVersionCache,dependency):
+		self.resolver=resolver
+		self.lock_cache_to=lock_cache_to
+		self.dependency=dependency
+	def resolve(self):
+		path=self.resolver.resolve()
+		self.lock_cache_to.add_dependency(dependency=self.dependency)
+		return path
@@ -0,0 +1,18 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+import sys
+def create_symlink(from_path,to_path,overwrite=False,relative=False):
+	if overwrite and os.path.lexists(path=to_path):
+		_remove_symlink(path=to_path)
+	if relative:
+		parent_dir=os.path.dirname(to_path)
+		from_path=os.path.relpath(from_path,start=parent_dir)
+	os.symlink(src=from_path,dst=to_path,target_is_directory=os.path.isdir(from_path))
+def _remove_symlink(path):
+	if sys.platform=="win32"and os.path.isdir(path):
+		os.rmdir(path)
+	else:
+		os.unlink(path)
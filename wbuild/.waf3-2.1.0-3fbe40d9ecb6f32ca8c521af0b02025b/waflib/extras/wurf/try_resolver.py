@@ -0,0 +1,30 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+from.error import WurfError
+class TryResolver(object):
+	def __init__(self,resolver,ctx,dependency):
+		assert resolver is not None
+		self.resolver=resolver
+		self.ctx=ctx
+		self.dependency=dependency
+	def resolve(self):
+		try:
+			path=self.resolver.resolve()
+		except WurfError as e:
+			self.ctx.logger.debug(f"Resolve failed in {self.resolver}:",exc_info=True)
+			self.ctx.logger.debug(self.dependency)
+			error_message=e.args[0]
+			if not error_message.endswith("\n"):
+				error_message+="\n"
+			self.dependency.error_messages.append(error_message)
+			return None
+		except Exception:
+			raise
+		if path:
+			assert os.path.isdir(path)or os.path.isfile(path)
+		else:
+			self.ctx.logger.debug(f"No path returned by {self.resolver}")
+		return path
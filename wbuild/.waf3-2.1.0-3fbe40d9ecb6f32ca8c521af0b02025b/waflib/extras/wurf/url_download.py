@@ -0,0 +1,29 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import os
+import shutil
+from urllib.parse import urlparse
+from urllib.request import urlopen,Request
+from.error import WurfError
+class UrlDownload(object):
+	def download(self,source,cwd,filename=None):
+		assert os.path.exists(cwd)
+		if not filename:
+			parsed_url=urlparse(source)
+			basename=os.path.basename(parsed_url.path)
+			_,extension=os.path.splitext(basename)
+			if extension:
+				filename=basename
+		try:
+			response=urlopen(Request(source,headers={"User-Agent":"Mozilla"}))
+		except Exception as e:
+			raise WurfError(f"Failed to download: {source}\n{str(e)}")from e
+		if not filename:
+			filename=response.info().get_filename()
+		assert filename
+		path=os.path.join(cwd,filename)
+		with open(path,"wb")as out_file:
+			shutil.copyfileobj(response,out_file)
+		return path
@@ -0,0 +1,63 @@
+#! /usr/bin/env python
+# encoding: utf-8
+# WARNING! Do not edit! https://waf.io/book/index.html#_obtaining_the_waf_file
+
+import sys
+from waflib.Configure import conf
+from waflib.Errors import WafError
+from waflib import Logs
+from waflib import Context
+from waflib import Scripting
+from.import waf_resolve_context
+from.import virtualenv
+from.import rewrite
+from.import pip_tools
+def extend_context(f):
+	setattr(Context.Context,f.__name__,f)
+	return f
+@conf
+def dependency_path(ctx,name):
+	return waf_resolve_context.dependency_cache[name]["path"]
+@conf
+def dependency_node(ctx,name):
+	return ctx.root.find_node(str(ctx.dependency_path(name)))
+@conf
+def has_dependency_path(ctx,name):
+	return name in waf_resolve_context.dependency_cache
+@conf
+def is_toplevel(self):
+	return self.srcnode==self.path
+@conf
+def recurse_dependencies(ctx):
+	try:
+		logfile=ctx.logger.handlers[0].baseFilename
+	except Exception:
+		logfile=None
+	for name,dependency in waf_resolve_context.dependency_cache.items():
+		if not dependency["recurse"]:
+			Logs.debug(f"resolve: Skipped recurse {name} cmd={ctx.cmd}")
+			continue
+		path=dependency["path"]
+		Logs.debug(f"resolve: recurse {name} cmd={ctx.cmd}, path={path}")
+		try:
+			ctx.recurse([str(path)],once=False,mandatory=False)
+		except WafError as e:
+			msg=f'Recurse "{name}" for "{ctx.cmd}" failed with: {e.msg}'
+			if logfile:
+				msg=f"{msg}\n(complete log in {logfile})"
+			else:
+				msg=f"{msg}\n(run with -v for more information)"
+			raise WafError(msg=msg,ex=e)
+@extend_context
+def create_virtualenv(ctx,cwd=None,env=None,name=None,overwrite=True,system_site_packages=False):
+	return virtualenv.VirtualEnv.create(ctx=ctx,log=Logs,cwd=cwd,env=env,name=name,overwrite=overwrite,system_site_packages=system_site_packages,)
+@extend_context
+def pip_compile(ctx,requirements_in,requirements_txt):
+	pip_tools.compile(ctx,requirements_in,requirements_txt)
+@extend_context
+def ensure_build(ctx):
+	if"build"not in sys.argv:
+		Scripting.run_command("build")
+@extend_context
+def rewrite_file(ctx,filename):
+	return rewrite.rewrite_file(filename=filename)
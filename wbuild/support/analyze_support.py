@@ -0,0 +1,95 @@
+# !/usr/bin/env python
+# pylint: disable=too-many-statements, unused-argument, invalid-name, missing-class-docstring, too-few-public-methods
+# -*- coding: utf-8 -*-
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+
+import collections
+import json
+import os
+
+from waflib.Build import BuildContext
+from waflib import Logs
+
+
+# Tasks generating the sources or the headers analyzed: unity sources, fpga_design_config
+# headers and precompiled headers
+GENERATOR_TASKS = ('unity', 'fpga_design_config', 'pch')
+
+
+def _is_analysis_task(task) -> bool:
+    # The analysis tasks, and the tasks they depend on, which produce sources or headers
+    return (task.__class__.__name__ in ('analyze',) + GENERATOR_TASKS
+            or bool({'.c', '.h'} & set(getattr(task, 'ext_out', []))))
+
+
+class AnalyzeContext(BuildContext):
+    '''runs the GCC static analyzer on the C sources'''
+    cmd = 'analyze'
+
+    def get_tasks_group(self, idx):
+        # Only the analysis tasks and the tasks generating sources or headers are run: sources
+        # are not compiled, nor the application linked
+        return [task for task in super().get_tasks_group(idx) if _is_analysis_task(task)]
+
+
+def _iter_findings(ctx, diagnostics):
+    # Flatten the GCC JSON diagnostics of a translation unit into findings. GCC reports paths
+    # relative to the variant directory it runs from, they are made relative to the project.
+    for diagnostic in diagnostics:
+        caret = (diagnostic.get('locations') or [{}])[0].get('caret', {})
+        path = os.path.join(ctx.variant_dir, caret.get('file', ''))
+        yield {
+            'file': os.path.relpath(path, ctx.path.abspath()),
+            'line': caret.get('line', 0),
+            'column': caret.get('column', 0),
+            'kind': diagnostic.get('kind', ''),
+            'option': diagnostic.get('option', ''),
+            'message': diagnostic.get('message', ''),
+        }
+
+
+def write_analysis_report(ctx) -> None:
+    # The write_analysis_report function gathers the findings of the GCC static analyzer,
+    # stored by the analysis task of each translation unit, into
+    # build/<variant>/<name>_analysis.json, and prints them.
+    # The analysis of a translation unit is only run again when the translation unit, the
+    # headers it includes or the flags change, so the report of a build where nothing
+    # changed is produced from the stored findings.
+    # The report is shaped as follows:
+    #
+    #     {
+    #         'findings': [
+    #             {'file': 'src/main.c', 'line': 42, 'column': 5, 'kind': 'warning',
+    #              'option': '-Wanalyzer-null-dereference', 'message': '...'},
+    #             ...
+    #         ],
+    #         'counts': {'-Wanalyzer-null-dereference': 1, ...},
+    #     }
+    #
+    # Example usage:
+    #
+    #     # Post built tasks
+    #     ctx.add_post_fun(write_analysis_report)
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    findings = []
+    for tgen in ctx.get_all_task_gen():
+        for task in getattr(tgen, 'tasks', []):
+            if task.__class__.__name__ != 'analyze' or not task.outputs[0].exists():
+                continue
+            findings.extend(_iter_findings(ctx, json.loads(task.outputs[0].read('rb') or b'[]')))
+
+    findings.sort(key=lambda finding: (finding['file'], finding['line'], finding['column']))
+    counts = collections.Counter(finding['option'] or finding['kind'] for finding in findings)
+
+    report_path = os.path.join(ctx.variant_dir, f'{ctx.env.name}_analysis.json')
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump({'findings': findings, 'counts': dict(counts)}, f, indent=2)
+
+    for finding in findings:
+        Logs.pprint('YELLOW', f'{finding["file"]}:{finding["line"]}:{finding["column"]}: '
+                              f'{finding["kind"]}: {finding["message"]} [{finding["option"]}]')
+    Logs.pprint('CYAN' if not findings else 'RED',
+                f'Static analysis: {len(findings)} findings, report stored in {report_path}')
@@ -4,11 +4,19 @@
 # -*- coding: utf-8 -*-
 # Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
 
-import yaml
 import os
 import shutil
 
-from wbuild.support.common_support import post_build_stats, prepend_mss_header
+from wbuild.support.analyze_support import AnalyzeContext, write_analysis_report
+from wbuild.support.common_support import post_build_stats
+from wbuild.support.compile_cache_support import compile_cache_post_build
+from wbuild.support.config_cache_support import cached_config, load_yaml
+from wbuild.support.design_config_support import get_design_config
+from wbuild.support.linker_support import write_linker_script
+from wbuild.support.size_support import print_lto_savings
+
+# Default number of C files included by each unity source
+UNITY_BATCH_SIZE = 8
 
 
 def _parse_linker_options(ctx, project, project_keys) -> None:
@@ -36,12 +44,27 @@ def _parse_linker_options(ctx, project, project_keys) -> None:
     else:
         ctx.fatal('Please declare at least the linker script in the linker field.')
 
+    # The boot mode is chosen at configure time, as it also sets the defines of every source:
+    # a build asked for another boot mode would silently produce the configured one
+    boot_mode = ctx.env.BOOT_MODE or 'xip'
+    if ctx.options.boot_mode and ctx.options.boot_mode != boot_mode:
+        ctx.fatal(f'The application is configured for the {boot_mode} boot mode, run '
+                  f'waf configure --boot-mode={ctx.options.boot_mode} to build it for {ctx.options.boot_mode}.')
+
+    # In the copy-to-lim boot mode, the application is linked to run from LIM
+    if ctx.env.BOOT_MODE == 'copy-to-lim':
+        ld_script = linker_keys.get('copy_to_lim_script')
+        if ld_script:
+            ctx.env.ld_script = ld_script
+        else:
+            ctx.fatal('Please declare the copy_to_lim_script in the linker field to use the copy-to-lim boot mode.')
+
     link_order = linker_keys.get('order')
     if link_order:
         ctx.env.LIBS = tuple(link_order)
 
 
-def _add_linker_options(ctx) -> None:
+def _add_linker_options(ctx, project) -> None:
     # The add_linker_options add all the relevant linkflags to the ctx.env.LINKFLAGS
     # global variable.
     # In particular, it also let you select the desired linker script according to the
@@ -52,6 +75,7 @@ def _add_linker_options(ctx) -> None:
     #
     # Args:
     #     :param ctx: The WAF context
+    #     :param project: Handle to project.yml
     #
 
     # Initial population of target arch
@@ -66,12 +90,28 @@ def _add_linker_options(ctx) -> None:
     # Always generate MAP file and perform dead code elimination
     link_flags.extend([f'-Wl,-Map={ctx.env.name}.map', '-Wl,--gc-sections'])
 
+    # With link time optimization, code is generated by the linker, which needs the same
+    # optimization flags the sources were compiled with
+    if ctx.env.LTO_FLAGS and set(ctx.env.LTO_FLAGS).issubset(ctx.env.CFLAGS):
+        link_flags.extend(ctx.env.LTO_FLAGS)
+        link_flags.extend(flag for flag in ctx.env.CFLAGS if flag.startswith('-O'))
+
     # Append linker script path to LDFLAGS if not using default one
     if ctx.env.ld_script:
-        link_flags.extend([
-            f'-L{os.path.join(ctx.path.bldpath(), "confs", "linker")}',
-            f'-T{ctx.env.ld_script}.ld'
-        ])
+        script_path = os.path.join(ctx.path.abspath(), 'confs', 'linker', f'{ctx.env.ld_script}.ld')
+        script_dirs = [os.path.join(ctx.path.bldpath(), 'confs', 'linker')]
+
+        # With a fpga_design entry in project.yml, the memory regions of the linker script are
+        # set from the design configuration, and the generated linker script is found first
+        design = get_design_config(ctx, project)
+        if design:
+            script_path = write_linker_script(ctx, design, os.path.join('confs', 'linker'), ctx.env.ld_script)
+            script_dirs.insert(0, ctx.root.find_node(script_path).parent.bldpath())
+
+        link_flags.extend([f'-L{script_dir}' for script_dir in script_dirs] + [f'-T{ctx.env.ld_script}.ld'])
+
+        # The application is linked again whenever the linker script changes
+        ctx.env.LINKER_SCRIPT = script_path
 
     if ctx.env.platform == 'baremetal':
         link_flags.extend(['-nostartfiles', '--specs=nano.specs'])
@@ -97,12 +137,20 @@ def parse_and_add_linker_options(ctx, project, project_keys) -> None:
     # and sets the libraries linking order if requested.
     # If you are enforcing linking order, remember to add the lib=ctx.env.LIBS variable to
     # your application ctx.program.
-    # The function then configures the linker script to be used.
+    # The function then configures the linker script to be used. If project.yml has a
+    # fpga_design entry, the MEMORY block of the linker script is generated from the design
+    # configuration, sizing the LIM from the L2 cache ways not enabled for the cache, and the
+    # build is stopped if any memory regions overlap (see write_linker_script).
+    # If the application has been configured with the --boot-mode=copy-to-lim option, the
+    # copy_to_lim_script linker script is used instead, which links the code in LIM and loads
+    # it in eNVM, for the startup code to copy it to LIM before running it. Building with a
+    # --boot-mode other than the configured one fails.
     #
     # Example snippet of project.yml:
     #
     #     linker:
     #       script: lim
+    #       copy_to_lim_script: envm-lim
     #       order:
     #         - goofy
     #         - daisy
@@ -114,7 +162,7 @@ def parse_and_add_linker_options(ctx, project, project_keys) -> None:
     #     :param project_keys: List of keys present in project.yml
 
     _parse_linker_options(ctx, project, project_keys)
-    _add_linker_options(ctx)
+    _add_linker_options(ctx, project)
 
 
 def _file_existance_check(ctx, sources_list) -> None:
@@ -130,6 +178,83 @@ def _file_existance_check(ctx, sources_list) -> None:
             ctx.fatal(f'Source file {file} does not exist')
 
 
+class _EnvRecorder:
+    # Records the values appended to the environment while resolving the sources.yml tree,
+    # so that they can be cached and appended again to ctx.env by later builds.
+
+    def __init__(self):
+        self.operations = []
+
+    def append_unique(self, var, value):
+        self.operations.append(('append_unique', var, value))
+
+    def append_value(self, var, value):
+        self.operations.append(('append_value', var, value))
+
+
+def _add_unity_batches(ctx, env, path, srcs, name) -> None:
+    # Split the C files of a module into the unity batches described by its sources.yml,
+    # and append them to UNITY_BATCHES (or UNITY_BATCHES_<name> for a library).
+
+    unity = srcs['unity'] or {}
+    batch_size = int(unity.get('batch_size', UNITY_BATCH_SIZE))
+    excluded = {os.path.normpath(file) for file in unity.get('exclude', [])}
+    module_path = os.path.relpath(path, ctx.path.get_src().relpath())
+    files = [os.path.normpath(os.path.join(module_path, file)) for file in srcs['files']
+             if file.endswith('.c') and os.path.normpath(file) not in excluded]
+
+    unity_var = f'UNITY_BATCHES_{name}' if name else 'UNITY_BATCHES'
+    for index in range(0, len(files), batch_size):
+        env.append_value(unity_var, [files[index:index + batch_size]])
+
+
+def _resolve_project_sources(ctx, env, path, name, watched_paths) -> None:
+    # Parse the sources.yml tree rooted in path, appending its content to env, and the
+    # paths it depends on to watched_paths. See parse_project_sources.
+
+    if not os.path.exists(os.path.join(path, 'sources.yml')):
+        ctx.fatal(f'{path} does not contain any sources.yml')
+
+    watched_paths.append(os.path.join(path, 'sources.yml'))
+    srcs = load_yaml(os.path.join(path, 'sources.yml'))
+    for key, value in srcs.items():
+        if key == 'includes':
+            includes_var = f'INCLUDES_{name}' if name else 'INCLUDES'
+            env.append_unique(includes_var, value)
+        elif key == 'files':
+            # In here we are building the full source file path relative to the directory
+            # were the top level wscript has been called. This is needed for the file
+            # existance check, which check that all the source files are effectively
+            # present in the file system
+            full_file_paths = [os.path.normpath(os.path.join(path, file))
+                                for file in srcs['files']]
+            _file_existance_check(ctx, full_file_paths)
+            # Removing a source file changes the modification time of its directory, which
+            # invalidates the cached sources
+            watched_paths.extend(os.path.dirname(file) or '.' for file in full_file_paths)
+            # In here we need to remove from the path the portion of path which is
+            # relative to the directory containing the top level wscript. This is
+            # needed when we inline libraries into the build of an application
+            rel_file_paths = [os.path.normpath(
+                os.path.join(os.path.relpath(path, ctx.path.get_src().relpath()), file))
+                                for file in srcs['files']]
+            sources_var = f'SOURCES_{name}' if name else 'SOURCES'
+            env.append_unique(sources_var, rel_file_paths)
+        elif key == 'pch':
+            pch_var = f'PCH_{name}' if name else 'PCH'
+            env.append_unique(pch_var, value)
+        elif key == 'modules':
+            app_modules = value
+            for module in app_modules:
+                if os.path.exists(os.path.join(path, module)):
+                    _resolve_project_sources(ctx, env, os.path.join(path, module), name, watched_paths)
+                else:
+                    ctx.fatal(f'{os.path.join(path, module)} does not contain any sources.yml')
+
+    if srcs.get('unity') is not None and srcs.get('files'):
+        _add_unity_batches(ctx, env, path, srcs, name)
+
+
 def parse_project_sources(ctx, path, name) -> None:
     # The parse_project_sources function appends the list of source files and the
     # include paths found in the provided sources.yml.
@@ -151,44 +276,47 @@ def parse_project_sources(ctx, path, name) -> None:
     #
     # where LIBNAME = libpippo
     #
+    # The sources of a module can be built as unity sources, each including a batch of
+    # unity/batch_size C files of the module (UNITY_BATCH_SIZE if not given), so that the
+    # headers they share are parsed once per batch. Files which cannot share a translation
+    # unit with others (e.g. because of clashing static symbols or macros) are listed in
+    # unity/exclude, and are compiled on their own, as assembler sources are.
+    #
+    # Example snippet of sources.yml:
+    #
+    #     unity:
+    #       batch_size: 8
+    #       exclude:
+    #         - 'src/mss_clint.c'
+    #
+    # The headers listed in pch, as they are included by the sources, are precompiled for
+    # the module, or for the library it belongs to (see the pch feature of the c tool).
+    #
+    # Example snippet of sources.yml:
+    #
+    #     pch:
+    #       - 'fpga_design_config/fpga_design_config.h'
+    #
+    # The resolved tree is cached in the build directory (see cached_config), keyed on the
+    # modification time and size of every sources.yml and of every directory holding the
+    # listed sources, so builds where none of them changed neither parse any sources.yml
+    # nor check the existence of the sources.
+    #
     # Args:
     #     :param ctx: The WAF context
     #     :param path: Path to sources.yml
     #     :param name: Optional argument, name. To be set to None in case of the caller is an app,
     #                  otherwise to libname in case the caller is a library.
 
-    if not os.path.exists(os.path.join(path, 'sources.yml')):
-        ctx.fatal(f'{path} does not contain any sources.yml')
+    def _resolve():
+        env = _EnvRecorder()
+        watched_paths = []
+        _resolve_project_sources(ctx, env, path, name, watched_paths)
+        return env.operations, watched_paths
 
-    with open(os.path.join(path, 'sources.yml'), encoding='utf-8') as f:
-        srcs=yaml.safe_load(f)
-        for key, value in srcs.items():
-            if key == 'includes':
-                includes_var = f'INCLUDES_{name}' if name else 'INCLUDES'
-                ctx.env.append_unique(includes_var, value)
-            elif key == 'files':
-                # In here we are building the full source file path relative to the directory
-                # were the top level wscript has been called. This is needed for the file
-                # existance check, which check that all the source files are effectively
-                # present in the file system
-                full_file_paths = [os.path.normpath(os.path.join(path, file))
-                                    for file in srcs['files']]
-                _file_existance_check(ctx, full_file_paths)
-                # In here we need to remove from the path the portion of path which is
-                # relative to the directory containing the top level wscript. This is
-                # needed when we inline libraries into the build of an application
-                rel_file_paths = [os.path.normpath(
-                    os.path.join(os.path.relpath(path, ctx.path.get_src().relpath()), file))
-                                    for file in srcs['files']]
-                sources_var = f'SOURCES_{name}' if name else 'SOURCES'
-                ctx.env.append_unique(sources_var, rel_file_paths)
-            elif key == 'modules':
-                app_modules = value
-                for module in app_modules:
-                    if os.path.exists(os.path.join(path, module)):
-                        parse_project_sources(ctx, os.path.join(path, module), name)
-                    else:
-                        ctx.fatal(f'{os.path.join(path, module)} does not contain any sources.yml')
+    operations = cached_config(ctx, ('sources', os.path.abspath(path), name), _resolve)
+    for method, var, value in operations:
+        getattr(ctx.env, method)(var, value)
 
 
 def _add_inline_libs_to_build(ctx, project, project_keys) -> None:
@@ -280,21 +408,79 @@ def build_application(ctx, project, project_keys, features, appname) -> None:
     #     :param project: Handle to project.yml
     #     :param project_keys: List of keys present in project.yml
     #     :param features: features the build should support
+    #
+    # In case the application is a bootloader, the mss_header feature is added to the
+    # supplied ones, so that the bootmode 1 payload is generated by a dedicated task, which
+    # is only run when the application binary changes. The mss_header feature requires the
+    # bin feature.
+    #
+    # If the --compile-cache option is given, object files are looked up in the compile
+    # cache before invoking the compiler, and the cache statistics are printed after the build.
+    # When called by the analyze_<variant> commands, the GCC static analyzer is run on each
+    # C source instead, and its findings are stored in build/<variant>/<name>_analysis.json.
+    # The headers listed in the pch entry of project.yml or sources.yml are precompiled once per
+    # variant, and used by every source including them first.
+    # The modules whose sources.yml has a unity entry are built as unity sources, unless the
+    # --no-unity option is given (see parse_project_sources).
+    # If the --header-deps=compiler option is given, the dependencies of each source on headers
+    # are read from the depfiles written by the compiler, instead of being scanned by waf.
+    # If project.yml has a fpga_design entry, the fpga_design_config headers are generated
+    # again from the XML exported by the MSS Configurator before any source is compiled,
+    # whenever the XML changes.
 
     def _add_app_post_build_tasks():
         # Adds the necessary post-build tasks based on the environment
         # and options.
+        if isinstance(ctx, AnalyzeContext):
+            ctx.add_post_fun(write_analysis_report)
+            return
         ctx.add_post_fun(_clangdb_ide_support)
         ctx.add_post_fun(post_build_stats)
-
-        if ctx.env.platform in ('baremetal', 'rtems'):
-            if ctx.env.is_bootloader == 'true':
-                ctx.add_post_fun(prepend_mss_header)
+        if ctx.variant == 'release_lto':
+            ctx.add_post_fun(print_lto_savings)
 
     if 'libraries' in project_keys:
         # Add waf built libraries
         _add_inline_libs_to_build(ctx, project, project_keys)
 
+    if ctx.env.platform in ('baremetal', 'rtems') and ctx.env.is_bootloader == 'true':
+        features = f'{features} mss_header'
+        # The intel hex payload is generated by the builtin encoder, unless objcopy is
+        # requested trough the --objcopy-hex option
+        ctx.env.MSS_HEADER_OBJCOPY = ctx.env.OBJCOPY if ctx.options.objcopy_hex else []
+
+    # Headers included by each source are either found by the waf preprocessor scan, or read
+    # from the depfiles written by the compiler
+    ctx.env.HEADER_DEPS = ctx.options.header_deps
+    ctx.env.CC_DEPS_F = ['-MMD'] if ctx.options.header_deps == 'compiler' else []
+
+    fpga_design = {}
+    if 'fpga_design' in project_keys:
+        # The fpga_design_config headers are generated again whenever the XML changes
+        fpga_design = project['fpga_design']
+        features = f'{features} fpga_design_config'
+
+    if 'pch' in project_keys:
+        ctx.env.append_unique('PCH', project['pch'])
+
+    if ctx.env.PCH:
+        # The headers listed in the pch entry of project.yml or sources.yml are precompiled
+        features = f'{features} pch'
+
+    if ctx.env.UNITY_BATCHES and not ctx.options.no_unity:
+        # Modules asking for it are built as unity sources
+        features = f'{features} unity'
+
+    if isinstance(ctx, AnalyzeContext):
+        # The analyze_<variant> commands only run the static analyzer on each C source
+        features = f'{features} analyze'
+
+    if ctx.options.compile_cache:
+        # Object files are looked up in the compile cache before invoking the compiler
+        ctx.env.COMPILE_CACHE_DIR = os.path.abspath(os.path.expanduser(ctx.options.compile_cache))
+        ctx.env.COMPILE_CACHE_SIZE = ctx.options.compile_cache_size * 1024 * 1024
+        ctx.add_post_fun(compile_cache_post_build)
+
     if ctx.env.SOURCES:
         # Build the application
         ctx.program(
@@ -308,6 +494,10 @@ def build_application(ctx, project, project_keys, features, appname) -> None:
             use=ctx.env.USES,
             lib=ctx.env.LIBS,
             libpath=ctx.env.LIB_PATHS,
+            unity_batches=ctx.env.UNITY_BATCHES,
+            pch=ctx.env.PCH,
+            fpga_design_xml=fpga_design.get('xml'),
+            fpga_design_headers=fpga_design.get('headers'),
         )
 
         # Post build tasks
@@ -341,8 +531,13 @@ def build_library(ctx, libname) -> None:
         ctx.add_post_fun(_clangdb_ide_support)
 
     if ctx.env[f'SOURCES_{libname.upper()}']:
+        features = 'c cstlib'
+        if ctx.env[f'UNITY_BATCHES_{libname.upper()}'] and not ctx.options.no_unity:
+            features = f'{features} unity'
+        if ctx.env[f'PCH_{libname.upper()}']:
+            features = f'{features} pch'
         ctx.stlib(
-            features='c cstlib',
+            features=features,
             source=ctx.path.ant_glob(ctx.env[f'SOURCES_{libname.upper()}']),
             includes=ctx.env[f'INCLUDES_{libname.upper()}'],
             cflags=ctx.env.CFLAGS + ctx.env[f'CFLAGS_{libname.upper()}'],
@@ -351,6 +546,8 @@ def build_library(ctx, libname) -> None:
             use=ctx.env[f'USES_{libname.upper()}'],
             name=libname,
             target=libname.strip('lib'),
+            unity_batches=ctx.env[f'UNITY_BATCHES_{libname.upper()}'],
+            pch=ctx.env[f'PCH_{libname.upper()}'],
         )
 
         if ctx.options.standalone:
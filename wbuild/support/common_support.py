@@ -5,12 +5,45 @@
 
 from __future__ import division
 
-import re
 import os
 
 from waflib import Logs
 
-from tools.mss_header_binder import bind_mss_header_to_bin
+from wbuild.support.elf_support import read_elf, read_elf_symbols
+from wbuild.support.map_support import parse_map_file
+from wbuild.support.size_support import write_size_report, check_size_budget
+
+
+def _print_elf_sections(elf) -> None:
+    # Print the allocated sections of an ELF file, as returned by read_elf. This is
+    # used by post_build_stats when the map file is not available.
+    #
+    # Args:
+    #     :param elf: Dictionary describing the ELF file
+
+    tilde = '~' * 77
+    Logs.pprint('YELLOW', tilde)
+    Logs.pprint('NORMAL', f'{"   Sections":<20s}{"Size [byte]":>15s}'
+                          f'{"Address":>21s}{"Load address":>21s}')
+    Logs.pprint('YELLOW', tilde)
+    for sect_name, sec_data in sorted(elf['sections'].items()):
+        Logs.pprint('NORMAL', f'{"   " + sect_name:<20s}{sec_data["size"]:>15d}'
+                              f'{sec_data["addr"]:>#21x}{sec_data["lma"]:>#21x}')
+    Logs.pprint('YELLOW', tilde + '\n')
+
+
+def _check_size_report(ctx, elf_path, elf, parsed_map) -> None:
+    # Write the machine-readable size report of the build and check it against the size
+    # budget configured in project.yml.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param elf_path: Path to the ELF file
+    #     :param elf: Dictionary describing the ELF file, as returned by read_elf
+    #     :param parsed_map: Dictionary describing the map file, or None if not available
+
+    report = write_size_report(ctx, elf, read_elf_symbols(elf_path), parsed_map)
+    check_size_budget(ctx, report)
 
 
 def post_build_stats(ctx) -> None:
@@ -48,6 +81,14 @@ def post_build_stats(ctx) -> None:
     #
     #     ########################
     #
+    # The text, data and bss sizes are read directly from the ELF file, without spawning the
+    # size tool of the toolchain. The output sections and memories tables are computed from the
+    # link map. If the map file is not available, the allocated sections of the ELF file are
+    # printed instead, together with their addresses and load addresses.
+    # The same statistics are also written to build/<variant>/<name>_size.json, and checked
+    # against the size budget configured in project.yml (see check_size_budget), making the
+    # build fail if it is exceeded.
+    #
     # As post_build_stats depends on the ELF file, in order to avoid strange race conditions is a
     # good practice to add it as a post_fun.
     #
@@ -64,148 +105,53 @@ def post_build_stats(ctx) -> None:
                 '########################\n')
     tilde = '~' * 77
     Logs.pprint('YELLOW', tilde)
-    ctx.exec_command(''.join(ctx.env.SIZE) + ' ' + ctx.env.name + '.elf', cwd=ctx.variant_dir)
-
-    mapfile_map = {
-         'mem_conf': 'Memory Configuration',
-         'linker_conf': 'Linker script and memory map'
-     }
-
-    def get_string(strno) -> str | None:
-        if strno == '1':
-            return mapfile_map['mem_conf']
-        if strno == '2':
-            return mapfile_map['linker_conf']
-        return None
-
-    memory = {}
-    out_sect = {}
-
-    # Regular expressions
-    memory_re = re.compile(
-        r'(?P<memName>\w+)\s+(?P<memOrig>0x[\da-fA-F]+)\s+(?P<memLgt>0x[\da-fA-F]+)')
-    out_sect_re_one_line = re.compile(
-        r'(?P<sectName>\.[\S.]+)\s+(?P<sectStart>0x[\da-fA-F]+)\s+(?P<sectSize>0x[\da-fA-F]+)')
-    out_sect_re_two_lines1 = re.compile(r'(?P<sectName>\.[\S.]+)$')
-    out_sect_re_two_lines2 = re.compile(
-        r'\s+(?P<sectStart>0x[\da-fA-F]+)\s+(?P<sectSize>0x[\da-fA-F]+)')
-    fill_re = re.compile(r' \*fill\*\s+(?P<fillAdd>0x[\da-fA-F]+)\s+(?P<fillLgt>0x[\da-fA-F]+)')
-
-    with open('build/' + ctx.variant + '/' + ctx.env.name + '.map', 'r',
-              encoding='utf-8') as map_file:
-        scan_phase = ""
-
-        # Keep track of last encountered output section
-        last_out_sec = ""
-
-        for line in map_file:
-
-            # Recognise sections of the map file
-            if line.startswith(get_string('1')):
-                scan_phase = "scanMemories"
-            elif line.startswith(get_string('2')):
-                scan_phase = ""
-            elif line.startswith('.'):
-                scan_phase = "scanOutSections"
-
-            # Analysis
-            if "scanMemories" == scan_phase:
-                line_match = memory_re.match(line)
-                if line_match:
-                    mem_name = line_match.groupdict()['memName']
-                    memory[mem_name] = {}
-                    memory[mem_name]['origin'] = int(line_match.groupdict()['memOrig'], 16)
-                    memory[mem_name]['length'] = int(line_match.groupdict()['memLgt'], 16)
-                    memory[mem_name]['used'] = 0
-
-            elif "scanOutSections" == scan_phase:
-
-                # Output section (one line)
-                if out_sect_re_one_line.match(line):
-
-                    match_result = out_sect_re_one_line.match(line).groupdict()
-                    if match_result['sectName'] not in out_sect:
-                        last_out_sec = str(match_result['sectName'])
-                        out_sect[last_out_sec] = {}
-                        out_sect[last_out_sec]['size'] = int(match_result['sectSize'], 16)
-                        out_sect[last_out_sec]['start'] = int(match_result['sectStart'], 16)
-                        out_sect[last_out_sec]['fill'] = 0
-
-                # Output section (two lines)
-                if out_sect_re_two_lines1.match(line):
-                    match_result1 = out_sect_re_two_lines1.match(line).groupdict()
-                    line = next(map_file)
-                    if out_sect_re_two_lines2.match(line):
-                        match_result2 = out_sect_re_two_lines2.match(line).groupdict()
-                        last_out_sec = str(match_result1['sectName'])
-                        out_sect[last_out_sec] = {}
-                        out_sect[last_out_sec]['size'] = int(match_result2['sectSize'], 16)
-                        out_sect[last_out_sec]['start'] = int(match_result2['sectStart'], 16)
-                        out_sect[last_out_sec]['fill'] = 0
-
-                # Filled bytes
-                elif fill_re.match(line):
-                    match_result = fill_re.match(line).groupdict()
-                    out_sect[last_out_sec]['fill'] += int(match_result['fillLgt'], 16)
-
-        # For every identified output section, add its size to the corresponding
-        # memory
-        for outSecName, sec_data in out_sect.items():
-            sec_data['memory'] = ""
-            for mem_name, memData in memory.items():
-                if (sec_data['start'] >= memData['origin']) \
-                        and (sec_data['start'] < (memData['origin'] + memData['length'])):
-                    sec_data['memory'] = mem_name
-                    memData['used'] += sec_data['size']
-
-        # Print the resulting output sections information
-        tilde = '~' * 77
-        Logs.pprint('YELLOW', tilde)
-        Logs.pprint('NORMAL', f'{"Uses [%]":>10s}{"   Output Sections":<20s}'
-                              f'{"Size [byte]":>15s}{" (fill)":<15s}{"Memory":<15s}')
-        Logs.pprint('YELLOW', tilde)
-
-        # Sort all outSect keys
-        sorted_out_sect = list(out_sect.keys())
-        sorted_out_sect.sort()
-        for outSectName in sorted_out_sect:
-            sec_data = out_sect[outSectName]
-            if sec_data['memory']:
-                Logs.pprint('NORMAL',
-                            f'{((100*sec_data["size"])/memory[sec_data["memory"]]["length"]):>10.2f}'
-                            f'{"   " + outSectName:<20s}{sec_data["size"]:>15d}'
-                            f'{" (" + str(sec_data["fill"]) + ")":<15s}{sec_data["memory"]}')
-
-        # Print the resulting memories information
-        tilde = '~' * 60
-        Logs.pprint('YELLOW', '\n' + tilde)
-        Logs.pprint('NORMAL', f'{"Used [%]":>10s}{"   Memory":<20s}'
-                    f'{"Size [byte]":>15s}{" (used)":<15s}')
-        Logs.pprint('YELLOW', tilde)
-        for mem_name, memData in memory.items():
-            if memData['used'] > 0:
-                Logs.pprint('NORMAL', f'{(100 * memData["used"]) / memData["length"]:>10.2f}'
-                            f'{"   " + mem_name:<20s}{memData["length"]:>15d}'
-                            f'{" (" + str(memData["used"]) + ")":<15s}')
-    Logs.pprint('YELLOW', tilde + '\n')
+    elf_path = os.path.join(ctx.variant_dir, ctx.env.name + '.elf')
+    elf = read_elf(elf_path)
+    total = elf['text'] + elf['data'] + elf['bss']
+    Logs.pprint('NORMAL', f'{"text":>7s}\t{"data":>7s}\t{"bss":>7s}\t{"dec":>7s}\t{"hex":>7s}\tfilename')
+    Logs.pprint('NORMAL', f'{elf["text"]:>7d}\t{elf["data"]:>7d}\t{elf["bss"]:>7d}\t{total:>7d}\t'
+                          f'{total:>7x}\t{ctx.env.name}.elf\n')
+
+    map_path = os.path.join(ctx.variant_dir, ctx.env.name + '.map')
+    if not os.path.exists(map_path):
+        _print_elf_sections(elf)
+        _check_size_report(ctx, elf_path, elf, None)
+        return
+
+    parsed_map = parse_map_file(map_path)
+    memory = parsed_map['memory']
+    out_sect = parsed_map['sections']
+
+    # Print the resulting output sections information
+    tilde = '~' * 77
+    Logs.pprint('YELLOW', tilde)
+    Logs.pprint('NORMAL', f'{"Uses [%]":>10s}{"   Output Sections":<20s}'
+                          f'{"Size [byte]":>15s}{" (fill)":<15s}{"Memory":<15s}')
+    Logs.pprint('YELLOW', tilde)
 
+    # Sort all outSect keys
+    sorted_out_sect = list(out_sect.keys())
+    sorted_out_sect.sort()
+    for outSectName in sorted_out_sect:
+        sec_data = out_sect[outSectName]
+        if sec_data['memory']:
+            Logs.pprint('NORMAL',
+                        f'{((100*sec_data["size"])/memory[sec_data["memory"]]["length"]):>10.2f}'
+                        f'{"   " + outSectName:<20s}{sec_data["size"]:>15d}'
+                        f'{" (" + str(sec_data["fill"]) + ")":<15s}{sec_data["memory"]}')
+
+    # Print the resulting memories information
+    tilde = '~' * 60
+    Logs.pprint('YELLOW', '\n' + tilde)
+    Logs.pprint('NORMAL', f'{"Used [%]":>10s}{"   Memory":<20s}'
+                f'{"Size [byte]":>15s}{" (used)":<15s}')
+    Logs.pprint('YELLOW', tilde)
+    for mem_name, memData in memory.items():
+        if memData['used'] > 0:
+            Logs.pprint('NORMAL', f'{(100 * memData["used"]) / memData["length"]:>10.2f}'
+                        f'{"   " + mem_name:<20s}{memData["length"]:>15d}'
+                        f'{" (" + str(memData["used"]) + ")":<15s}')
+    Logs.pprint('YELLOW', tilde + '\n')
 
-def prepend_mss_header(ctx) -> None:
-    # The prepend_mss_header function preprends the MSS header to any ELF
-    # file built with this build system.
-    # For knowing what the MSS header is and how it is made, please refer to
-    # the bind_mss_header_to_bin function documentation.
-    #
-    # As bind_mss_header_to_bin depends on the ELF file, in order to avoid
-    # strange race conditions is a good practice to add it as a post_fun.
-    #
-    # Example usage:
-    #
-    #     # Post built tasks
-    #     ctx.add_post_fun(bind_mss_header_to_bin)
-    #
-    # Args:
-    #     :param ctx: The WAF context
+    _check_size_report(ctx, elf_path, elf, parsed_map)
 
-    bind_mss_header_to_bin(os.path.join(ctx.variant_dir, ctx.env.name + '.bin'),
-                           ''.join(ctx.env.OBJCOPY))
@@ -0,0 +1,157 @@
+# !/usr/bin/env python
+# pylint: disable=too-many-statements, unused-argument, invalid-name, missing-class-docstring, too-few-public-methods
+# -*- coding: utf-8 -*-
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+
+import os
+import shutil
+import tempfile
+import threading
+
+from waflib import Logs, Utils
+
+# Bump whenever the way keys are computed changes, so that stale entries are never hit
+COMPILE_CACHE_VERSION = 1
+
+# Fraction of the maximum size the cache is shrunk to when it exceeds it, so that eviction
+# does not run at the end of every build
+EVICTION_LOW_WATERMARK = 0.9
+
+# Hit and miss counters of the current build, updated by the compile tasks
+compile_cache_stats = {'hits': 0, 'misses': 0}
+
+_stats_lock = threading.Lock()
+
+# Hash of the compiler binaries, keyed by path
+_compiler_identities = {}
+
+
+def _count(outcome) -> None:
+    with _stats_lock:
+        compile_cache_stats[outcome] += 1
+
+
+def _entry_path(cache_dir, key, index=0) -> str:
+    return os.path.join(cache_dir, key[:2], f'{key}.{index}' if index else key)
+
+
+def compiler_identity(compiler) -> bytes:
+    # Return the hash of the compiler binary, computed once per build
+    identity = _compiler_identities.get(compiler)
+    if identity is None:
+        identity = _compiler_identities[compiler] = Utils.h_file(compiler)
+    return identity
+
+
+def compile_cache_key(compiler, command, preprocessed) -> str:
+    # The compile_cache_key function computes the key of an object file in the compile cache.
+    # The key covers the identity of the compiler binary, the full compiler command line (so
+    # CFLAGS, DEFINES and INCPATHS), but the path of the object file, and the preprocessed
+    # source, so that any change to the source or to the headers it includes is caught.
+    #
+    # Args:
+    #     :param compiler: Path of the compiler binary
+    #     :param command: Compiler command line, without the path of the object file
+    #     :param preprocessed: Output of the preprocessor for the source
+    #
+    # Rets:
+    #     :return: The key, as an hexadecimal string
+
+    m = Utils.md5(str(COMPILE_CACHE_VERSION).encode())
+    m.update(compiler_identity(compiler))
+    m.update(repr(command).encode())
+    m.update(preprocessed)
+    return m.hexdigest()
+
+
+def retrieve_objects(cache_dir, key, targets) -> bool:
+    # Copy the cached files with the given key to targets, which are the object file and,
+    # optionally, the files generated with it (e.g. the depfile). The modification time of
+    # the cache entries is refreshed, for the least recently used eviction.
+    #
+    # Rets:
+    #     :return: True on a cache hit, False otherwise
+
+    try:
+        for index, target in enumerate(targets):
+            entry = _entry_path(cache_dir, key, index)
+            shutil.copyfile(entry, target)
+            os.utime(entry)
+    except OSError:
+        _count('misses')
+        return False
+    _count('hits')
+    return True
+
+
+def store_objects(cache_dir, key, targets) -> None:
+    # Store targets in the cache with the given key. Each entry is written to a temporary file
+    # first, so that concurrent builds never see a partial entry.
+
+    try:
+        for index, target in enumerate(targets):
+            entry = _entry_path(cache_dir, key, index)
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(entry), delete=False) as tmp:
+                with open(target, 'rb') as f:
+                    shutil.copyfileobj(f, tmp)
+            os.replace(tmp.name, entry)
+    except OSError as e:
+        Logs.warn(f'Could not store {targets[0]} in the compile cache: {e}')
+
+
+def evict_objects(cache_dir, max_size) -> int:
+    # The evict_objects function removes the least recently used entries from the cache once
+    # its size exceeds max_size bytes, until it is back to EVICTION_LOW_WATERMARK of it.
+    #
+    # Args:
+    #     :param cache_dir: Path of the cache directory
+    #     :param max_size: Maximum size of the cache, in bytes
+    #
+    # Rets:
+    #     :return: Size of the cache after eviction, in bytes
+
+    entries = []
+    for dirpath, _, filenames in os.walk(cache_dir):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_size = sum(size for _, size, _ in entries)
+    if total_size <= max_size:
+        return total_size
+
+    entries.sort()
+    for _, size, path in entries:
+        if total_size <= max_size * EVICTION_LOW_WATERMARK:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_size -= size
+    return total_size
+
+
+def compile_cache_post_build(ctx) -> None:
+    # The compile_cache_post_build function prints the hit and miss statistics of the compile
+    # cache for the build, and evicts the least recently used entries if the cache grew
+    # beyond its maximum size.
+    #
+    # Example usage:
+    #
+    #     # Post built tasks
+    #     ctx.add_post_fun(compile_cache_post_build)
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    cache_size = evict_objects(ctx.env.COMPILE_CACHE_DIR, ctx.env.COMPILE_CACHE_SIZE)
+    hits, misses = compile_cache_stats['hits'], compile_cache_stats['misses']
+    hit_rate = hits / (hits + misses) if hits + misses else 0
+    Logs.pprint('CYAN', f'Compile cache: {hits} hits, {misses} misses ({hit_rate:.0%} hit rate), '
+                        f'{cache_size / (1024 * 1024):.1f} MB of {ctx.env.COMPILE_CACHE_SIZE // (1024 * 1024)} MB used')
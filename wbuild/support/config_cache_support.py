@@ -0,0 +1,112 @@
+# !/usr/bin/env python
+# pylint: disable=too-many-statements, unused-argument, invalid-name, missing-class-docstring, too-few-public-methods
+# -*- coding: utf-8 -*-
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+
+import os
+import pickle
+
+import yaml
+
+# Bump whenever the layout of the cached values changes, so that stale caches are discarded
+CONFIG_CACHE_VERSION = 1
+
+# Name of the cache file, which is stored in the build directory
+CONFIG_CACHE_FILE = '.wbuild_config_cache'
+
+# The C accelerated loader is only available if PyYAML has been built against libyaml
+_yaml_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# In process copy of the cache file, keyed by cache file path
+_config_caches = {}
+
+
+def load_yaml(path):
+    # Parse a yml file, trough the C accelerated loader when available.
+    #
+    # Args:
+    #     :param path: Path to the yml file
+    #
+    # Rets:
+    #     :return: The parsed content of the file
+
+    with open(path, encoding='utf-8') as f:
+        return yaml.load(f, Loader=_yaml_loader)
+
+
+def _stamp(path):
+    # Return the modification time and size of path, or None if it does not exist
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _load_config_cache(cache_path) -> dict:
+    cache = _config_caches.get(cache_path)
+    if cache is None:
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = pickle.load(f)
+            if cache.get('version') != CONFIG_CACHE_VERSION:
+                cache = None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+            cache = None
+        cache = _config_caches[cache_path] = cache or {'version': CONFIG_CACHE_VERSION, 'entries': {}}
+    return cache
+
+
+def _store_config_cache(cache_path, cache) -> None:
+    # The cache is written to a temporary file first, so that concurrent builds of different
+    # variants never read a partial cache
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f'{cache_path}.{os.getpid()}'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def cached_config(ctx, key, resolve):
+    # The cached_config function returns the value computed by resolve, caching it in the
+    # build directory, so that later calls, also from later waf runs, do not compute it again
+    # as long as the files it has been computed from are unchanged.
+    # resolve must return a tuple made of the value and of the list of paths it depends on,
+    # e.g. the yml files which have been parsed and the directories which have been listed.
+    # Each path is stamped with its modification time and size, and the cached value is only
+    # returned if all the stamps still match.
+    #
+    # Example usage:
+    #
+    #     def _resolve():
+    #         return load_yaml('project.yml'), ['project.yml']
+    #
+    #     project = cached_config(ctx, ('project', os.path.abspath('project.yml')), _resolve)
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param key: Key of the value in the cache, which must be picklable
+    #     :param resolve: Function computing the value, and the paths it depends on
+    #
+    # Rets:
+    #     :return: The cached or computed value
+
+    out_dir = getattr(ctx, 'out_dir', None)
+    if not out_dir:
+        return resolve()[0]
+
+    cache_path = os.path.join(out_dir, CONFIG_CACHE_FILE)
+    cache = _load_config_cache(cache_path)
+
+    entry = cache['entries'].get(key)
+    if entry and all(_stamp(path) == stamp for path, stamp in entry[0]):
+        return entry[1]
+
+    value, paths = resolve()
+    paths = [os.path.abspath(path) for path in paths]
+    cache['entries'][key] = ([(path, _stamp(path)) for path in dict.fromkeys(paths)], value)
+    _store_config_cache(cache_path, cache)
+    return value
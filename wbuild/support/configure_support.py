@@ -6,9 +6,11 @@
 
 #import git
 import os
-import yaml
 from waflib import Errors, Logs
 
+from tools.fpga_design_config_generator import generate_fpga_design_config
+from wbuild.support.config_cache_support import cached_config, load_yaml
+
 wafbuild_home = os.environ.get('BUILD_SYSTEM_PATH')
 
 
@@ -63,6 +65,12 @@ def init_app_configure_stage(ctx, project, project_keys) -> None:
     if not ctx.env.is_bootloader:
         ctx.fatal('Please set the is_bootloader variable in the project.yml.')
 
+    # In the copy-to-lim boot mode, the startup code copies the code loaded in eNVM to LIM,
+    # where the application is linked (see parse_and_add_linker_options)
+    ctx.env.BOOT_MODE = ctx.options.boot_mode or 'xip'
+    if ctx.env.BOOT_MODE == 'copy-to-lim':
+        ctx.env.append_unique('DEFINES', 'MPFS_HAL_COPY_TO_LIM')
+
     # If we detect the user put the source code under version control, append the
     # sha to the revision
     #try:
@@ -73,6 +81,46 @@ def init_app_configure_stage(ctx, project, project_keys) -> None:
     git_revision = 'nosrcrev'
     ctx.env.git_rev = f'{ctx.env.version}~{git_revision}'
 
+    if 'fpga_design' in project:
+        _configure_fpga_design_config(ctx, project['fpga_design'])
+
+
+def _configure_fpga_design_config(ctx, fpga_design) -> None:
+    # The _configure_fpga_design_config function generates the fpga_design_config headers
+    # from the XML exported by the MSS Configurator, as set by the fpga_design entry of
+    # project.yml, so that they are up to date before the build starts. The headers are
+    # generated again by the build whenever the XML changes, see the fpga_design_config
+    # feature. Only the headers whose content changes are written.
+    #
+    # Example snippet of project.yml:
+    #
+    #     fpga_design:
+    #       xml: confs/xml/PF_SOC_MSS_mss_cfg.xml
+    #       cfg: confs/xml/PF_SOC_MSS.cfg
+    #       headers: include/fpga_design_config
+    #
+    # The cfg file is not needed by the headers, it is only read by the build steps querying
+    # the design, see get_design_config.
+    #
+    # The _configure_fpga_design_config function is private and it is not meant to be called
+    # outside this module.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param fpga_design: The fpga_design entry of project.yml
+
+    for key in ('xml', 'headers'):
+        if not fpga_design.get(key):
+            ctx.fatal(f'Please set the {key} variable of the fpga_design entry in project.yml.')
+
+    xml_path = os.path.join(ctx.path.abspath(), fpga_design['xml'])
+    if not os.path.exists(xml_path):
+        ctx.fatal(f'The MSS configuration {fpga_design["xml"]} does not exist.')
+
+    ctx.start_msg('Generating the FPGA design configuration headers')
+    written = generate_fpga_design_config(xml_path, os.path.join(ctx.path.abspath(), fpga_design['headers']))
+    ctx.end_msg(f'{len(written)} updated' if written else 'up to date')
+
 
 def parse_project_keys(ctx) -> list:
     # The parse_project_keys function open the project.yml which is present in the project
@@ -105,8 +153,9 @@ def parse_project_keys(ctx) -> list:
     project_path = os.path.join(ctx.path.get_bld().relpath(), 'project.yml')
 
     if os.path.exists(project_path):
-        with open(project_path, encoding='utf-8') as f:
-            project = yaml.safe_load(f) or {}
+        # The parsed project.yml is cached in the build directory, see cached_config
+        project = cached_config(ctx, ('project', os.path.abspath(project_path)),
+                                lambda: (load_yaml(project_path) or {}, [project_path]))
 
         project_keys = list(project.keys())
         return project, project_keys
@@ -373,6 +422,24 @@ def configure_release(ctx) -> None:
         ctx.env.append_unique('CFLAGS', ctx.env.cflags_release)
 
 
+def configure_release_lto(ctx) -> None:
+    # The configure_release_lto function is responsible for configuring the link time optimized
+    # release environment. On top of the release configuration, sources are compiled with the
+    # LTO_FLAGS set by the gcc_flags tool, which are passed to the linker too (see
+    # build_support), so that the whole application is optimized as a single unit.
+    # Static libraries are archived trough gcc-ar, which is found together with the toolchain,
+    # so their LTO objects are indexed and can be linked.
+    #
+    # configure_release_lto is not meant to be called directly, but it is meant to be passed to
+    # the setenv_from_base function.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    configure_release(ctx)
+    ctx.env.append_unique('CFLAGS', ctx.env.LTO_FLAGS)
+
+
 def configure_debug(ctx) -> None:
     # The configure_debug function is responsible for configuring the debug environment.
     #
@@ -487,6 +554,9 @@ def _parse_common_flags(ctx, project, project_keys, appname) -> None:
     #   - cflags_debug: cflags appended for debug builds
     #   - cflags_release: cflags appended for release build
     #
+    # Additionally, cflags_analyzer are only passed to the GCC static analyzer, which is run
+    # by the analyze_<variant> commands.
+    #
     # parse_common_flags is private, and it is not meant to be called outside this module.
     #
     # @HACK - I am abusing ctx variables to avoid using global variables.
@@ -522,6 +592,8 @@ def _parse_common_flags(ctx, project, project_keys, appname) -> None:
         flag_types['cflags_debug'] = list(cflags.get('debug', []))
         flag_types['cflags_release'] = list(cflags.get('release', []))
         flag_types['cflags_release_optional'] = list(cflags.get('release_optional', []))
+        # Analyzer flags are not compiler flags, they are kept aside
+        ctx.env.append_unique('ANALYZER_FLAGS', list(cflags.get('analyzer', [])))
 
     # Assign flags to ctx.env and append unique values
     for key, flags in flag_types.items():
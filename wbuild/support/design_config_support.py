@@ -0,0 +1,191 @@
+# !/usr/bin/env python
+# pylint: disable=too-many-statements, unused-argument, invalid-name, missing-class-docstring, too-few-public-methods
+# -*- coding: utf-8 -*-
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+
+import bisect
+import os
+
+from tools.fpga_design_config_generator import SECTION_HEADERS, iter_design_config_sections, register_value
+from wbuild.support.config_cache_support import cached_config
+
+# The L2 cache of the MSS is made of 16 ways of 128 KiB each. Ways not enabled for the cache are
+# available as LIM, ways enabled for the cache but reserved for the scratchpad are available as
+# scratchpad, the others are used by the cache.
+L2_WAYS = 16
+L2_WAY_SIZE = 128 * 1024
+
+# Base addresses of the LIM and of the scratchpad
+L2_LIM_ORIGIN = 0x08000000
+L2_SCRATCHPAD_ORIGIN = 0x0A000000
+
+
+def parse_design_cfg(cfg_path) -> dict:
+    # Parse the flat key/value dump of the MSS Configurator (e.g. PF_SOC_MSS.cfg), made of one
+    # setting per line, the name followed by its value.
+    settings = {}
+    with open(cfg_path, encoding='utf-8') as f:
+        for line in f:
+            name, _, value = line.strip().partition(' ')
+            if name:
+                settings[name] = value.strip()
+    return settings
+
+
+def _parse_address(address) -> int:
+    # Register addresses are either hexadecimal, prefixed by 0x, or decimal, but a few bare
+    # hexadecimal ones (e.g. C)
+    address = address.strip()
+    if address.isdigit():
+        return int(address, 10)
+    return int(address, 16)
+
+
+def parse_design_xml(xml_path) -> dict:
+    # Parse the XML exported by the MSS Configurator into the design information, the
+    # registers and the memory map of the design model, see load_design_config
+    design = {'information': {}, 'registers': {}, 'fields': {}, 'memory': []}
+    for tag, element in iter_design_config_sections(xml_path):
+        if tag == 'design_information':
+            design['information'] = {child.tag: (child.text or '').strip() for child in element}
+            continue
+
+        prefix = SECTION_HEADERS[tag][1]
+        for register in element.iter('register'):
+            name = prefix + register.get('name')
+            design['registers'][name] = {
+                'section': tag,
+                'address': _parse_address(register.get('address')),
+                'value': register_value(register),
+                'fields': {field.get('name'): {'offset': int(field.get('offset')),
+                                               'width': int(field.get('width')),
+                                               'type': field.get('Type'),
+                                               'value': (field.text or '').strip()}
+                           for field in register.findall('field')},
+            }
+            for field in register.findall('field'):
+                design['fields'].setdefault(field.get('name'), []).append(name)
+
+        for mem in element.iter('mem'):
+            start = int(mem.text.strip(), 0)
+            design['memory'].append((start, start + int(mem.get('size'), 0), prefix + mem.get('name')))
+
+    design['memory'].sort()
+    return design
+
+
+def load_design_config(ctx, xml_path, cfg_path=None) -> dict:
+    # The load_design_config function returns the model of the FPGA design, as exported by the
+    # MSS Configurator, for the build steps checking or generating files against the design
+    # (e.g. linker scripts and headers). The model is parsed once and cached in the build
+    # directory (see cached_config), so later calls only check that the XML and the cfg files
+    # are unchanged, without parsing them again.
+    # The model is shaped as follows:
+    #
+    #     {
+    #         'information': {'libero_version': '2024.1', 'design_name': 'PF_SOC_MSS', ...},
+    #         'settings': {'DDR3_CAS_LATENCY': '5', 'CAN_0': 'FABRIC', ...},
+    #         'registers': {
+    #             'HART0_CSR_PMPCFG0': {'section': 'pmp_h0', 'address': 0x3A0, 'value': 0,
+    #                                   'fields': {'PMP0CFG': {'offset': 0, 'width': 8,
+    #                                                          'type': 'RW', 'value': '0x00'}, ...}},
+    #             ...
+    #         },
+    #         'fields': {'PMP0CFG': ['HART0_CSR_PMPCFG0', ...], ...},
+    #         'memory': [(0x20220000, 0x20220004, 'RESET_VECTOR_HART0'), ...],
+    #     }
+    #
+    # Registers are indexed by the name of their setting, without the LIBERO_SETTING_ prefix, as
+    # in the fpga_design_config headers; fields are indexed by name, pointing to the registers
+    # holding a field by that name. The memory map is a list of (start, end, name) tuples
+    # sorted by address, see find_memory_region.
+    #
+    # Example usage:
+    #
+    #     design = load_design_config(ctx, 'confs/xml/PF_SOC_MSS_mss_cfg.xml', 'confs/xml/PF_SOC_MSS.cfg')
+    #     ways = design['registers']['WAY_ENABLE']['value']
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param xml_path: Path to the XML exported by the MSS Configurator
+    #     :param cfg_path: Optional, path to the cfg file exported by the MSS Configurator
+    #
+    # Rets:
+    #     :return: The model of the design
+
+    xml_path = os.path.join(ctx.path.abspath(), xml_path)
+    cfg_path = os.path.join(ctx.path.abspath(), cfg_path) if cfg_path else None
+
+    def _resolve():
+        design = parse_design_xml(xml_path)
+        design['settings'] = parse_design_cfg(cfg_path) if cfg_path else {}
+        return design, [xml_path] + ([cfg_path] if cfg_path else [])
+
+    return cached_config(ctx, ('design_config', xml_path, cfg_path), _resolve)
+
+
+def get_design_config(ctx, project) -> dict:
+    # The get_design_config function returns the model of the FPGA design set by the
+    # fpga_design entry of project.yml, see load_design_config, or None if there is none.
+    #
+    # Example snippet of project.yml:
+    #
+    #     fpga_design:
+    #       xml: confs/xml/PF_SOC_MSS_mss_cfg.xml
+    #       cfg: confs/xml/PF_SOC_MSS.cfg
+    #       headers: include/fpga_design_config
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param project: Handle to project.yml
+    #
+    # Rets:
+    #     :return: The model of the design
+
+    fpga_design = (project or {}).get('fpga_design')
+    if not fpga_design:
+        return None
+    return load_design_config(ctx, fpga_design['xml'], fpga_design.get('cfg'))
+
+
+def find_field(design, register, field) -> dict:
+    # Return a field of a register of the design, or None if there is no such field
+    return design['registers'].get(register, {}).get('fields', {}).get(field)
+
+
+def find_memory_region(design, address) -> tuple:
+    # Return the (start, end, name) memory region of the design holding address, or None.
+    # Regions are looked up by bisection, the smallest region holding the address wins.
+    memory = design['memory']
+    index = bisect.bisect_right(memory, (address, float('inf'), ''))
+    holding = [region for region in memory[:index] if region[0] <= address < region[1]]
+    return min(holding, key=lambda region: region[1] - region[0]) if holding else None
+
+
+def find_memory_overlaps(design) -> list:
+    # Return the pairs of overlapping memory regions of the design. Empty regions never overlap.
+    overlaps = []
+    regions = [region for region in design['memory'] if region[1] > region[0]]
+    for index, region in enumerate(regions):
+        for other in regions[index + 1:]:
+            if other[0] >= region[1]:
+                break
+            overlaps.append((region, other))
+    return overlaps
+
+
+def get_l2_allocation(design) -> dict:
+    # Return how the ways of the L2 cache are split among cache, LIM and scratchpad by the
+    # design, according to the WAY_ENABLE and NUM_SCRATCH_PAD_WAYS settings of hw_cache.h,
+    # together with the (origin, length) of the LIM and of the scratchpad.
+    enabled_ways = design['registers']['WAY_ENABLE']['value'] + 1
+    scratchpad_ways = design['registers']['NUM_SCRATCH_PAD_WAYS']['value']
+    if enabled_ways > L2_WAYS or scratchpad_ways >= enabled_ways:
+        raise ValueError(f'Invalid L2 configuration: {enabled_ways} ways enabled, {scratchpad_ways} for the scratchpad')
+    return {
+        'cache_ways': enabled_ways - scratchpad_ways,
+        'scratchpad_ways': scratchpad_ways,
+        'lim_ways': L2_WAYS - enabled_ways,
+        'lim': (L2_LIM_ORIGIN, (L2_WAYS - enabled_ways) * L2_WAY_SIZE),
+        'scratchpad': (L2_SCRATCHPAD_ORIGIN, scratchpad_ways * L2_WAY_SIZE),
+    }
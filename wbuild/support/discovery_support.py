@@ -0,0 +1,192 @@
+# !/usr/bin/env python
+# pylint: disable=too-many-statements, unused-argument, invalid-name, missing-class-docstring, too-few-public-methods
+# -*- coding: utf-8 -*-
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+
+import os
+import re
+import subprocess
+
+from wbuild.support.configure_support import parse_project_keys
+
+# Directories never holding project sources: the build directories, the virtual environment
+# created by envsetup.sh and the unpacked waf library
+DEFAULT_IGNORE = ['.git/', 'build/', 'build_*/', 'wsenv/', '.waf*/', '__pycache__/']
+
+
+def _translate_pattern(pattern) -> str:
+    # Translate the glob of a .gitignore pattern into a regular expression matching the path
+    # relative to the directory holding the .gitignore
+    regex = ''
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith('**/', index):
+            regex += '(?:.*/)?'
+            index += 3
+        elif pattern.startswith('/**', index) and index + 3 == len(pattern):
+            regex += '/.*'
+            index += 3
+        elif pattern[index] == '*':
+            regex += '[^/]*'
+            index += 1
+        elif pattern[index] == '?':
+            regex += '[^/]'
+            index += 1
+        elif pattern[index] == '[' and ']' in pattern[index + 1:]:
+            end = pattern.index(']', index + 1)
+            regex += '[' + pattern[index + 1:end].replace('!', '^', 1).replace('\\', '\\\\') + ']'
+            index = end + 1
+        else:
+            regex += re.escape(pattern[index])
+            index += 1
+    return regex
+
+
+def compile_ignore_patterns(patterns, base='') -> list:
+    # The compile_ignore_patterns function compiles a list of .gitignore style patterns, as
+    # found in a .gitignore file held by the base directory, into a list of rules to be passed
+    # to is_ignored. The syntax is the .gitignore one: blank lines and lines starting with #
+    # are skipped, ! negates a pattern, a trailing / only matches directories, and patterns
+    # holding a / are anchored to the base directory, while the others match at any depth.
+    #
+    # Args:
+    #     :param patterns: List of patterns
+    #     :param base: Directory holding the patterns, relative to the discovery root
+    #
+    # Rets:
+    #     :return: List of (regular expression, negated, directory only, base) rules
+
+    rules = []
+    for pattern in patterns:
+        pattern = pattern.rstrip('\n')
+        if not pattern.strip() or pattern.startswith('#'):
+            continue
+        negated = pattern.startswith('!')
+        pattern = pattern[1:] if negated else pattern
+        dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        anchored = '/' in pattern
+        regex = _translate_pattern(pattern.lstrip('/'))
+        if not anchored:
+            regex = '(?:.*/)?' + regex
+        rules.append((re.compile(regex + '$'), negated, dir_only, base))
+    return rules
+
+
+def is_ignored(rel_path, is_dir, rules) -> bool:
+    # Whether a path, relative to the discovery root, is ignored by rules. As in git, the
+    # last matching rule wins.
+    ignored = False
+    for regex, negated, dir_only, base in rules:
+        if dir_only and not is_dir:
+            continue
+        if base:
+            if not rel_path.startswith(base + '/'):
+                continue
+            path = rel_path[len(base) + 1:]
+        else:
+            path = rel_path
+        if regex.match(path):
+            ignored = not negated
+    return ignored
+
+
+def _git_ls_files(root):
+    # List the files tracked or not ignored by git under root, or None if root is not in a
+    # git repository. Submodules are listed as a single entry, so they are never walked.
+    try:
+        result = subprocess.run(['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard'],
+                                cwd=root, capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return [path for path in result.stdout.decode('utf-8', 'replace').split('\0') if path]
+
+
+def _scandir_files(root, rules):
+    # Walk root with os.scandir, pruning the ignored directories, the nested git repositories
+    # and applying the .gitignore files found on the way
+    stack = [('', rules)]
+    while stack:
+        rel_dir, dir_rules = stack.pop()
+        abs_dir = os.path.join(root, rel_dir)
+        gitignore = os.path.join(abs_dir, '.gitignore')
+        if os.path.isfile(gitignore):
+            with open(gitignore, encoding='utf-8', errors='replace') as f:
+                dir_rules = dir_rules + compile_ignore_patterns(f, rel_dir)
+
+        try:
+            entries = list(os.scandir(abs_dir))
+        except OSError:
+            continue
+
+        for entry in entries:
+            rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if is_ignored(rel_path, True, dir_rules) or os.path.exists(os.path.join(entry.path, '.git')):
+                    continue
+                stack.append((rel_path, dir_rules))
+            elif entry.is_file() and not is_ignored(rel_path, False, dir_rules):
+                yield rel_path
+
+
+def _parents(rel_path):
+    # Yield the parent directories of a relative path, outermost first
+    parts = rel_path.split('/')[:-1]
+    for index in range(1, len(parts) + 1):
+        yield '/'.join(parts[:index])
+
+
+def discover_sources(root, extensions, ignore=(), use_git=True) -> list:
+    # The discover_sources function lists the source files of a project, for the commands
+    # working on the whole tree, such as format_srcs or lint commands.
+    # If use_git is set and root is in a git repository, the files are listed by git
+    # ls-files, so the files ignored by git and the submodules are left out. Otherwise the
+    # tree is walked with os.scandir, honouring the .gitignore files found on the way and
+    # pruning the nested git repositories. In both cases, DEFAULT_IGNORE and the ignore
+    # patterns, in the .gitignore syntax, are applied on top.
+    #
+    # Example usage:
+    #
+    #     srcs = discover_sources(ctx.path.abspath(), ('.c', '.h'), get_ignore_patterns(ctx))
+    #
+    # Args:
+    #     :param root: Directory to list the sources of
+    #     :param extensions: Tuple of the extensions of the sources
+    #     :param ignore: Optional, list of .gitignore style patterns of the paths to be ignored
+    #     :param use_git: Optional, whether to ask git for the files or not
+    #
+    # Rets:
+    #     :return: Sorted list of the sources, relative to root
+
+    rules = compile_ignore_patterns(DEFAULT_IGNORE + list(ignore))
+
+    files = _git_ls_files(root) if use_git else None
+    if files is None:
+        files = _scandir_files(root, rules)
+    else:
+        files = (path for path in files
+                 if not is_ignored(path, False, rules)
+                 and not any(is_ignored(parent, True, rules) for parent in _parents(path))
+                 and os.path.isfile(os.path.join(root, path)))
+
+    return sorted(path for path in files if path.endswith(tuple(extensions)))
+
+
+def get_ignore_patterns(ctx) -> list:
+    # The get_ignore_patterns function returns the patterns of the paths the commands working
+    # on the whole tree must ignore, as set by the ignore entry of project.yml.
+    #
+    # Example snippet of project.yml:
+    #
+    #     ignore:
+    #       - 'confs/xml/'
+    #       - 'src/third_party/**/*.h'
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #
+    # Rets:
+    #     :return: List of .gitignore style patterns
+
+    project, _ = parse_project_keys(ctx)
+    return list((project or {}).get('ignore') or [])
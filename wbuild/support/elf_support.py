@@ -0,0 +1,217 @@
+# !/usr/bin/env python
+# pylint: disable=too-many-statements, unused-argument, invalid-name, missing-class-docstring, too-few-public-methods
+# -*- coding: utf-8 -*-
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+
+import mmap
+import struct
+
+# ELF identification
+ELF_MAGIC = b'\x7fELF'
+ELFCLASS64 = 2
+ELFDATA2LSB = 1
+ELFDATA2MSB = 2
+
+# Section types and flags
+SHT_SYMTAB = 2
+SHT_NOBITS = 8
+SHF_WRITE = 0x1
+SHF_ALLOC = 0x2
+SHF_EXECINSTR = 0x4
+
+# Program header types
+PT_LOAD = 1
+
+# Symbol types
+SYMBOL_TYPES = {0: 'NOTYPE', 1: 'OBJECT', 2: 'FUNC', 3: 'SECTION', 4: 'FILE', 5: 'COMMON', 6: 'TLS'}
+
+# Layouts of the ELF64 header, section header and program header, without endianness
+_ELF64_HEADER = 'HHIQQQIHHHHHH'
+_ELF64_SECTION_HEADER = 'IIQQQQIIQQ'
+_ELF64_PROGRAM_HEADER = 'IIQQQQQQ'
+_ELF64_SYMBOL = 'IBBHQQ'
+
+
+def _open_elf(elf_file, elf_path):
+    # Memory map an ELF64 file and decode its header.
+    #
+    # Args:
+    #     :param elf_file: ELF file object opened for reading in binary mode
+    #     :param elf_path: Path to the ELF file, used for error reporting
+    #
+    # Rets:
+    #     :return: Tuple holding the mapped file, the struct endianness prefix and the
+    #              decoded ELF header
+
+    elf = mmap.mmap(elf_file.fileno(), 0, access=mmap.ACCESS_READ)
+    if elf[:4] != ELF_MAGIC or elf[4] != ELFCLASS64:
+        elf.close()
+        raise ValueError(f'{elf_path} is not an ELF64 file')
+    if elf[5] not in (ELFDATA2LSB, ELFDATA2MSB):
+        elf.close()
+        raise ValueError(f'{elf_path} has an unknown data encoding')
+    endianness = '<' if elf[5] == ELFDATA2LSB else '>'
+    return elf, endianness, struct.unpack_from(endianness + _ELF64_HEADER, elf, 16)
+
+
+def _read_section_headers(elf, endianness, header) -> list:
+    # Decode the section header table of a mapped ELF64 file.
+    #
+    # Args:
+    #     :param elf: Mapped ELF file
+    #     :param endianness: Struct endianness prefix
+    #     :param header: Decoded ELF header
+    #
+    # Rets:
+    #     :return: List of the decoded section headers
+
+    e_shoff, e_shentsize, e_shnum = header[5], header[10], header[11]
+    return [struct.unpack_from(endianness + _ELF64_SECTION_HEADER, elf, e_shoff + index * e_shentsize)
+            for index in range(e_shnum)]
+
+
+def _read_string(elf, offset) -> str:
+    # Read a NUL terminated string from a mapped ELF file
+    return elf[offset:elf.find(b'\x00', offset)].decode('utf-8', 'replace')
+
+
+def _section_load_address(section, segments) -> int:
+    # Compute the load address (LMA) of a section, which is the address of the section
+    # translated trough the PT_LOAD segment containing it. Sections which are not part of
+    # any loadable segment are loaded at their address.
+    #
+    # Args:
+    #     :param section: Dictionary describing the section
+    #     :param segments: List of the PT_LOAD segments
+    #
+    # Rets:
+    #     :return: Load address of the section
+
+    for segment in segments:
+        if segment['vaddr'] <= section['addr'] < segment['vaddr'] + segment['memsz']:
+            if section['type'] == SHT_NOBITS or \
+                    segment['offset'] <= section['offset'] < segment['offset'] + segment['filesz']:
+                return segment['paddr'] + section['addr'] - segment['vaddr']
+    return section['addr']
+
+
+def read_elf(elf_path) -> dict:
+    # The read_elf function reads the section and program header tables of an ELF64 file,
+    # without spawning any external tool. The file is memory mapped, and only the headers
+    # are actually accessed.
+    # The returned dictionary is shaped as follows:
+    #
+    #     {
+    #         'sections': {
+    #             '.text': {'addr': 0x20220100, 'lma': 0x20220100, 'size': 1024,
+    #                       'offset': 0x1100, 'type': 1, 'flags': 6},
+    #             ...
+    #         },
+    #         'segments': [
+    #             {'vaddr': 0x20220100, 'paddr': 0x20220100, 'offset': 0x1100,
+    #              'filesz': 1024, 'memsz': 1024, 'flags': 5},
+    #             ...
+    #         ],
+    #         'text': 1024,
+    #         'data': 16,
+    #         'bss': 8,
+    #     }
+    #
+    # Only the allocated sections are returned. The text, data and bss totals are computed
+    # as the Berkeley format of the size tool does: read-only or executable sections count
+    # as text, writable ones with content as data, and the others as bss.
+    #
+    # Example usage:
+    #
+    #     elf = read_elf(os.path.join(ctx.variant_dir, ctx.env.name + '.elf'))
+    #     Logs.pprint('NORMAL', f'text: {elf["text"]}')
+    #
+    # Args:
+    #     :param elf_path: Path to the ELF file
+    #
+    # Rets:
+    #     :return: Dictionary holding the sections, the loadable segments and the totals
+
+    with open(elf_path, 'rb') as elf_file:
+        elf, endianness, header = _open_elf(elf_file, elf_path)
+    with elf:
+        e_phoff, e_phentsize, e_phnum, e_shnum, e_shstrndx = \
+            header[4], header[8], header[9], header[11], header[12]
+
+        segments = []
+        for index in range(e_phnum):
+            (p_type, p_flags, p_offset, p_vaddr, p_paddr, p_filesz, p_memsz, _) = \
+                struct.unpack_from(endianness + _ELF64_PROGRAM_HEADER, elf, e_phoff + index * e_phentsize)
+            if p_type == PT_LOAD:
+                segments.append({'vaddr': p_vaddr, 'paddr': p_paddr, 'offset': p_offset,
+                                 'filesz': p_filesz, 'memsz': p_memsz, 'flags': p_flags})
+
+        section_headers = _read_section_headers(elf, endianness, header)
+
+        # Section names are stored in the section header string table
+        strtab_offset = section_headers[e_shstrndx][4] if e_shnum else 0
+
+        sections = {}
+        totals = {'text': 0, 'data': 0, 'bss': 0}
+        for (sh_name, sh_type, sh_flags, sh_addr, sh_offset, sh_size, _, _, _, _) in section_headers:
+            if not sh_flags & SHF_ALLOC:
+                continue
+
+            name = _read_string(elf, strtab_offset + sh_name)
+            section = {'addr': sh_addr, 'size': sh_size, 'offset': sh_offset,
+                       'type': sh_type, 'flags': sh_flags}
+            section['lma'] = _section_load_address(section, segments)
+            sections[name] = section
+
+            if sh_flags & SHF_EXECINSTR or not sh_flags & SHF_WRITE:
+                totals['text'] += sh_size
+            elif sh_type != SHT_NOBITS:
+                totals['data'] += sh_size
+            else:
+                totals['bss'] += sh_size
+
+    return {'sections': sections, 'segments': segments, **totals}
+
+
+def read_elf_symbols(elf_path) -> list:
+    # The read_elf_symbols function reads the symbol table (.symtab) of an ELF64 file,
+    # without spawning any external tool. Each symbol is returned as a dictionary shaped as
+    # follows:
+    #
+    #     {'name': 'main', 'value': 0x20220200, 'size': 64, 'type': 'FUNC'}
+    #
+    # Undefined symbols and the symbols without a name are skipped. An empty list is returned
+    # if the file has been stripped.
+    #
+    # Example usage:
+    #
+    #     symbols = read_elf_symbols(os.path.join(ctx.variant_dir, ctx.env.name + '.elf'))
+    #     biggest = sorted(symbols, key=lambda symbol: symbol['size'], reverse=True)[:10]
+    #
+    # Args:
+    #     :param elf_path: Path to the ELF file
+    #
+    # Rets:
+    #     :return: List of the symbols
+
+    with open(elf_path, 'rb') as elf_file:
+        elf, endianness, header = _open_elf(elf_file, elf_path)
+    with elf:
+        section_headers = _read_section_headers(elf, endianness, header)
+
+        symbols = []
+        for (_, sh_type, _, _, sh_offset, sh_size, sh_link, _, _, sh_entsize) in section_headers:
+            if sh_type != SHT_SYMTAB or not sh_entsize:
+                continue
+
+            strtab_offset = section_headers[sh_link][4]
+            for entry in range(sh_offset, sh_offset + sh_size, sh_entsize):
+                (st_name, st_info, _, st_shndx, st_value, st_size) = \
+                    struct.unpack_from(endianness + _ELF64_SYMBOL, elf, entry)
+                if not st_name or not st_shndx:
+                    continue
+                symbols.append({'name': _read_string(elf, strtab_offset + st_name),
+                                'value': st_value, 'size': st_size,
+                                'type': SYMBOL_TYPES.get(st_info & 0xf, str(st_info & 0xf))})
+
+    return symbols
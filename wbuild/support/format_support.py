@@ -3,13 +3,60 @@
 # Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
 # Date: 10/05/2024
 
+import concurrent.futures
+import difflib
+import json
 import os
 import subprocess
-import tempfile
-import shutil
 
 from waflib.Build import BuildContext
-from waflib import Logs
+from waflib import Logs, Utils
+
+from wbuild.support.discovery_support import discover_sources, get_ignore_patterns
+
+# Bump whenever the layout of the index changes, so that stale indexes are discarded
+FORMAT_INDEX_VERSION = 1
+
+# Name of the index of the files found clean by the last runs, stored in the build directory
+FORMAT_INDEX_FILE = 'clang_format_index.json'
+
+
+def _format_identity(ctx) -> str:
+    # Hash of everything the formatting of a file depends on, but the file itself: the
+    # clang-format binary and the style file of the project
+    identity = [Utils.h_file(ctx.env.CLANGFORMAT[0])]
+    style_path = os.path.join(ctx.path.abspath(), '.clang-format')
+    if os.path.exists(style_path):
+        identity.append(Utils.h_file(style_path))
+    return Utils.h_list(identity).hex()
+
+
+def _load_format_index(index_path, identity) -> dict:
+    try:
+        with open(index_path, encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if index.get('version') != FORMAT_INDEX_VERSION or index.get('identity') != identity:
+        return {}
+    return index.get('files', {})
+
+
+def _format_file(clang_format, root, path) -> tuple:
+    # Run clang-format on a file, without modifying it. Returns the original content, the
+    # formatted one, and the clang-format errors if any.
+    with open(os.path.join(root, path), 'rb') as f:
+        original = f.read()
+    result = subprocess.run(clang_format + ['-style=file', path], cwd=root, capture_output=True, check=False)
+    if result.returncode:
+        return original, None, result.stderr.decode('utf-8', 'replace')
+    return original, result.stdout, None
+
+
+def _unified_diff(path, original, formatted) -> str:
+    return ''.join(difflib.unified_diff(original.decode('utf-8', 'replace').splitlines(keepends=True),
+                                        formatted.decode('utf-8', 'replace').splitlines(keepends=True),
+                                        fromfile=f'a/{path}', tofile=f'b/{path}'))
 
 
 def format_srcs(ctx) -> None:
@@ -23,6 +70,16 @@ def format_srcs(ctx) -> None:
     # syntax:
     #
     #        waf configure format_srcs
+    #        waf format_srcs --format-behaviour=inplace-edit
+    #
+    # clang-format is run on several files at once (--format-jobs, defaulting to the number
+    # of cores), writing the formatted sources to its standard output, and the differences
+    # are computed in process. The source files are only modified by inplace-edit, and only
+    # if they are not formatted already, while dry-run prints the differences and
+    # generate-patch stores them in build/clang_format.patch.
+    # The files found formatted are recorded, together with the hash of their content, in
+    # build/clang_format_index.json, and they are skipped by later runs as long as neither
+    # they, the clang-format binary nor the .clang-format file change.
     #
     # Args:
     #     :param ctx: The WAF context
@@ -30,57 +87,59 @@ def format_srcs(ctx) -> None:
     if not ctx.env.CLANGFORMAT:
         ctx.fatal('In order to format source files you need to install clang-format')
 
-    # Parse the sources of the application
-    srcs = []
-    for root, dirs, files in os.walk(ctx.path.get_bld().relpath()):
-        for file in files:
-            dirs[:] = [d for d in dirs if d != 'build']
-            if file.endswith(('.c', '.h')):
-                srcs.append(os.path.join(root, file))
-
-    cmd = ''.join(ctx.env.CLANGFORMAT)
-
-    if ctx.options.format_behaviour in ('dry-run', 'inplace-edit'):
-        cmd = cmd +  ' --files= ' + ' '.join(srcs) + \
-              ' -style=file ' + ' --color=1'
-        if ctx.options.format_behaviour == 'dry-run':
-            cmd = cmd + ' --dry-run'
-        elif ctx.options.format_behaviour == 'inplace-edit':
-            cmd = cmd + ' -i'
-        ctx.exec_command(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-
+    # Parse the sources of the application, see discover_sources. Paths are kept relative to the project root, and
+    # clang-format is run from it
+    srcs = discover_sources(ctx.path.abspath(), ('.c', '.h'), get_ignore_patterns(ctx))
+
+    identity = _format_identity(ctx)
+    index_path = os.path.join(ctx.out_dir, FORMAT_INDEX_FILE)
+    index = _load_format_index(index_path, identity)
+
+    # Skip the files found formatted by the last runs
+    hashes = {file: Utils.h_file(os.path.join(ctx.path.abspath(), file)).hex() for file in srcs}
+    srcs = [file for file in srcs if index.get(file) != hashes[file]]
+
+    patch_content = []
+    errors = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=ctx.options.format_jobs or os.cpu_count()) as executor:
+        results = executor.map(lambda file: _format_file(ctx.env.CLANGFORMAT, ctx.path.abspath(), file), srcs)
+        for file, (original, formatted, error) in zip(srcs, results):
+            if error:
+                errors.append(f'{file}: {error}')
+            elif formatted == original:
+                index[file] = hashes[file]
+            else:
+                patch_content.append(_unified_diff(file, original, formatted))
+                index.pop(file, None)
+                if ctx.options.format_behaviour == 'inplace-edit':
+                    with open(os.path.join(ctx.path.abspath(), file), 'wb') as f:
+                        f.write(formatted)
+                    index[file] = Utils.h_file(os.path.join(ctx.path.abspath(), file)).hex()
+
+    # Forget the files which are gone, and store the index
+    index = {file: digest for file, digest in index.items() if file in hashes}
+    os.makedirs(ctx.out_dir, exist_ok=True)
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': FORMAT_INDEX_VERSION, 'identity': identity, 'files': index}, f, indent=2)
+
+    if errors:
+        ctx.fatal('clang-format failed:\n' + '\n'.join(errors))
+
+    if not patch_content:
+        Logs.pprint('CYAN', 'Code style all good.')
+    elif ctx.options.format_behaviour == 'dry-run':
+        for diff in patch_content:
+            Logs.pprint('NORMAL', diff)
+        Logs.pprint('CYAN', f'Coding style violations found in {len(patch_content)} files')
+    elif ctx.options.format_behaviour == 'inplace-edit':
+        Logs.pprint('CYAN', f'{len(patch_content)} files formatted')
     elif ctx.options.format_behaviour == 'generate-patch':
-        cmd = cmd + ' -i '
-        patch_content = []
-
-        with tempfile.TemporaryDirectory() as tempdir:
-            for file in srcs:
-                # Copy the original file to a temporary location
-                original_file = os.path.join(tempdir, os.path.basename(file))
-                shutil.copy2(file, original_file)
-
-                # Format the file in place
-                ctx.exec_command(cmd + file)
-
-                # Generate the diff
-                diff = subprocess.run(['diff', '-u', original_file, file],
-                                      capture_output=True, text=True, check=False)
-                if diff.stdout:
-                    patch_content.append(diff.stdout)
-
-                # Restore the original file
-                shutil.copy2(original_file, file)
-
         # Save the patch content to a file
         patch_file_path = os.path.join(ctx.path.get_bld().relpath(), 'build', 'clang_format.patch')
-        if patch_content:
-            with open(patch_file_path, 'w', encoding='utf-8') as patch_file:
-                patch_file.writelines(patch_content)
-            Logs.pprint('CYAN', 'Coding style violations found, '
-                        f'patch file created: {patch_file_path}')
-        else:
-            Logs.pprint('CYAN', 'Code style all good.')
-
+        with open(patch_file_path, 'w', encoding='utf-8') as patch_file:
+            patch_file.writelines(patch_content)
+        Logs.pprint('CYAN', 'Coding style violations found, '
+                    f'patch file created: {patch_file_path}')
 
 
 class FormatSrcs(BuildContext):
@@ -7,12 +7,15 @@
 from waflib.Build import BuildContext, CleanContext
 from waflib.extras.clang_compilation_database import ClangDbContext
 
+from wbuild.support.analyze_support import AnalyzeContext
+
 
 def setup_environment(environments, additional_targets) -> None:
     # The setup_env function is responsible for setting up the debug and release environment
     # for applications (or libraries) build. It must be called during the init stage of the
     # application (or library) wscript.
-    # By default, configures debug and release environment for the build and clean target.
+    # By default, configures debug and release environment for the build, clean, clangdb and
+    # analyze targets.
     # Additional target which might be needed by the particular application can be passed as
     # argument to the function itself.
     # If the application does not want to set debug and release environment for special target,
@@ -24,7 +27,7 @@ def setup_environment(environments, additional_targets) -> None:
 
     # Create debug and release configuration
     for x in environments.split():
-        for y in (BuildContext, CleanContext, ClangDbContext):
+        for y in (BuildContext, CleanContext, ClangDbContext, AnalyzeContext):
             name = y.__name__.replace('Context', '').lower()
             class tmp(y):
                 cmd = name + '_' + x
@@ -41,6 +44,6 @@ def setup_environment(environments, additional_targets) -> None:
                     variant = x
 
     # Default to release if no configuration is passed
-    for y in (BuildContext, ClangDbContext):
+    for y in (BuildContext, ClangDbContext, AnalyzeContext):
         class tmp(y):
             variant = 'release'
@@ -0,0 +1,177 @@
+# !/usr/bin/env python
+# pylint: disable=too-many-statements, unused-argument, invalid-name, missing-class-docstring, too-few-public-methods
+# -*- coding: utf-8 -*-
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+
+import os
+import re
+
+from wbuild.support.design_config_support import get_l2_allocation
+
+# Regions of the linker scripts whose origin and length are set by the design configuration, by
+# region name. They are sized by the split of the L2 cache ways.
+L2_REGIONS = {
+    'LIM': 'lim',
+    'l2lim': 'lim',
+    'SCRATCH': 'scratchpad',
+    'scratchpad': 'scratchpad',
+}
+
+# Regions of the linker scripts checked against the memory map of the MSS Configurator XML, by
+# region name. They are never rewritten: the build is stopped if the design and the linker
+# script disagree.
+DDR_REGIONS = {
+    'DDR_C_LOW': 'DDR_32_CACHE',
+    'ddr_cached_32bit': 'DDR_32_CACHE',
+    'DDR_NC_LOW': 'DDR_32_NON_CACHE',
+    'ddr_non_cached_32bit': 'DDR_32_NON_CACHE',
+    'DDR_WCB_LOW': 'DDR_32_WCB',
+    'ddr_wcb_32bit': 'DDR_32_WCB',
+    'DDR_C_HI': 'DDR_64_CACHE',
+    'ddr_cached_38bit': 'DDR_64_CACHE',
+    'DDR_NC_HI': 'DDR_64_NON_CACHE',
+    'ddr_non_cached_38bit': 'DDR_64_NON_CACHE',
+    'DDR_WCB_HIGH': 'DDR_64_WCB',
+    'ddr_wcb_38bit': 'DDR_64_WCB',
+}
+
+# Size the MSS Configurator gives to the DDR entries of the memory map when the design does
+# not size them ("example instance"), which does not describe the memory of the board
+DDR_PLACEHOLDER_SIZE = 0x100000
+
+# Regular expressions
+_memory_block_re = re.compile(r'^MEMORY\s*\{(?P<body>.*?)^\}', re.MULTILINE | re.DOTALL)
+_region_re = re.compile(
+    r'^(?P<head>\s*(?P<name>\w+)\s*\([^)]*\)\s*:\s*ORIGIN\s*=\s*)(?P<origin>[^,]+?)(?P<sep>\s*,\s*LENGTH\s*=\s*)'
+    r'(?P<length>[^/\n]+?)(?P<tail>\s*(?:/\*.*)?)$', re.MULTILINE)
+_term_re = re.compile(r'\s*([+-]?)\s*(0x[\da-fA-F]+|\d+)([kKmM]?)\s*')
+
+
+def _eval_ld_expression(expression) -> int:
+    # Evaluate the origin or length of a memory region, made of numbers, possibly suffixed by K
+    # or M as in the linker scripts, added or subtracted
+    value = 0
+    position = 0
+    while position < len(expression.strip()):
+        match = _term_re.match(expression, position)
+        if not match:
+            raise ValueError(f'Unsupported expression in MEMORY: {expression}')
+        sign, number, suffix = match.groups()
+        number = int(number, 0) * {'': 1, 'k': 1024, 'm': 1024 * 1024}[suffix.lower()]
+        value += -number if sign == '-' else number
+        position = match.end()
+    return value
+
+
+def _format_size(size) -> str:
+    if size and size % (1024 * 1024) == 0:
+        return f'{size // (1024 * 1024)}M'
+    if size % 1024 == 0:
+        return f'{size // 1024}K'
+    return f'0x{size:X}'
+
+
+def _design_memory(design, source) -> tuple:
+    # Return the (origin, length) of an entry of the memory map of the design, or None if the
+    # design has no such entry or only a placeholder for it
+    for start, end, name in design['memory']:
+        if name == source and end - start != DDR_PLACEHOLDER_SIZE:
+            return start, end - start
+    return None
+
+
+def generate_linker_memory(design, script) -> tuple:
+    # The generate_linker_memory function sets the origin and length of the L2 memory regions
+    # of the MEMORY block of a linker script from the design configuration (see L2_REGIONS):
+    # the LIM is sized by the ways of the L2 cache not enabled for the cache, and the scratchpad
+    # by the ways reserved for it.
+    # The DDR regions (see DDR_REGIONS) are kept as written in the linker script, as the size of
+    # the DDR is a property of the board: they are only checked against the memory map of the
+    # MSS Configurator, when it sizes them (it usually only has placeholders).
+    # The other regions, such as the tightly integrated memories and the eNVM, are fixed by the
+    # silicon and left untouched.
+    # A ValueError is raised if a DDR region disagrees with the design, or if any two non empty
+    # regions overlap.
+    #
+    # Args:
+    #     :param design: The model of the design, see get_design_config
+    #     :param script: Content of the linker script
+    #
+    # Rets:
+    #     :return: The content of the linker script, and the dictionary of its memory regions
+    #              as (origin, length) tuples
+
+    memory_block = _memory_block_re.search(script)
+    if not memory_block:
+        raise ValueError('No MEMORY block found in the linker script')
+
+    l2_allocation = get_l2_allocation(design)
+    regions = {}
+
+    def _set_region(match):
+        origin, length = _eval_ld_expression(match['origin']), _eval_ld_expression(match['length'])
+        if match['name'] in DDR_REGIONS:
+            design_region = _design_memory(design, DDR_REGIONS[match['name']])
+            if design_region and design_region != (origin, length):
+                raise ValueError(f'Memory region {match["name"]} is 0x{origin:X}, {_format_size(length)} in the '
+                                 f'linker script, but 0x{design_region[0]:X}, {_format_size(design_region[1])} '
+                                 f'in the design')
+        design_region = l2_allocation.get(L2_REGIONS.get(match['name']))
+        if design_region is None:
+            regions[match['name']] = (origin, length)
+            return match.group(0)
+        regions[match['name']] = design_region
+        return (f'{match["head"]}0x{design_region[0]:08X}{match["sep"]}'
+                f'{_format_size(design_region[1])}{match["tail"]}')
+
+    body = _region_re.sub(_set_region, memory_block['body'])
+
+    non_empty = sorted((origin, origin + length, name) for name, (origin, length) in regions.items() if length)
+    for (_, end, name), (start, _, other) in zip(non_empty, non_empty[1:]):
+        if start < end:
+            raise ValueError(f'Memory regions {name} and {other} overlap')
+
+    script = script[:memory_block.start('body')] + body + script[memory_block.end('body'):]
+    return script, regions
+
+
+def write_linker_script(ctx, design, script_dir, script_name) -> str:
+    # The write_linker_script function generates, in the build directory, the linker script
+    # script_name.ld of script_dir, with its MEMORY block set from the design configuration,
+    # see generate_linker_memory. The linker script is only written if its content changes.
+    # The build is stopped if the memory regions overlap.
+    #
+    # Example usage:
+    #
+    #     script_path = write_linker_script(ctx, get_design_config(ctx, project), 'confs/linker', 'mpfs-envm')
+    #     link_flags.extend([f'-L{os.path.dirname(script_path)}', '-Tmpfs-envm.ld'])
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param design: The model of the design, see get_design_config
+    #     :param script_dir: Directory of the linker script, relative to the project root
+    #     :param script_name: Name of the linker script, without the .ld extension
+    #
+    # Rets:
+    #     :return: The path of the generated linker script
+
+    with open(os.path.join(ctx.path.abspath(), script_dir, f'{script_name}.ld'), encoding='utf-8') as f:
+        script = f.read()
+
+    try:
+        script, _ = generate_linker_memory(design, script)
+    except ValueError as error:
+        ctx.fatal(f'{script_name}.ld: {error}')
+
+    out_dir = os.path.join(ctx.path.get_bld().abspath(), 'linker')
+    out_path = os.path.join(out_dir, f'{script_name}.ld')
+    try:
+        with open(out_path, encoding='utf-8') as f:
+            if f.read() == script:
+                return out_path
+    except OSError:
+        pass
+    os.makedirs(out_dir, exist_ok=True)
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write(script)
+    return out_path
@@ -5,20 +5,254 @@
 # Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
 
 
+import concurrent.futures
+import contextlib
+import json
 import os
+import shlex
+import socket
 import sys
 import subprocess
 import shutil
+import signal
+import threading
 import time
 
 from waflib.Build import BuildContext
-from waflib import Logs
+from waflib import Errors, Logs, Utils
+
+# Name of the file holding the digests of the steps run in a fpgenprog project
+FPGENPROG_STATE_FILE = '.wbuild_fpgenprog_state.json'
+
+# fpgenprog steps which add to the project rather than set it up, e.g. envm_client adds a
+# client by name. They can not be run again on the project they have been run on, so the
+# project is generated from scratch whenever their inputs change
+FPGENPROG_ADDING_STEPS = ('envm_client',)
+
+# Interval between two polls of the OpenOCD GDB server port, in seconds
+OPENOCD_POLL_INTERVAL = 0.1
+
+# Time OpenOCD is given to exit gracefully before being killed, in seconds
+OPENOCD_STOP_TIMEOUT = 5
+
+# Name of the file, in the build directory, holding the state of the persistent debug server
+DEBUGSERVER_STATE_FILE = 'debugserver.json'
+
+# Name of the file, in the build directory, the persistent debug server logs to
+DEBUGSERVER_LOG_FILE = 'debugserver.log'
+
+
+def _openocd_command(ctx, gdb_port, probe=None) -> str:
+    # Build the OpenOCD command line, serving GDB on gdb_port. If a probe serial number is
+    # given, OpenOCD only attaches to that probe, and the telnet and tcl servers are disabled
+    # so that several OpenOCD instances can run side by side.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param gdb_port: Port of the GDB server
+    #     :param probe: Optional, serial number of the debug probe
+
+    command = ''.join(ctx.env.OPENOCD) + ' ' + ''.join(ctx.env.OPENOCD_ARGS) + \
+        f' --command "gdb_port {gdb_port}"'
+    if probe:
+        command += f' --command "{ctx.env.OPENOCD_PROBE_COMMAND} {probe}"' + \
+            ' --command "telnet_port disabled" --command "tcl_port disabled"'
+    return command
+
+
+def _gdb_load_command(ctx, elf_path, gdb_port, shutdown=True) -> str:
+    # Build the GDB command line loading elf_path trough the GDB server listening on gdb_port.
+    # If shutdown is set, the OpenOCD session is closed once the load is done.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param elf_path: Path to the ELF file to be loaded
+    #     :param gdb_port: Port of the GDB server
+    #     :param shutdown: Optional, whether to shut OpenOCD down after loading
+
+    return ''.join(ctx.env.GDB) + ' --nh ' + elf_path + ''.join(ctx.env.GDB_OPENOCD_INIT_FLAGS) + \
+        f' -ex "target extended-remote localhost:{gdb_port}"' + ''.join(ctx.env.GDB_OPENOCD_LOAD_FLAGS) + \
+        (''.join(ctx.env.GDB_OPENOCD_EXIT_FLAGS) if shutdown else ' -ex "detach" -ex "quit"')
+
+
+def _wait_for_gdb_server(process, gdb_port, timeout) -> bool:
+    # Poll the GDB server port until it accepts connections. Returns False if OpenOCD exits,
+    # or if the port is not open within timeout seconds.
+    #
+    # Args:
+    #     :param process: The OpenOCD process
+    #     :param gdb_port: Port of the GDB server
+    #     :param timeout: Timeout, in seconds
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection(('localhost', gdb_port), timeout=OPENOCD_POLL_INTERVAL):
+                return True
+        except OSError:
+            time.sleep(OPENOCD_POLL_INTERVAL)
+    return False
+
+
+def _stop_openocd(process) -> None:
+    # Stop OpenOCD, if still running, first gracefully and then forcefully
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=OPENOCD_STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+@contextlib.contextmanager
+def _openocd_server(ctx, gdb_port, probe=None, sink=None):
+    # The openocd_server context manager starts OpenOCD as a managed subprocess, waits until
+    # its GDB server accepts connections and yields the process. OpenOCD is stopped when the
+    # context is left, whatever the way it is left (including a keyboard interrupt).
+    # A WafError is raised if OpenOCD exits or does not open the GDB server port within
+    # --openocd-timeout seconds.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param gdb_port: Port of the GDB server
+    #     :param probe: Optional, serial number of the debug probe
+    #     :param sink: Optional, function called with each line of the OpenOCD output. If not
+    #                  given, OpenOCD writes to the console
+
+    process = subprocess.Popen(shlex.split(_openocd_command(ctx, gdb_port, probe)),
+                               stdout=subprocess.PIPE if sink else None,
+                               stderr=subprocess.STDOUT if sink else None,
+                               text=True, errors='replace')
+    pump = None
+    if sink:
+        pump = threading.Thread(target=lambda: [sink(line) for line in process.stdout], daemon=True)
+        pump.start()
+
+    try:
+        if not _wait_for_gdb_server(process, gdb_port, ctx.options.openocd_timeout):
+            raise Errors.WafError(f'OpenOCD GDB server not available on port {gdb_port} '
+                                  f'after {ctx.options.openocd_timeout}s')
+        yield process
+    finally:
+        _stop_openocd(process)
+        if pump:
+            pump.join()
+            process.stdout.close()
+
+
+def _pid_alive(pid) -> bool:
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def _read_debugserver_state(ctx) -> dict | None:
+    # Return the state of the persistent debug server started by debugserver_start, shaped as
+    # {'pid': 1234, 'gdb_port': 3333, 'probe': ''}, or None if no debug server is running.
+    # A state file left by a debug server which is gone is removed.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    state_path = os.path.join(ctx.out_dir, DEBUGSERVER_STATE_FILE)
+    if not os.path.exists(state_path):
+        return None
+
+    with open(state_path, encoding='utf-8') as f:
+        state = json.load(f)
+
+    if _pid_alive(state['pid']):
+        try:
+            with socket.create_connection(('localhost', state['gdb_port']), timeout=OPENOCD_POLL_INTERVAL):
+                return state
+        except OSError:
+            pass
+
+    os.remove(state_path)
+    return None
+
+
+def _get_single_probe(ctx) -> str:
+    probes = [probe for probe in ctx.options.probes.split(',') if probe]
+    if len(probes) > 1:
+        ctx.fatal('The debug server can be started for a single probe only')
+    return probes[0] if probes else ''
+
+
+def _program_probe(ctx, elf_path, probe, gdb_port) -> tuple:
+    # Program a single board of the fleet, streaming the OpenOCD and GDB output to the
+    # console, prefixed by the probe serial number, and to build/<variant>/program_<probe>.log.
+    # This runs in a worker thread.
+    #
+    # Rets:
+    #     :return: Tuple holding the probe, the GDB port, the exit code and the elapsed time
+
+    log_path = os.path.join(ctx.variant_dir, f'program_{probe}.log')
+    start = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        def sink(line):
+            log.write(line)
+            Logs.info(f'[{probe}] {line.rstrip()}')
+
+        try:
+            with _openocd_server(ctx, gdb_port, probe, sink):
+                with subprocess.Popen(shlex.split(_gdb_load_command(ctx, elf_path, gdb_port)),
+                                      stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                      text=True, errors='replace') as process:
+                    for line in process.stdout:
+                        sink(line)
+                returncode = process.returncode
+        except Errors.WafError as e:
+            sink(f'{e}\n')
+            returncode = 1
+    return probe, gdb_port, returncode, time.perf_counter() - start
+
+
+def _load_ram_fleet(ctx, elf_path, probes) -> None:
+    # Program the ELF file into the RAM of several boards at once. Each probe gets its own
+    # OpenOCD and GDB pair, with GDB ports assigned incrementally from --gdb-port, and at
+    # most --probe-jobs boards are programmed concurrently.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param elf_path: Path to the ELF file to be loaded
+    #     :param probes: List of the serial numbers of the debug probes
+
+    jobs = ctx.options.probe_jobs or len(probes)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(_program_probe, ctx, elf_path, probe, ctx.options.gdb_port + index)
+                   for index, probe in enumerate(probes)]
+        results = [future.result() for future in futures]
+
+    tilde = '~' * 62
+    Logs.pprint('YELLOW', tilde)
+    Logs.pprint('NORMAL', f'{"   Probe":<30s}{"GDB port":>10s}{"Result":>10s}{"Time [s]":>12s}')
+    Logs.pprint('YELLOW', tilde)
+    for probe, gdb_port, returncode, elapsed in results:
+        Logs.pprint('GREEN' if not returncode else 'RED',
+                    f'{"   " + probe:<30s}{gdb_port:>10d}{"PASS" if not returncode else "FAIL":>10s}'
+                    f'{elapsed:>12.2f}')
+    Logs.pprint('YELLOW', tilde + '\n')
+
+    failed = [probe for probe, _, returncode, _ in results if returncode]
+    if failed:
+        ctx.fatal(f'Programming failed for {len(failed)} of {len(probes)} boards: {", ".join(failed)}')
 
 
 def load_ram(ctx):
     # The program_openocd fuction just calls the OpenOCD debugger, passing the built ELF file,
-    # which is directly loaded into RAM after a 10s timeout to allow the user to reboot/push
-    # the programming button on the hardware board.
+    # which is directly loaded into RAM as soon as the OpenOCD GDB server accepts connections.
+    # If the --reset-countdown option is given, a countdown is shown first to allow the user
+    # to reboot/push the programming button on the hardware board.
+    # If the --probes option is given, all the listed boards are programmed concurrently,
+    # and a summary of the outcome for each board is printed.
+    # If a debug server has been started with debugserver_start, the ELF file is loaded
+    # trough it, and the debug server is left running.
     #
     # Args:
     #     :param ctx: The WAF context
@@ -26,22 +260,32 @@ def load_ram(ctx):
     if ctx.env.OPENOCD:
         elf_path = os.path.join(ctx.variant_dir, ctx.env.name + '.elf')
         if os.path.exists(elf_path):
-            Logs.pprint('RED', '\n########################\n' + \
-                        'HOLD PROGRAMMING BUTTON\n' + \
-                        '########################\n')
+            if ctx.options.reset_countdown:
+                Logs.pprint('RED', '\n########################\n' + \
+                            'HOLD PROGRAMMING BUTTON\n' + \
+                            '########################\n')
 
-            # Use red color for the STDOUT
-            sys.stdout.write("\033[1;31m")
-            for remaining in range(10, -1, -1):
-                sys.stdout.write('\r')
-                sys.stdout.write(f'Programming in {remaining}:2d')
-                sys.stdout.flush()
-                time.sleep(1)
+                # Use red color for the STDOUT
+                sys.stdout.write("\033[1;31m")
+                for remaining in range(ctx.options.reset_countdown, -1, -1):
+                    sys.stdout.write('\r')
+                    sys.stdout.write(f'Programming in {remaining:2d}')
+                    sys.stdout.flush()
+                    time.sleep(1)
 
             Logs.pprint('RED', '\n\n#####\n\n Programming Hardware board\n\n#####\n\n')
-            ctx.exec_command(''.join(ctx.env.OPENOCD) + ' ' + ''.join(ctx.env.OPENOCD_ARGS) +
-                            ' & ' + ''.join(ctx.env.GDB) + ' --nh ' + elf_path +
-                            ''.join(ctx.env.GDB_OPENOCD_FLAGS))
+            probes = [probe for probe in ctx.options.probes.split(',') if probe]
+            debugserver = None if probes else _read_debugserver_state(ctx)
+            if probes:
+                _load_ram_fleet(ctx, elf_path, probes)
+            elif debugserver:
+                Logs.pprint('CYAN', f'Loading trough the debug server on port {debugserver["gdb_port"]}')
+                if ctx.exec_command(_gdb_load_command(ctx, elf_path, debugserver['gdb_port'], shutdown=False)):
+                    ctx.fatal('GDB failed to load the application')
+            else:
+                with _openocd_server(ctx, ctx.options.gdb_port):
+                    if ctx.exec_command(_gdb_load_command(ctx, elf_path, ctx.options.gdb_port)):
+                        ctx.fatal('GDB failed to load the application')
 
             Logs.pprint('GREEN', '\n\n#####\n\n Programming completed\n\n#####\n\n')
         else:
@@ -50,11 +294,143 @@ def load_ram(ctx):
         ctx.fatal('OpenOCD has not been found during the configuration stage')
 
 
+def debugserver_start(ctx):
+    # The debugserver_start function starts OpenOCD in background, as a persistent debug
+    # server which outlives the waf invocation. The state of the debug server (pid and GDB
+    # port) is stored in build/debugserver.json, and its output goes to build/debugserver.log.
+    # Until debugserver_stop is called, the program command loads the application trough
+    # this debug server, saving the JTAG initialization and target examination of a fresh
+    # OpenOCD on each load.
+    #
+    # Example usage:
+    #
+    #     waf debugserver_start --probes=A1B2
+    #     waf program
+    #     waf debugserver_stop
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    if not ctx.env.OPENOCD:
+        ctx.fatal('OpenOCD has not been found during the configuration stage')
+
+    state = _read_debugserver_state(ctx)
+    if state:
+        Logs.warn(f'Debug server already running, pid {state["pid"]}, GDB port {state["gdb_port"]}')
+        return
+
+    probe = _get_single_probe(ctx)
+    log_path = os.path.join(ctx.out_dir, DEBUGSERVER_LOG_FILE)
+    with open(log_path, 'w', encoding='utf-8') as log:
+        process = subprocess.Popen(shlex.split(_openocd_command(ctx, ctx.options.gdb_port, probe)),
+                                   stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                                   start_new_session=True)
+
+    if not _wait_for_gdb_server(process, ctx.options.gdb_port, ctx.options.openocd_timeout):
+        _stop_openocd(process)
+        ctx.fatal(f'OpenOCD GDB server not available on port {ctx.options.gdb_port} after '
+                  f'{ctx.options.openocd_timeout}s, see {log_path}')
+
+    with open(os.path.join(ctx.out_dir, DEBUGSERVER_STATE_FILE), 'w', encoding='utf-8') as f:
+        json.dump({'pid': process.pid, 'gdb_port': ctx.options.gdb_port, 'probe': probe}, f)
+
+    Logs.pprint('GREEN', f'Debug server started, pid {process.pid}, GDB port {ctx.options.gdb_port}')
+
+
+def debugserver_stop(ctx):
+    # The debugserver_stop function stops the persistent debug server started by
+    # debugserver_start, first gracefully and then forcefully.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    state = _read_debugserver_state(ctx)
+    if not state:
+        Logs.warn('No debug server running')
+        return
+
+    os.kill(state['pid'], signal.SIGTERM)
+    deadline = time.monotonic() + OPENOCD_STOP_TIMEOUT
+    while _pid_alive(state['pid']) and time.monotonic() < deadline:
+        time.sleep(OPENOCD_POLL_INTERVAL)
+    if _pid_alive(state['pid']):
+        os.kill(state['pid'], signal.SIGKILL)
+
+    os.remove(os.path.join(ctx.out_dir, DEBUGSERVER_STATE_FILE))
+    Logs.pprint('GREEN', f'Debug server stopped, pid {state["pid"]}')
+
+
+def _run_cached_fpgenprog_steps(ctx, project_dir_path, steps) -> None:
+    # The run_cached_fpgenprog_steps function runs the fpgenprog steps needed to generate
+    # a project, skipping those which have already been run with the same inputs.
+    # The digest of the inputs of each step, chained with the digests of the steps before
+    # it, is stored in a state file inside the project directory once the step succeeds.
+    # Steps are then run starting from the first one whose digest does not match the stored
+    # one. If that is the very first step, or a step adding to the project which can not be
+    # run twice (see FPGENPROG_ADDING_STEPS), the project directory is deleted and the project
+    # is generated from scratch.
+    #
+    # The run_cached_fpgenprog_steps is a private function, and it is not meant to be called
+    # outside this module.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param project_dir_path: Absolute path of the fpgenprog project directory
+    #     :param steps: List of (name, inputs, command) tuples, in execution order
+
+    state_path = os.path.join(project_dir_path, FPGENPROG_STATE_FILE)
+
+    stored_digests = {}
+    if os.path.exists(state_path):
+        with open(state_path, encoding='utf-8') as f:
+            stored_digests = json.load(f)
+
+    digest = ''
+    digests = {}
+    first_changed = None
+    for index, (name, inputs, _) in enumerate(steps):
+        digest = Utils.h_list([digest, name] + inputs).hex()
+        digests[name] = digest
+        if first_changed is None and stored_digests.get(name) != digest:
+            first_changed = index
+
+    if first_changed is None:
+        Logs.pprint('CYAN', 'fpgenprog project is up to date, reusing it')
+        return
+
+    if steps[first_changed][0] in FPGENPROG_ADDING_STEPS:
+        first_changed = 0
+
+    if first_changed == 0:
+        stored_digests = {}
+        if os.path.isdir(project_dir_path):
+            shutil.rmtree(project_dir_path)
+
+    for name, _, command in steps[first_changed:]:
+        # Invalidate the step before running it, so that a failure is not mistaken as
+        # success by the next run
+        stored_digests.pop(name, None)
+        if os.path.isdir(project_dir_path):
+            with open(state_path, 'w', encoding='utf-8') as f:
+                json.dump(stored_digests, f)
+
+        if ctx.exec_command(command):
+            ctx.fatal(f'fpgenprog {name} failed')
+
+        stored_digests[name] = digests[name]
+        with open(state_path, 'w', encoding='utf-8') as f:
+            json.dump(stored_digests, f)
+
+
 def load_envm(ctx):
     # The program_fpgenprog function just calls the fpgenprog binary, with the required
     # steps to program the ENVM memory.
     # The steps which are run in this function have been reverse engineered from
     # mpfsbootmodeprogrammer jar which is shipped with Softconsole IDE.
+    # The generated fpgenprog project is kept across runs, and only the steps whose inputs
+    # changed (target die and package, boot configuration, payload) are run again.
+    # If the --fpgenprog-dry-run option is given, the programming files are generated but
+    # the board is not programmed.
     #
     # Args:
     #     :param ctx: The WAF context
@@ -101,31 +477,45 @@ def load_envm(ctx):
             # Compute the binary payload total size, will be passed to envm_client generation step
             payload_total_size = str(os.stat(bin_payload_path).st_size)
 
-            # In case the user is going to do several dirty build - we always need to
-            # regenerate the project, so make sure to eliminate the project folder if it exists
-            if os.path.exists(fpgenproject_dir_path) and os.path.isdir(fpgenproject_dir_path):
-                shutil.rmtree(fpgenproject_dir_path)
+            fpgenprog = ''.join(ctx.env.FPGENPROG)
 
             # Actual ENVM programming steps.
             # Don't mess with it if you don't exactly know what you are doing.
             # It will surely eat your cat!
-            ctx.exec_command(''.join(ctx.env.FPGENPROG) + ' new_project --location ' +
-                            fpgenproject_dir_path + ' --target_die ' + target_die +
-                            ' --target_package ' + ctx.options.target_package)
-            ctx.exec_command(''.join(ctx.env.FPGENPROG) + ' mss_boot_info --location ' +
-                            fpgenproject_dir_path + ' --u_mss_bootmode ' + mss_bootmode +
-                            ' --u_mss_bootcfg ' + mss_bootcfg)
-            ctx.exec_command(''.join(ctx.env.FPGENPROG) + ' envm_client --location ' +
-                            fpgenproject_dir_path + ' --number_of_bytes ' + payload_total_size +
-                            ' --content_file_format intel-hex --content_file ' + hex_payload_path +
-                            ' --start_page ' + start_page + ' --client_name ' + client_name +
-                            ' --mem_file_base_address ' + envm_base_address)
-            ctx.exec_command(''.join(ctx.env.FPGENPROG) + ' generate_bitstream --location ' +
-                            fpgenproject_dir_path,
-                            )
-            ctx.exec_command(''.join(ctx.env.FPGENPROG) + ' run_action --location ' +
-                            fpgenproject_dir_path + ' --action PROGRAM',
-                            )
+            # Each step comes with the inputs it depends on. If the inputs of a step and
+            # of all the steps before it did not change since the last run, the project
+            # generated back then is reused and the step is skipped.
+            steps = [
+                ('new_project',
+                 [target_die, ctx.options.target_package],
+                 fpgenprog + ' new_project --location ' + fpgenproject_dir_path +
+                 ' --target_die ' + target_die + ' --target_package ' + ctx.options.target_package),
+                ('mss_boot_info',
+                 [mss_bootmode, mss_bootcfg],
+                 fpgenprog + ' mss_boot_info --location ' + fpgenproject_dir_path +
+                 ' --u_mss_bootmode ' + mss_bootmode + ' --u_mss_bootcfg ' + mss_bootcfg),
+                ('envm_client',
+                 [payload_total_size, Utils.h_file(hex_payload_path).hex(), start_page, client_name,
+                  envm_base_address],
+                 fpgenprog + ' envm_client --location ' + fpgenproject_dir_path +
+                 ' --number_of_bytes ' + payload_total_size +
+                 ' --content_file_format intel-hex --content_file ' + hex_payload_path +
+                 ' --start_page ' + start_page + ' --client_name ' + client_name +
+                 ' --mem_file_base_address ' + envm_base_address),
+                ('generate_bitstream',
+                 [],
+                 fpgenprog + ' generate_bitstream --location ' + fpgenproject_dir_path),
+            ]
+            _run_cached_fpgenprog_steps(ctx, fpgenproject_dir_path, steps)
+
+            if ctx.options.fpgenprog_dry_run:
+                Logs.pprint('GREEN', 'Dry run, the board has not been programmed. Programming files '
+                            f'are available in {fpgenproject_dir_path}')
+                return
+
+            if ctx.exec_command(fpgenprog + ' run_action --location ' +
+                                fpgenproject_dir_path + ' --action PROGRAM'):
+                ctx.fatal('fpgenprog run_action failed')
         else:
             ctx.fatal('You need to generate bootmode1 payload before being able' +
                       'to program the board')
@@ -148,3 +538,17 @@ class Program(BuildContext):
     cmd = 'program'
     fun = 'program'
     variant = 'release'
+
+
+class DebugServerStart(BuildContext):
+    '''starts OpenOCD as a persistent debug server used by program'''
+    cmd = 'debugserver_start'
+    fun = 'debugserver_start'
+    variant = 'release'
+
+
+class DebugServerStop(BuildContext):
+    '''stops the persistent debug server'''
+    cmd = 'debugserver_stop'
+    fun = 'debugserver_stop'
+    variant = 'release'
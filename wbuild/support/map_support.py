@@ -0,0 +1,299 @@
+# !/usr/bin/env python
+# pylint: disable=too-many-statements, unused-argument, invalid-name, missing-class-docstring, too-few-public-methods
+# -*- coding: utf-8 -*-
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+
+import bisect
+import os
+import pickle
+import re
+
+# Bump whenever the layout of the parsed map changes, so that stale caches are discarded
+MAP_CACHE_VERSION = 1
+
+# Suffix of the cache file which is stored next to the parsed map file
+MAP_CACHE_SUFFIX = '.cache'
+
+_MEM_CONF = 'Memory Configuration'
+_LINKER_CONF = 'Linker script and memory map'
+
+# Regular expressions
+_memory_re = re.compile(
+    r'(?P<memName>\w+)\s+(?P<memOrig>0x[\da-fA-F]+)\s+(?P<memLgt>0x[\da-fA-F]+)')
+_out_sect_re_one_line = re.compile(
+    r'(?P<sectName>\.[\S.]+)\s+(?P<sectStart>0x[\da-fA-F]+)\s+(?P<sectSize>0x[\da-fA-F]+)')
+_out_sect_re_two_lines1 = re.compile(r'(?P<sectName>\.[\S.]+)$')
+_out_sect_re_two_lines2 = re.compile(
+    r'\s+(?P<sectStart>0x[\da-fA-F]+)\s+(?P<sectSize>0x[\da-fA-F]+)')
+_fill_re = re.compile(r' \*fill\*\s+(?P<fillAdd>0x[\da-fA-F]+)\s+(?P<fillLgt>0x[\da-fA-F]+)')
+
+# Regular expressions for the input sections and the symbols they define
+_in_sect_re_one_line = re.compile(
+    r' (?P<sectName>[.\w][\S]*)\s+(?P<sectStart>0x[\da-fA-F]+)\s+(?P<sectSize>0x[\da-fA-F]+)\s+(?P<object>\S.*)$')
+_in_sect_re_two_lines1 = re.compile(r' (?P<sectName>[.\w][\S]*)$')
+_in_sect_re_two_lines2 = re.compile(
+    r'\s+(?P<sectStart>0x[\da-fA-F]+)\s+(?P<sectSize>0x[\da-fA-F]+)\s+(?P<object>\S.*)$')
+_symbol_re = re.compile(r'\s{16,}(?P<symAddr>0x[\da-fA-F]+)\s+(?P<symName>[^\s=()]+)$')
+
+# In process cache, keyed by map file path
+_map_cache = {}
+
+
+def _assign_sections_to_memories(memory, out_sect) -> None:
+    # For every output section, find the memory region holding its start address and add the
+    # section size to the memory usage. Memory regions are sorted by origin, so the lookup is
+    # a bisection instead of a scan over all the regions.
+    #
+    # Args:
+    #     :param memory: Dictionary of the memory regions
+    #     :param out_sect: Dictionary of the output sections
+
+    regions = sorted(memory.items(), key=lambda item: item[1]['origin'])
+    origins = [mem_data['origin'] for _, mem_data in regions]
+
+    for sec_data in out_sect.values():
+        sec_data['memory'] = ''
+        index = bisect.bisect_right(origins, sec_data['start']) - 1
+        if index < 0:
+            continue
+        mem_name, mem_data = regions[index]
+        if sec_data['start'] < mem_data['origin'] + mem_data['length']:
+            sec_data['memory'] = mem_name
+            mem_data['used'] += sec_data['size']
+
+
+def _parse_map_lines(lines) -> dict:
+    # Parse the lines of a GNU ld map file in a single pass.
+    #
+    # Args:
+    #     :param lines: Iterable over the lines of the map file
+    #
+    # Rets:
+    #     :return: Dictionary holding the memory regions and the output sections
+
+    memory = {}
+    out_sect = {}
+
+    scan_phase = ''
+
+    # Keep track of last encountered output section, and of the name of an output section
+    # whose address and size are on the following line
+    last_out_sec = ''
+    pending_out_sec = ''
+
+    for line in lines:
+
+        # Output section (second line)
+        if pending_out_sec:
+            match = _out_sect_re_two_lines2.match(line)
+            if match:
+                last_out_sec = pending_out_sec
+                out_sect[last_out_sec] = {
+                    'size': int(match['sectSize'], 16),
+                    'start': int(match['sectStart'], 16),
+                    'fill': 0,
+                }
+                pending_out_sec = ''
+                continue
+            pending_out_sec = ''
+
+        # Recognise sections of the map file
+        if line.startswith(_MEM_CONF):
+            scan_phase = 'scanMemories'
+        elif line.startswith(_LINKER_CONF):
+            scan_phase = ''
+        elif line.startswith('.'):
+            scan_phase = 'scanOutSections'
+
+        # Analysis
+        if scan_phase == 'scanMemories':
+            match = _memory_re.match(line)
+            if match:
+                memory[match['memName']] = {
+                    'origin': int(match['memOrig'], 16),
+                    'length': int(match['memLgt'], 16),
+                    'used': 0,
+                }
+
+        elif scan_phase == 'scanOutSections':
+            # Output section (one line)
+            match = _out_sect_re_one_line.match(line)
+            if match:
+                if match['sectName'] not in out_sect:
+                    last_out_sec = match['sectName']
+                    out_sect[last_out_sec] = {
+                        'size': int(match['sectSize'], 16),
+                        'start': int(match['sectStart'], 16),
+                        'fill': 0,
+                    }
+                continue
+
+            # Output section (first line)
+            match = _out_sect_re_two_lines1.match(line)
+            if match:
+                pending_out_sec = match['sectName']
+                continue
+
+            # Filled bytes
+            match = _fill_re.match(line)
+            if match and last_out_sec:
+                out_sect[last_out_sec]['fill'] += int(match['fillLgt'], 16)
+
+    _assign_sections_to_memories(memory, out_sect)
+
+    return {'memory': memory, 'sections': out_sect}
+
+
+def parse_map_file(map_path, use_cache=True) -> dict:
+    # The parse_map_file function parses a GNU ld map file and returns the memory regions
+    # declared in the linker script, together with the output sections placed in them.
+    # The returned dictionary is shaped as follows:
+    #
+    #     {
+    #         'memory': {
+    #             'LIM': {'origin': 0x08000000, 'length': 131072, 'used': 2048},
+    #             ...
+    #         },
+    #         'sections': {
+    #             '.text': {'start': 0x20220100, 'size': 1024, 'fill': 3, 'memory': 'ENVM'},
+    #             ...
+    #         },
+    #     }
+    #
+    # The parsed result is cached, both in process and in a pickle file stored next to the
+    # map file, keyed on the map file modification time and size. Repeated calls on an
+    # unchanged map file, either from the same build or from later ones, do not reparse it.
+    #
+    # Example usage:
+    #
+    #     parsed_map = parse_map_file(os.path.join(ctx.variant_dir, ctx.env.name + '.map'))
+    #     for mem_name, mem_data in parsed_map['memory'].items():
+    #         ...
+    #
+    # Args:
+    #     :param map_path: Path to the map file
+    #     :param use_cache: Whether to use the cached result, if valid, or not
+    #
+    # Rets:
+    #     :return: Dictionary holding the memory regions and the output sections
+
+    stat = os.stat(map_path)
+    key = (MAP_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+    cache_path = map_path + MAP_CACHE_SUFFIX
+
+    if use_cache:
+        cached = _map_cache.get(map_path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                cached = pickle.load(cache_file)
+            if cached[0] == key:
+                _map_cache[map_path] = cached
+                return cached[1]
+        except (OSError, pickle.UnpicklingError, EOFError, IndexError, TypeError):
+            pass
+
+    with open(map_path, 'r', encoding='utf-8') as map_file:
+        parsed_map = _parse_map_lines(map_file)
+
+    _map_cache[map_path] = (key, parsed_map)
+    try:
+        with open(cache_path, 'wb') as cache_file:
+            pickle.dump((key, parsed_map), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+    return parsed_map
+
+
+def iter_input_sections(map_path):
+    # The iter_input_sections generator streams the input sections of a GNU ld map file, that
+    # is the contribution of each object file to each output section, together with the global
+    # symbols the map lists for it. The map file is read line by line and nothing is retained
+    # between two input sections, so memory usage does not depend on the map size.
+    # Each input section is yielded as a dictionary shaped as follows:
+    #
+    #     {
+    #         'output': '.text',
+    #         'section': '.text.main',
+    #         'start': 0x20220200,
+    #         'size': 64,
+    #         'object': 'src/main.c.1.o',
+    #         'symbols': [(0x20220200, 'main')],
+    #     }
+    #
+    # Only the input sections placed in the linker script and memory map part of the file are
+    # yielded, so discarded input sections are skipped. Fill bytes are not reported.
+    #
+    # Example usage:
+    #
+    #     for input_section in iter_input_sections(map_path):
+    #         by_object[input_section['object']] += input_section['size']
+    #
+    # Args:
+    #     :param map_path: Path to the map file
+    #
+    # Rets:
+    #     :return: Generator of the input sections
+
+    in_memory_map = False
+    output = ''
+    current = None
+    pending_in_sect = ''
+
+    with open(map_path, 'r', encoding='utf-8') as map_file:
+        for line in map_file:
+            line = line.rstrip('\n')
+
+            if not in_memory_map:
+                in_memory_map = line.startswith(_LINKER_CONF)
+                continue
+
+            # Input section (second line)
+            if pending_in_sect:
+                match = _in_sect_re_two_lines2.match(line)
+                if match:
+                    current = {'output': output, 'section': pending_in_sect,
+                               'start': int(match['sectStart'], 16), 'size': int(match['sectSize'], 16),
+                               'object': match['object'], 'symbols': []}
+                    pending_in_sect = ''
+                    continue
+                pending_in_sect = ''
+
+            # Symbol defined in the current input section
+            if current is not None:
+                match = _symbol_re.match(line)
+                if match:
+                    current['symbols'].append((int(match['symAddr'], 16), match['symName']))
+                    continue
+
+            # Any other line ends the current input section
+            if current is not None and not line.startswith('                '):
+                yield current
+                current = None
+
+            if line and not line[0].isspace():
+                # Output section, or any other top level statement
+                output = line.split()[0] if line.startswith('.') else ''
+                continue
+
+            if not output:
+                continue
+
+            match = _in_sect_re_one_line.match(line)
+            if match:
+                if current is not None:
+                    yield current
+                current = {'output': output, 'section': match['sectName'],
+                           'start': int(match['sectStart'], 16), 'size': int(match['sectSize'], 16),
+                           'object': match['object'], 'symbols': []}
+                continue
+
+            match = _in_sect_re_two_lines1.match(line)
+            if match:
+                pending_in_sect = match['sectName']
+
+        if current is not None:
+            yield current
@@ -40,7 +40,144 @@ def add_common_app_options(ctx) -> None:
                               action='store_true',
                               default='false',
                               help='Wether this application is bootloader or not')
+    common_app_opt.add_option('--boot-mode',
+                              action='store',
+                              choices=['xip', 'copy-to-lim'],
+                              default=None,
+                              help='Configure option. Specify how the application runs from eNVM: xip '
+                                   '(default) executes in place, copy-to-lim copies the code to LIM at '
+                                   'startup and runs it from there (see the copy_to_lim_script of the '
+                                   'linker entry of project.yml). To change it, run waf configure again: '
+                                   'builds fail if given a boot mode other than the configured one')
     add_envm_programming_options(ctx)
+    add_openocd_programming_options(ctx)
+    add_size_budget_options(ctx)
+    add_compile_options(ctx)
+    add_format_options(ctx)
+
+
+def add_format_options(ctx) -> None:
+    # The add_format_options add all those options which are related to the formatting of
+    # the sources with clang-format, trough the format_srcs command.
+    # The options configured trough the add_format_options function
+    # ARE NOT MEANT TO BE PASSED TROUGH THE USE OF project.yml.
+    # The user is ONLY allowed to override the defaults from the command line.
+    # For the documentation of what each option is doing, refer to the option documentation.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    format_opt = ctx.add_option_group('Formatting options')
+    format_opt.add_option('--format-behaviour',
+                          action='store',
+                          choices=['dry-run', 'inplace-edit', 'generate-patch'],
+                          default='generate-patch',
+                          help='Whether format_srcs prints the coding style violations, fixes '
+                               'them in the sources, or stores them in build/clang_format.patch')
+    format_opt.add_option('--format-jobs',
+                          action='store',
+                          type='int',
+                          default=0,
+                          help='Number of clang-format processes run in parallel by format_srcs. '
+                               'Defaults to the number of cores')
+
+
+def add_compile_options(ctx) -> None:
+    # The add_compile_options add all those options which are related to the compilation
+    # of the sources, such as the compile cache and the header dependencies tracking.
+    # The options configured trough the add_compile_options function
+    # ARE NOT MEANT TO BE PASSED TROUGH THE USE OF project.yml.
+    # The user is ONLY allowed to override the defaults from the command line.
+    # For the documentation of what each option is doing, refer to the option documentation.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    compile_opt = ctx.add_option_group('Compilation options')
+    compile_opt.add_option('--compile-cache',
+                           action='store',
+                           default=os.environ.get('WBUILD_COMPILE_CACHE', ''),
+                           help='Directory of the compile cache, which is disabled if not given. '
+                                'Defaults to the WBUILD_COMPILE_CACHE environment variable')
+    compile_opt.add_option('--compile-cache-size',
+                           action='store',
+                           type='int',
+                           default=2048,
+                           help='Maximum size of the compile cache, in MB. The least recently '
+                                'used objects are evicted beyond it')
+    compile_opt.add_option('--header-deps',
+                           action='store',
+                           choices=['scan', 'compiler'],
+                           default='scan',
+                           help='How the headers included by each source are found: scan runs the '
+                                'waf preprocessor on every build, compiler reads the depfiles '
+                                'written by the compiler (-MMD) on the previous build')
+    compile_opt.add_option('--no-unity',
+                           action='store_true',
+                           default=False,
+                           help='Compile each source on its own, even for the modules whose '
+                                'sources.yml asks for a unity build')
+
+
+def add_openocd_programming_options(ctx) -> None:
+    # The add_openocd_programming_options add all those options which are related to the
+    # programming of the boards trough OpenOCD and GDB.
+    # The options configured trough the add_openocd_programming_options function
+    # ARE NOT MEANT TO BE PASSED TROUGH THE USE OF project.yml.
+    # The user is ONLY allowed to override the defaults from the command line.
+    # For the documentation of what each option is doing, refer to the option documentation.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    openocd_prg_opt = ctx.add_option_group('OpenOCD programming options')
+    openocd_prg_opt.add_option('--probes',
+                               action='store',
+                               default='',
+                               help='Comma separated serial numbers of the debug probes to be '
+                                    'programmed concurrently, e.g. --probes=A1B2,C3D4')
+    openocd_prg_opt.add_option('--probe-jobs',
+                               action='store',
+                               type='int',
+                               default=0,
+                               help='Maximum number of boards programmed concurrently, defaults to '
+                                    'the number of probes')
+    openocd_prg_opt.add_option('--gdb-port',
+                               action='store',
+                               type='int',
+                               default=3333,
+                               help='Port of the OpenOCD GDB server. When programming several '
+                                    'probes, the following ports are used too')
+    openocd_prg_opt.add_option('--openocd-timeout',
+                               action='store',
+                               type='float',
+                               default=10,
+                               help='Time, in seconds, OpenOCD is given to open the GDB server port')
+    openocd_prg_opt.add_option('--reset-countdown',
+                               action='store',
+                               type='int',
+                               default=0,
+                               help='Show a countdown of the given seconds before programming, to '
+                                    'allow holding the programming button of the board')
+
+
+def add_size_budget_options(ctx) -> None:
+    # The add_size_budget_options add all those options which are related to the size
+    # budget of the applications built with this build system.
+    # The options configured trough the add_size_budget_options function
+    # ARE NOT MEANT TO BE PASSED TROUGH THE USE OF project.yml.
+    # The user is ONLY allowed to override the defaults from the command line.
+    # For the documentation of what each option is doing, refer to the option documentation.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    size_budget_opt = ctx.add_option_group('Size budget options')
+    size_budget_opt.add_option('--update-size-baseline',
+                               action='store_true',
+                               default=False,
+                               help='Store the size report of the last build as the new baseline '
+                                    'when running size_diff')
 
 
 def add_envm_programming_options(ctx) -> None:
@@ -61,6 +198,16 @@ def add_envm_programming_options(ctx) -> None:
                             choices=['FCVG484', 'FCSG536'],
                             default='FCVG484',
                             help='Package of the Polarfire SoC')
+    envm_prg_opt.add_option('--objcopy-hex',
+                            action='store_true',
+                            default=False,
+                            help='Generate the bootmode1 intel hex payload with objcopy instead of '
+                                 'the builtin encoder')
+    envm_prg_opt.add_option('--fpgenprog-dry-run',
+                            action='store_true',
+                            default=False,
+                            help='Generate the fpgenprog programming files without programming '
+                                 'the board')
 
 
 def add_common_library_options(ctx) -> None:
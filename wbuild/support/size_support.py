@@ -0,0 +1,281 @@
+# !/usr/bin/env python
+# pylint: disable=too-many-statements, unused-argument, invalid-name, missing-class-docstring, too-few-public-methods
+# -*- coding: utf-8 -*-
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+
+import json
+import os
+import re
+
+from waflib.Build import BuildContext
+from waflib import Logs
+
+from wbuild.support.configure_support import parse_project_keys
+
+# Defaults of the size_budget entry of project.yml
+DEFAULT_BASELINE_DIR = os.path.join('confs', 'size_baseline')
+DEFAULT_TOP_SYMBOLS = 20
+
+# Linker script symbols delimiting the stack of each hart
+_stack_symbol_re = re.compile(r'__stack_(?P<edge>bottom|top)_h(?P<hart>\d+)\$')
+
+
+def _get_size_budget(ctx) -> dict:
+    # Return the size_budget entry of project.yml, or an empty dictionary if not present.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    project, _ = parse_project_keys(ctx)
+    return (project or {}).get('size_budget') or {}
+
+
+def _get_report_path(ctx) -> str:
+    return os.path.join(ctx.variant_dir, f'{ctx.env.name}_size.json')
+
+
+def _get_baseline_path(ctx, size_budget) -> str:
+    baseline_dir = size_budget.get('baseline', DEFAULT_BASELINE_DIR)
+    return os.path.join(ctx.path.abspath(), baseline_dir, f'{ctx.variant}.json')
+
+
+def _load_json(path) -> dict | None:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_size_report(ctx, elf, symbols, parsed_map) -> dict:
+    # The write_size_report function writes a machine-readable report of the memory footprint
+    # of the application to build/<variant>/<name>_size.json, and returns it.
+    # The report holds:
+    #
+    #     * elf: the text, data and bss totals
+    #     * sections: size, fill bytes, start address and memory of each output section
+    #     * memory: origin, length, used, free and fill bytes of each memory region
+    #     * stacks: size of the stack of each hart, in bytes
+    #     * symbols: the top N functions and objects by size, N being set by the
+    #                size_budget/top_symbols entry of project.yml
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param elf: Dictionary describing the ELF file, as returned by read_elf
+    #     :param symbols: List of the ELF symbols, as returned by read_elf_symbols
+    #     :param parsed_map: Dictionary describing the map file, as returned by parse_map_file,
+    #                        or None if the map file is not available
+    #
+    # Rets:
+    #     :return: The size report
+
+    size_budget = _get_size_budget(ctx)
+    top_symbols = int(size_budget.get('top_symbols', DEFAULT_TOP_SYMBOLS))
+
+    stack_edges = {}
+    for symbol in symbols:
+        match = _stack_symbol_re.fullmatch(symbol['name'])
+        if match:
+            stack_edges.setdefault(f'h{match["hart"]}', {})[match['edge']] = symbol['value']
+    stacks = {hart: edges['top'] - edges['bottom'] for hart, edges in sorted(stack_edges.items())
+              if 'top' in edges and 'bottom' in edges}
+
+    sized_symbols = [symbol for symbol in symbols if symbol['type'] in ('FUNC', 'OBJECT') and symbol['size']]
+    sized_symbols.sort(key=lambda symbol: symbol['size'], reverse=True)
+
+    memory = {}
+    sections = {}
+    if parsed_map:
+        for mem_name, mem_data in parsed_map['memory'].items():
+            memory[mem_name] = {**mem_data, 'free': mem_data['length'] - mem_data['used'], 'fill': 0}
+        for sect_name, sec_data in parsed_map['sections'].items():
+            sections[sect_name] = dict(sec_data)
+            if sec_data['memory']:
+                memory[sec_data['memory']]['fill'] += sec_data['fill']
+
+    report = {
+        'name': ctx.env.name,
+        'variant': ctx.variant,
+        'elf': {'text': elf['text'], 'data': elf['data'], 'bss': elf['bss']},
+        'sections': sections,
+        'memory': memory,
+        'stacks': stacks,
+        'symbols': [{'name': symbol['name'], 'size': symbol['size'], 'address': symbol['value'],
+                     'type': symbol['type']} for symbol in sized_symbols[:top_symbols]],
+    }
+
+    with open(_get_report_path(ctx), 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    return report
+
+
+def _get_growths(report, baseline) -> list:
+    # Compute the growth, in bytes, of the memory regions and of the hart stacks of report with
+    # respect to baseline. Returns a list of (kind, name, baseline, current) tuples.
+
+    growths = []
+    for mem_name, mem_data in report['memory'].items():
+        if mem_name in baseline['memory']:
+            growths.append(('memory', mem_name, baseline['memory'][mem_name]['used'], mem_data['used']))
+    for hart, size in report['stacks'].items():
+        if hart in baseline['stacks']:
+            growths.append(('stack', hart, baseline['stacks'][hart], size))
+    return growths
+
+
+def check_size_budget(ctx, report) -> None:
+    # The check_size_budget function compares the size report of the build against the stored
+    # baseline, and makes the build fail if any memory region or hart stack grew more than the
+    # threshold configured in project.yml.
+    # Thresholds are expressed in bytes, and are keyed either by memory region name, as declared
+    # in the linker script, or by 'stack', which applies to the stack of every hart.
+    #
+    # Example snippet of project.yml:
+    #
+    #     size_budget:
+    #       baseline: confs/size_baseline
+    #       top_symbols: 20
+    #       thresholds:
+    #         ENVM: 512
+    #         LIM: 1024
+    #         stack: 0
+    #
+    # The baseline is stored as <baseline>/<variant>.json, and is created or updated with
+    # waf size_diff --update-size-baseline. Until a baseline is stored for the variant, the
+    # size budget is not checked and the build goes on silently.
+    #
+    # Args:
+    #     :param ctx: The WAF context
+    #     :param report: The size report of the build, as returned by write_size_report
+
+    size_budget = _get_size_budget(ctx)
+    thresholds = size_budget.get('thresholds') or {}
+    if not thresholds:
+        return
+
+    baseline = _load_json(_get_baseline_path(ctx, size_budget))
+    if baseline is None:
+        return
+
+    violations = []
+    for kind, name, base, current in _get_growths(report, baseline):
+        threshold = thresholds.get(name if kind == 'memory' else 'stack')
+        if threshold is not None and current - base > int(threshold):
+            violations.append(f'{kind} {name} grew by {current - base} bytes '
+                              f'({base} -> {current}), threshold is {threshold} bytes')
+
+    if violations:
+        ctx.fatal('Size budget exceeded:\n    ' + '\n    '.join(violations))
+
+
+def print_lto_savings(ctx) -> None:
+    # The print_lto_savings function compares the memory footprint of the link time optimized
+    # release build against the one of the plain release build, printing the bytes used in
+    # each memory region (e.g. ENVM and LIM) by both and the bytes saved by LTO.
+    # The size reports written by post_build_stats are compared, so the release variant has
+    # to be built too, and it must be added as a post_fun after post_build_stats.
+    #
+    # Example usage:
+    #
+    #     waf build_release build_release_lto
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    report = _load_json(_get_report_path(ctx))
+    release_path = os.path.join(ctx.out_dir, 'release', f'{ctx.env.name}_size.json')
+    release = _load_json(release_path)
+    if report is None or release is None:
+        Logs.warn(f'No release size report found in {release_path}, build_release to compare against it')
+        return
+
+    tilde = '~' * 77
+    Logs.pprint('YELLOW', tilde)
+    Logs.pprint('NORMAL', f'{"   Memory [byte used]":<35s}{"Release":>14s}{"Release LTO":>14s}{"Saved":>14s}')
+    Logs.pprint('YELLOW', tilde)
+    for mem_name in sorted(set(report['memory']) | set(release['memory'])):
+        before = release['memory'].get(mem_name, {}).get('used', 0)
+        after = report['memory'].get(mem_name, {}).get('used', 0)
+        if before or after:
+            color = 'GREEN' if after < before else 'RED' if after > before else 'NORMAL'
+            Logs.pprint(color, f'{"   " + mem_name:<35s}{before:>14d}{after:>14d}{before - after:>+14d}')
+    Logs.pprint('YELLOW', tilde + '\n')
+
+
+def size_diff(ctx) -> None:
+    # The size_diff command compares the size report of the last build against the stored
+    # baseline, printing the difference of each memory region, output section, hart stack
+    # and of the biggest symbols.
+    # If the --update-size-baseline option is given, the size report of the last build is
+    # then stored as the new baseline.
+    #
+    # Example usage:
+    #
+    #     waf build_release size_diff
+    #     waf size_diff_debug --update-size-baseline
+    #     waf build_release_lto size_diff_release_lto
+    #
+    # Args:
+    #     :param ctx: The WAF context
+
+    report = _load_json(_get_report_path(ctx))
+    if report is None:
+        ctx.fatal('You need to build the application before being able to compare its size')
+
+    size_budget = _get_size_budget(ctx)
+    baseline_path = _get_baseline_path(ctx, size_budget)
+    baseline = _load_json(baseline_path)
+
+    if baseline is None:
+        Logs.warn(f'No size baseline found in {baseline_path}')
+    else:
+        tilde = '~' * 77
+
+        def _print_diff(title, current, base):
+            Logs.pprint('YELLOW', tilde)
+            Logs.pprint('NORMAL', f'{"   " + title:<35s}{"Baseline":>14s}{"Current":>14s}{"Delta":>14s}')
+            Logs.pprint('YELLOW', tilde)
+            for name in sorted(set(current) | set(base)):
+                delta = current.get(name, 0) - base.get(name, 0)
+                color = 'RED' if delta > 0 else 'GREEN' if delta < 0 else 'NORMAL'
+                Logs.pprint(color, f'{"   " + name:<35s}{base.get(name, 0):>14d}'
+                                   f'{current.get(name, 0):>14d}{delta:>+14d}')
+
+        _print_diff('Memory [byte used]',
+                    {name: data['used'] for name, data in report['memory'].items()},
+                    {name: data['used'] for name, data in baseline['memory'].items()})
+        _print_diff('Output Sections [byte]',
+                    {name: data['size'] for name, data in report['sections'].items()},
+                    {name: data['size'] for name, data in baseline['sections'].items()})
+        _print_diff('Stacks [byte]', report['stacks'], baseline['stacks'])
+        _print_diff('Symbols [byte]',
+                    {symbol['name']: symbol['size'] for symbol in report['symbols']},
+                    {symbol['name']: symbol['size'] for symbol in baseline['symbols']})
+        Logs.pprint('YELLOW', tilde + '\n')
+
+    if ctx.options.update_size_baseline:
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        Logs.pprint('CYAN', f'Size baseline stored in {baseline_path}')
+
+
+class SizeDiff(BuildContext):
+    '''compares the size of the release build against the stored baseline'''
+    cmd = 'size_diff'
+    fun = 'size_diff'
+    variant = 'release'
+
+
+class SizeDiffDebug(BuildContext):
+    '''compares the size of the debug build against the stored baseline'''
+    cmd = 'size_diff_debug'
+    fun = 'size_diff'
+    variant = 'debug'
+
+
+class SizeDiffReleaseLto(BuildContext):
+    '''compares the size of the link time optimized release build against the stored baseline'''
+    cmd = 'size_diff_release_lto'
+    fun = 'size_diff'
+    variant = 'release_lto'
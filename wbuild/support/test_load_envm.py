@@ -0,0 +1,241 @@
+# !/usr/bin/python
+
+# pylint: disable=invalid-name
+#
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+# Date: 17/10/2026
+
+"""
+Load eNVM Tests
+~~~~~~~
+
+Checks the eNVM programming of load_support against a fake fpgenprog executable put on PATH: the fpgenprog project is
+reused when nothing changed, generated again from scratch when the die, package or payload change, kept from the failed
+step on, and the board is not programmed in dry runs. Like the real one, the fake fpgenprog refuses to create a project
+over an existing one, and to add an eNVM client already in the project.
+waflib is taken from the directory waf unpacks itself in, so waf needs to have been run once.
+
+An example through command line:
+
+ python3 -m unittest wbuild/support/test_load_envm.py
+ python3 -m pytest wbuild/support/test_load_envm.py
+"""
+
+import glob
+import json
+import os
+import sys
+import tempfile
+import textwrap
+import types
+import unittest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT_DIR)
+sys.path.extend(glob.glob(os.path.join(ROOT_DIR, 'wbuild', '.waf3-*')))
+
+# pylint: disable=wrong-import-position
+try:
+    from waflib import Errors, Logs
+    from waflib.Context import Context
+except ImportError as e:
+    raise unittest.SkipTest('waflib not found, run waf once to unpack it') from e
+
+from wbuild.support import load_support
+from wbuild.support.load_support import FPGENPROG_STATE_FILE
+
+# Fake fpgenprog: keeps the project in <location>/project.json, logs each action to FAKE_FPGENPROG_LOG, and fails the
+# action given by FAKE_FPGENPROG_FAIL
+FAKE_FPGENPROG = '''
+import hashlib, json, os, sys
+
+action, args = sys.argv[1], dict(zip(sys.argv[2::2], sys.argv[3::2]))
+location = args['--location']
+project_path = os.path.join(location, 'project.json')
+with open(os.environ['FAKE_FPGENPROG_LOG'], 'a', encoding='utf-8') as f:
+    f.write(action + '\\n')
+
+def fail(message):
+    print(f'Error: {message}', flush=True)
+    sys.exit(1)
+
+if action == os.environ.get('FAKE_FPGENPROG_FAIL'):
+    fail(f'{action} failed')
+
+if action == 'new_project':
+    if os.path.exists(project_path):
+        fail(f'a project already exists in {location}')
+    os.makedirs(location, exist_ok=True)
+    project = {'die': args['--target_die'], 'package': args['--target_package'], 'clients': []}
+else:
+    if not os.path.exists(project_path):
+        fail(f'no project in {location}')
+    with open(project_path, encoding='utf-8') as f:
+        project = json.load(f)
+
+if action == 'mss_boot_info':
+    project['boot'] = [args['--u_mss_bootmode'], args['--u_mss_bootcfg']]
+elif action == 'envm_client':
+    if any(client['name'] == args['--client_name'] for client in project['clients']):
+        fail(f'the client {args["--client_name"]} already exists')
+    with open(args['--content_file'], 'rb') as f:
+        content = hashlib.sha256(f.read()).hexdigest()
+    project['clients'].append({'name': args['--client_name'], 'content': content})
+elif action == 'generate_bitstream':
+    project['bitstream'] = list(project['clients'])
+elif action == 'run_action':
+    if 'bitstream' not in project:
+        fail('no bitstream generated')
+    project['programmed'] = project['bitstream']
+
+with open(project_path, 'w', encoding='utf-8') as f:
+    json.dump(project, f)
+'''
+
+STEPS = ['new_project', 'mss_boot_info', 'envm_client', 'generate_bitstream']
+
+
+class LoadEnvmTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.tempdir = self._tempdir.name
+
+        bin_dir = os.path.join(self.tempdir, 'bin')
+        os.makedirs(bin_dir)
+        path = os.path.join(bin_dir, 'fpgenprog')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f'#!{sys.executable}\n' + textwrap.dedent(FAKE_FPGENPROG))
+        os.chmod(path, 0o755)
+
+        self.calls_path = os.path.join(self.tempdir, 'fpgenprog.log')
+        self._environ = os.environ.copy()
+        os.environ['PATH'] = bin_dir + os.pathsep + os.environ.get('PATH', '')
+        os.environ['FAKE_FPGENPROG_LOG'] = self.calls_path
+
+        variant_dir = os.path.join(self.tempdir, 'build', 'release')
+        os.makedirs(variant_dir)
+        self.project_dir = os.path.join(variant_dir, 'fpgenprogProject')
+        # The commands are run by the exec_command of waf, trough the shell
+        self.ctx = types.SimpleNamespace(
+            variant_dir=variant_dir,
+            env=types.SimpleNamespace(FPGENPROG=['fpgenprog'], name='app'),
+            options=types.SimpleNamespace(target_package='FCVG484', fpgenprog_dry_run=False),
+            logger=None,
+            fatal=self._fatal)
+        self.ctx.exec_command = types.MethodType(Context.exec_command, self.ctx)
+        self.ctx.log_command = types.MethodType(Context.log_command, self.ctx)
+
+        if not Logs.log:
+            Logs.init_log()
+        self._write_payload(b'payload')
+
+    def tearDown(self):
+        os.environ.clear()
+        os.environ.update(self._environ)
+        self._tempdir.cleanup()
+
+    @staticmethod
+    def _fatal(msg):
+        raise Errors.ConfigurationError(msg)
+
+    def _write_payload(self, data):
+        base_path = os.path.join(self.ctx.variant_dir, 'app-bm1-p0')
+        with open(base_path + '.bin', 'wb') as f:
+            f.write(data)
+        with open(base_path + '.hex', 'w', encoding='utf-8') as f:
+            f.write(data.hex())
+
+    def _load(self) -> list:
+        # Run load_envm, returning the fpgenprog actions it ran
+        if os.path.exists(self.calls_path):
+            os.remove(self.calls_path)
+        try:
+            load_support.load_envm(self.ctx)
+        finally:
+            calls = []
+            if os.path.exists(self.calls_path):
+                with open(self.calls_path, encoding='utf-8') as f:
+                    calls = f.read().split()
+            self.calls = calls
+        return calls
+
+    def _project(self) -> dict:
+        with open(os.path.join(self.project_dir, 'project.json'), encoding='utf-8') as f:
+            return json.load(f)
+
+    def _state(self) -> dict:
+        with open(os.path.join(self.project_dir, FPGENPROG_STATE_FILE), encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_reuses_the_project(self):
+        self.assertEqual(self._load(), STEPS + ['run_action'])
+        self.assertEqual(self._load(), ['run_action'])
+        project = self._project()
+        self.assertEqual([client['name'] for client in project['clients']], ['bootmode1_0'])
+        self.assertEqual(project['programmed'], project['clients'])
+
+    def test_payload_change(self):
+        # The eNVM client can not be added again to the project it is in, so a new payload is programmed from a new
+        # project, holding that payload only
+        self._load()
+        self._write_payload(b'new payload')
+        self.assertEqual(self._load(), STEPS + ['run_action'])
+        project = self._project()
+        self.assertEqual(len(project['clients']), 1)
+        self.assertEqual(project['programmed'], project['clients'])
+        self.assertEqual(self._load(), ['run_action'])
+
+    def test_package_change(self):
+        self._load()
+        stale_path = os.path.join(self.project_dir, 'stale')
+        open(stale_path, 'w', encoding='utf-8').close()
+
+        self.ctx.options.target_package = 'FCSG536'
+        self.assertEqual(self._load(), STEPS + ['run_action'])
+        self.assertFalse(os.path.exists(stale_path))
+        self.assertEqual(self._project()['package'], 'FCSG536')
+
+    def test_dry_run(self):
+        self.ctx.options.fpgenprog_dry_run = True
+        self.assertEqual(self._load(), STEPS)
+        self.assertNotIn('programmed', self._project())
+        self.assertIn('bitstream', self._project())
+
+        # The programming files of the dry run are used as they are to program the board
+        self.ctx.options.fpgenprog_dry_run = False
+        self.assertEqual(self._load(), ['run_action'])
+
+    def test_failed_step(self):
+        # A failed step is not marked as done, and is run again by the next run, from where the project was left
+        os.environ['FAKE_FPGENPROG_FAIL'] = 'generate_bitstream'
+        with self.assertRaisesRegex(Errors.ConfigurationError, 'fpgenprog generate_bitstream failed'):
+            self._load()
+        self.assertEqual(self.calls, STEPS)
+        self.assertEqual(sorted(self._state()), sorted(STEPS[:3]))
+
+        del os.environ['FAKE_FPGENPROG_FAIL']
+        self.assertEqual(self._load(), ['generate_bitstream', 'run_action'])
+        self.assertEqual(sorted(self._state()), sorted(STEPS))
+
+    def test_failed_client(self):
+        # A failed envm_client may have left the client in the project, which is then generated again from scratch
+        os.environ['FAKE_FPGENPROG_FAIL'] = 'envm_client'
+        with self.assertRaisesRegex(Errors.ConfigurationError, 'fpgenprog envm_client failed'):
+            self._load()
+        self.assertEqual(sorted(self._state()), sorted(STEPS[:2]))
+
+        del os.environ['FAKE_FPGENPROG_FAIL']
+        self.assertEqual(self._load(), STEPS + ['run_action'])
+
+    def test_failed_programming(self):
+        os.environ['FAKE_FPGENPROG_FAIL'] = 'run_action'
+        with self.assertRaisesRegex(Errors.ConfigurationError, 'fpgenprog run_action failed'):
+            self._load()
+
+        del os.environ['FAKE_FPGENPROG_FAIL']
+        self.assertEqual(self._load(), ['run_action'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,493 @@
+# !/usr/bin/python
+
+# pylint: disable=invalid-name
+#
+# Author: Francescodario Cuzzocrea <bosconovic@gmail.com>
+# Date: 17/10/2026
+
+"""
+Load Support Tests
+~~~~~~~
+
+Checks the OpenOCD programming paths of load_support against fake openocd and gdb executables put on PATH, which talk
+a minimal GDB remote serial protocol: the concurrent programming of a fleet of boards, with its per-probe logs and
+summary, and the persistent debug server started and stopped trough build/debugserver.json, including the state files
+left by servers which are gone, and the program loads which reuse it.
+waflib is taken from the directory waf unpacks itself in, so waf needs to have been run once.
+
+An example through command line:
+
+ python3 -m unittest wbuild/support/test_load_support.py
+ python3 -m pytest wbuild/support/test_load_support.py
+"""
+
+import contextlib
+import glob
+import json
+import logging
+import os
+import re
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+import types
+import unittest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT_DIR)
+sys.path.extend(glob.glob(os.path.join(ROOT_DIR, 'wbuild', '.waf3-*')))
+
+# pylint: disable=wrong-import-position
+try:
+    from waflib import Errors, Logs
+    from waflib.Context import Context
+except ImportError as e:
+    raise unittest.SkipTest('waflib not found, run waf once to unpack it') from e
+
+from wbuild.support import load_support
+from wbuild.support.load_support import DEBUGSERVER_LOG_FILE, DEBUGSERVER_STATE_FILE
+
+# GDB remote serial protocol, shared by the fake openocd and gdb: $<payload>#<checksum> packets, each acked with + or -
+FAKE_RSP = '''
+import os, socket, sys
+
+def checksum(payload):
+    return b'%02x' % (sum(payload) & 0xff)
+
+class Remote:
+    def __init__(self, sock):
+        self.sock = sock
+        self.rfile = sock.makefile('rb', buffering=0)
+
+    def read(self, size):
+        data = self.rfile.read(size)
+        if len(data) < size:
+            raise EOFError
+        return data
+
+    def send(self, payload):
+        while True:
+            self.sock.sendall(b'$' + payload + b'#' + checksum(payload))
+            ack = self.read(1)
+            if ack == b'+':
+                return
+            if ack != b'-':
+                raise ValueError(f'unexpected ack {ack!r}')
+
+    def receive(self):
+        while True:
+            while self.read(1) != b'$':
+                pass
+            payload = bytearray()
+            while (char := self.read(1)) != b'#':
+                payload += char
+            if self.read(2) == checksum(payload):
+                self.sock.sendall(b'+')
+                return bytes(payload)
+            self.sock.sendall(b'-')
+
+def escape(data):
+    return b''.join(b'}' + bytes([byte ^ 0x20]) if byte in b'#$}*' else bytes([byte]) for byte in data)
+
+def unescape(data):
+    out, escaped = bytearray(), False
+    for byte in data:
+        if escaped:
+            out.append(byte ^ 0x20)
+        elif byte != ord('}'):
+            out.append(byte)
+        escaped = not escaped and byte == ord('}')
+    return bytes(out)
+'''
+
+# Fake openocd: serves GDB on the port given by --command "gdb_port <port>" until terminated or shut down by the
+# shutdown monitor command, or exits at once if the probe given by --command "adapter serial <probe>" is listed in
+# FAKE_OPENOCD_FAIL_PROBES. Each start is logged to FAKE_OPENOCD_LOG.
+FAKE_OPENOCD = FAKE_RSP + '''
+import signal
+
+commands = [sys.argv[i + 1] for i, arg in enumerate(sys.argv[:-1]) if arg == '--command']
+port = int(next(c.split()[1] for c in commands if c.startswith('gdb_port ')))
+probe = next((c.split()[2] for c in commands if c.startswith('adapter serial ')), '')
+with open(os.environ['FAKE_OPENOCD_LOG'], 'a', encoding='utf-8') as f:
+    f.write(f'{os.getpid()}\\n')
+print(f'Open On-Chip Debugger (fake), probe {probe or "any"}', flush=True)
+if probe and probe in os.environ.get('FAKE_OPENOCD_FAIL_PROBES', '').split(','):
+    print(f'Error: unable to open the probe {probe}', flush=True)
+    sys.exit(1)
+
+signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+server = socket.create_server(('localhost', port))
+print(f'Info : Listening on port {port} for gdb connections', flush=True)
+
+def serve(remote):
+    # Serve a GDB session, returns True if GDB asked to shut down
+    while True:
+        packet = remote.receive()
+        if packet.startswith(b'qSupported'):
+            remote.send(b'PacketSize=4000')
+        elif packet == b'?':
+            remote.send(b'S05')
+        elif packet == b'g':
+            remote.send(b'00' * 8 * 33)
+        elif packet[:1] in (b'M', b'X'):
+            header, data = packet[1:].split(b':', 1)
+            address, length = (int(field, 16) for field in header.split(b','))
+            data = bytes.fromhex(data.decode()) if packet[:1] == b'M' else unescape(data)
+            if len(data) != length:
+                remote.send(b'E01')
+                continue
+            print(f'Info : wrote {length} bytes at 0x{address:x}, checksum {sum(data) & 0xffff:04x}', flush=True)
+            remote.send(b'OK')
+        elif packet.startswith(b'qRcmd,'):
+            command = bytes.fromhex(packet[6:].decode()).decode()
+            print(f'Info : monitor {command}', flush=True)
+            remote.send(b'OK')
+            if command == 'shutdown':
+                return True
+        elif packet == b'D':
+            print('Info : gdb detached', flush=True)
+            remote.send(b'OK')
+            return False
+        else:
+            remote.send(b'')
+
+while True:
+    connection, _ = server.accept()
+    with connection:
+        try:
+            shutdown = serve(Remote(connection))
+        except EOFError:
+            shutdown = False
+    if shutdown:
+        print('shutdown command invoked', flush=True)
+        break
+'''
+
+# Fake gdb: runs the -ex commands trough the GDB server given by -ex "target extended-remote localhost:<port>", the load
+# writing 256 bytes at 0x80000000, and fails the load if the port is listed in FAKE_GDB_FAIL_PORTS
+FAKE_GDB = FAKE_RSP + '''
+commands = [sys.argv[i + 1] for i, arg in enumerate(sys.argv[:-1]) if arg == '-ex']
+remote = None
+
+def request(payload, expected=None):
+    remote.send(payload)
+    reply = remote.receive()
+    if expected is not None and reply != expected:
+        print(f'Error: {payload[:16]!r} got {reply!r}', flush=True)
+        sys.exit(1)
+    return reply
+
+for command in commands:
+    if command.startswith('target extended-remote '):
+        port = int(command.rsplit(':', 1)[1])
+        remote = Remote(socket.create_connection(('localhost', port)))
+        request(b'qSupported:multiprocess+;swbreak+')
+        request(b'?', b'S05')
+        request(b'g')
+    elif command.startswith('monitor '):
+        request(b'qRcmd,' + command[len('monitor '):].encode().hex().encode(), b'OK')
+    elif command == 'load':
+        if str(port) in os.environ.get('FAKE_GDB_FAIL_PORTS', '').split(','):
+            print('Error: load failed', flush=True)
+            sys.exit(1)
+        data = bytes(range(256))
+        # The binary download is used if the server supports it, as GDB does
+        if request(b'X80000000,100:' + escape(data)) == b'':
+            request(b'M80000000,100:' + data.hex().encode(), b'OK')
+        print(f'Loading section .text, size 0x100 lma 0x80000000 trough port {port}', flush=True)
+    elif command == 'detach':
+        request(b'D', b'OK')
+    elif command == 'quit':
+        remote.sock.close()
+'''
+
+_ansi_re = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def _free_port_base(count) -> int:
+    # Return the first of count consecutive free TCP ports
+    for _ in range(100):
+        with socket.socket() as s:
+            s.bind(('localhost', 0))
+            base = s.getsockname()[1]
+        if base + count > 65535:
+            continue
+        try:
+            for port in range(base, base + count):
+                with socket.socket() as s:
+                    s.bind(('localhost', port))
+        except OSError:
+            continue
+        return base
+    raise RuntimeError('no free ports')
+
+
+def _dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, '-c', ''])
+    process.wait()
+    return process.pid
+
+
+def _reap(pid) -> None:
+    # The debug server is a child of this process, while it is orphaned and reaped by init once waf exits. Reap it
+    # when it exits, so that debugserver_stop does not wait for a zombie.
+    def wait():
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+    threading.Thread(target=wait, daemon=True).start()
+
+
+class _LogRecorder(logging.Handler):
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        # Logs.pprint colors the messages
+        self.messages.append(_ansi_re.sub('', record.getMessage()).rstrip())
+
+
+class _LoadSupportTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.tempdir = self._tempdir.name
+
+        bin_dir = os.path.join(self.tempdir, 'bin')
+        os.makedirs(bin_dir)
+        for name, source in (('openocd', FAKE_OPENOCD), ('gdb', FAKE_GDB)):
+            path = os.path.join(bin_dir, name)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(f'#!{sys.executable}\n' + textwrap.dedent(source))
+            os.chmod(path, 0o755)
+
+        self.openocd_log_path = os.path.join(self.tempdir, 'openocd.log')
+        self._environ = os.environ.copy()
+        os.environ['PATH'] = bin_dir + os.pathsep + os.environ.get('PATH', '')
+        os.environ['FAKE_OPENOCD_LOG'] = self.openocd_log_path
+
+        out_dir = os.path.join(self.tempdir, 'build')
+        variant_dir = os.path.join(out_dir, 'release')
+        os.makedirs(variant_dir)
+        # The flags are the ones set by the openocd waf tool, and the commands are run by the exec_command of waf
+        self.ctx = types.SimpleNamespace(
+            out_dir=out_dir,
+            variant_dir=variant_dir,
+            variant='release',
+            env=types.SimpleNamespace(name='app', OPENOCD=['openocd'], OPENOCD_ARGS=[' --command "set DEVICE MPFS"'],
+                                      OPENOCD_PROBE_COMMAND='adapter serial', GDB=['gdb'],
+                                      GDB_OPENOCD_INIT_FLAGS=[' --batch -ex "set arch riscv:rv64"'],
+                                      GDB_OPENOCD_LOAD_FLAGS=[' -ex "monitor reset halt" -ex "load"'
+                                                              ' -ex "monitor resume"'],
+                                      GDB_OPENOCD_EXIT_FLAGS=[' -ex "monitor shutdown" -ex "quit"']),
+            options=types.SimpleNamespace(program='openocd', probes='', probe_jobs=0, gdb_port=_free_port_base(3),
+                                          openocd_timeout=10, reset_countdown=0),
+            logger=None,
+            fatal=self._fatal)
+        self.ctx.exec_command = types.MethodType(Context.exec_command, self.ctx)
+        self.ctx.log_command = types.MethodType(Context.log_command, self.ctx)
+
+        if not Logs.log:
+            Logs.init_log()
+        self.log = _LogRecorder()
+        Logs.log.addHandler(self.log)
+
+    def tearDown(self):
+        Logs.log.removeHandler(self.log)
+        os.environ.clear()
+        os.environ.update(self._environ)
+        self._tempdir.cleanup()
+
+    @staticmethod
+    def _fatal(msg):
+        raise Errors.ConfigurationError(msg)
+
+    def _read(self, path) -> str:
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    def _openocd_pids(self) -> list:
+        # Pids of the fake openocd processes started so far
+        if not os.path.exists(self.openocd_log_path):
+            return []
+        return [int(pid) for pid in self._read(self.openocd_log_path).split()]
+
+
+class FleetProgrammingTest(_LoadSupportTest):
+
+    def _summary(self) -> list:
+        # Rows of the summary printed after programming, as [probe, gdb port, result, time]
+        return [message.split() for message in self.log.messages
+                if message.startswith('   ') and message.split()[-2] in ('PASS', 'FAIL')]
+
+    def test_programs_every_probe(self):
+        elf_path = os.path.join(self.ctx.variant_dir, 'app.elf')
+        load_support._load_ram_fleet(self.ctx, elf_path, ['A1B2', 'C3D4'])
+
+        base = self.ctx.options.gdb_port
+        for index, probe in enumerate(('A1B2', 'C3D4')):
+            log = self._read(os.path.join(self.ctx.variant_dir, f'program_{probe}.log'))
+            self.assertIn(f'Open On-Chip Debugger (fake), probe {probe}', log)
+            self.assertIn(f'Loading section .text, size 0x100 lma 0x80000000 trough port {base + index}', log)
+            self.assertIn('Info : wrote 256 bytes at 0x80000000, checksum 7f80', log)
+            self.assertIn('shutdown command invoked', log)
+            self.assertIn(f'[{probe}] Info : Listening on port {base + index} for gdb connections',
+                          self.log.messages)
+
+        self.assertEqual([row[:3] for row in self._summary()],
+                         [['A1B2', str(base), 'PASS'], ['C3D4', str(base + 1), 'PASS']])
+
+    def test_probe_jobs(self):
+        self.ctx.options.probe_jobs = 1
+        load_support._load_ram_fleet(self.ctx, os.path.join(self.ctx.variant_dir, 'app.elf'),
+                                     ['A1B2', 'C3D4', 'E5F6'])
+        self.assertEqual([row[2] for row in self._summary()], ['PASS'] * 3)
+
+    def test_failed_probes(self):
+        # The OpenOCD of C3D4 can not open its probe, and GDB fails to load trough the server of E5F6. The other
+        # boards are programmed anyway, and the build fails once all of them are done.
+        base = self.ctx.options.gdb_port
+        os.environ['FAKE_OPENOCD_FAIL_PROBES'] = 'C3D4'
+        os.environ['FAKE_GDB_FAIL_PORTS'] = str(base + 2)
+
+        with self.assertRaisesRegex(Errors.ConfigurationError, 'Programming failed for 2 of 3 boards: C3D4, E5F6'):
+            load_support._load_ram_fleet(self.ctx, os.path.join(self.ctx.variant_dir, 'app.elf'),
+                                         ['A1B2', 'C3D4', 'E5F6'])
+
+        self.assertEqual([row[:3] for row in self._summary()],
+                         [['A1B2', str(base), 'PASS'], ['C3D4', str(base + 1), 'FAIL'],
+                          ['E5F6', str(base + 2), 'FAIL']])
+        log = self._read(os.path.join(self.ctx.variant_dir, 'program_C3D4.log'))
+        self.assertIn('Error: unable to open the probe C3D4', log)
+        self.assertIn(f'OpenOCD GDB server not available on port {base + 1}', log)
+        self.assertIn('Error: load failed', self._read(os.path.join(self.ctx.variant_dir, 'program_E5F6.log')))
+
+
+class DebugServerTest(_LoadSupportTest):
+
+    def setUp(self):
+        super().setUp()
+        self.state_path = os.path.join(self.ctx.out_dir, DEBUGSERVER_STATE_FILE)
+
+    def tearDown(self):
+        # Never leave a fake debug server behind, whatever the outcome of the test
+        if os.path.exists(self.state_path):
+            pid = json.loads(self._read(self.state_path))['pid']
+            if pid != os.getpid():
+                with contextlib.suppress(OSError):
+                    os.kill(pid, signal.SIGKILL)
+        super().tearDown()
+
+    def _start(self) -> dict:
+        load_support.debugserver_start(self.ctx)
+        state = json.loads(self._read(self.state_path))
+        _reap(state['pid'])
+        return state
+
+    def _write_state(self, pid):
+        with open(self.state_path, 'w', encoding='utf-8') as f:
+            json.dump({'pid': pid, 'gdb_port': self.ctx.options.gdb_port, 'probe': ''}, f)
+
+    def _wait_dead(self, pid):
+        deadline = time.monotonic() + 5
+        while load_support._pid_alive(pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        return not load_support._pid_alive(pid)
+
+    def test_start_and_stop(self):
+        self.ctx.options.probes = 'A1B2'
+        state = self._start()
+        self.assertEqual(state, {'pid': state['pid'], 'gdb_port': self.ctx.options.gdb_port, 'probe': 'A1B2'})
+        self.assertEqual(load_support._read_debugserver_state(self.ctx), state)
+        self.assertIn('Info : Listening on port', self._read(os.path.join(self.ctx.out_dir, DEBUGSERVER_LOG_FILE)))
+
+        # A running debug server is reused, not started twice
+        load_support.debugserver_start(self.ctx)
+        self.assertIn(f'Debug server already running, pid {state["pid"]}, GDB port {state["gdb_port"]}',
+                      self.log.messages)
+        self.assertEqual(json.loads(self._read(self.state_path)), state)
+
+        load_support.debugserver_stop(self.ctx)
+        self.assertTrue(self._wait_dead(state['pid']))
+        self.assertFalse(os.path.exists(self.state_path))
+
+    def test_program_trough_the_debug_server(self):
+        # program loads trough the running debug server, leaving it attached to the target, rather than starting
+        # and shutting down an OpenOCD of its own
+        state = self._start()
+        open(os.path.join(self.ctx.variant_dir, 'app.elf'), 'wb').close()
+        for _ in range(2):
+            load_support.program(self.ctx)
+            self.assertEqual(load_support._read_debugserver_state(self.ctx), state)
+
+        self.assertEqual(self._openocd_pids(), [state['pid']])
+        log = self._read(os.path.join(self.ctx.out_dir, DEBUGSERVER_LOG_FILE))
+        self.assertEqual(log.count('Info : wrote 256 bytes at 0x80000000, checksum 7f80'), 2)
+        self.assertEqual(log.count('Info : monitor reset halt'), 2)
+        self.assertEqual(log.count('Info : gdb detached'), 2)
+        self.assertNotIn('shutdown', log)
+
+        load_support.debugserver_stop(self.ctx)
+        self.assertTrue(self._wait_dead(state['pid']))
+
+    def test_program_without_debug_server(self):
+        # Without a debug server, each program runs an OpenOCD of its own, shut down once the load is done
+        open(os.path.join(self.ctx.variant_dir, 'app.elf'), 'wb').close()
+        for _ in range(2):
+            load_support.program(self.ctx)
+        pids = self._openocd_pids()
+        self.assertEqual(len(set(pids)), 2)
+        self.assertFalse(any(load_support._pid_alive(pid) for pid in pids))
+        self.assertFalse(os.path.exists(self.state_path))
+
+    def test_dead_server(self):
+        # The state of a debug server whose process is gone is dropped, and a new one can be started
+        self._write_state(_dead_pid())
+        load_support.debugserver_stop(self.ctx)
+        self.assertIn('No debug server running', self.log.messages)
+        self.assertFalse(os.path.exists(self.state_path))
+
+        self._write_state(_dead_pid())
+        state = self._start()
+        self.assertTrue(load_support._pid_alive(state['pid']))
+        load_support.debugserver_stop(self.ctx)
+        self.assertTrue(self._wait_dead(state['pid']))
+
+    def test_stale_server(self):
+        # The pid of the state file is alive, but is not a GDB server anymore (e.g. the pid has been reused): the
+        # state is dropped, and the process is left alone
+        self._write_state(os.getpid())
+        self.assertIsNone(load_support._read_debugserver_state(self.ctx))
+        self.assertFalse(os.path.exists(self.state_path))
+
+        self._write_state(os.getpid())
+        load_support.debugserver_stop(self.ctx)
+        self.assertIn('No debug server running', self.log.messages)
+        self.assertFalse(os.path.exists(self.state_path))
+
+    def test_server_failing_to_start(self):
+        self.ctx.options.probes = 'C3D4'
+        os.environ['FAKE_OPENOCD_FAIL_PROBES'] = 'C3D4'
+        with self.assertRaisesRegex(Errors.ConfigurationError, 'OpenOCD GDB server not available'):
+            load_support.debugserver_start(self.ctx)
+        self.assertFalse(os.path.exists(self.state_path))
+        self.assertIn('Error: unable to open the probe C3D4',
+                      self._read(os.path.join(self.ctx.out_dir, DEBUGSERVER_LOG_FILE)))
+
+    def test_single_probe(self):
+        self.ctx.options.probes = 'A1B2,C3D4'
+        with self.assertRaisesRegex(Errors.ConfigurationError, 'single probe'):
+            load_support.debugserver_start(self.ctx)
+
+
+if __name__ == "__main__":
+    unittest.main()
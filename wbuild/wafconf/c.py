@@ -8,11 +8,22 @@
 
 "Base for c programs/libraries"
 
-from waflib import TaskGen, Task
+import os
+import re
+import subprocess
+
+from waflib import Errors, Logs, TaskGen, Task, Utils
 from waflib.Tools import c_preproc
 from waflib.Tools.ccroot import link_task, stlink_task
 from waflib.Utils import def_attrs
-from waflib.TaskGen import feature, after_method
+from waflib.TaskGen import feature, after_method, before_method
+
+from tools import fpga_design_config_generator
+from tools.mss_header_binder import bind_mss_header_to_bin
+from wbuild.support.compile_cache_support import compile_cache_key, retrieve_objects, store_objects
+
+# Splits the prerequisites of a depfile rule on whitespaces, but escaped ones
+_depfile_splitter = re.compile(r'(?<!\\)\s+')
 
 
 @TaskGen.extension('.c')
@@ -25,11 +36,230 @@ def c_hook(self, node):
 
 class c(Task.Task):
     "Compiles C files into object files"
-    run_str = '${CC} ${ARCH_ST:ARCH} ${CFLAGS} ${FRAMEWORKPATH_ST:FRAMEWORKPATH} ${CPPPATH_ST:INCPATHS} ${DEFINES_ST:DEFINES} ${CC_SRC_F}${SRC} ${CC_TGT_F}${TGT[0].abspath()} ${CPPFLAGS}'
+    run_str = '${CC} ${ARCH_ST:ARCH} ${CFLAGS} ${FRAMEWORKPATH_ST:FRAMEWORKPATH} ${CPPPATH_ST:INCPATHS} ${DEFINES_ST:DEFINES} ${CC_DEPS_F} ${CC_SRC_F}${SRC} ${CC_TGT_F}${TGT[0].abspath()} ${CPPFLAGS}'
     vars = ['CCDEPS']  # unused variable to depend on, just in case
     ext_in = ['.h']  # set the build order easily by using ext_out=['.h']
     scan = c_preproc.scan
 
+    def exec_command(self, cmd, **kw):
+        # When the compile cache is enabled (COMPILE_CACHE_DIR), the object file is looked up in
+        # the cache by the hash of the preprocessed source, of the command line and of the
+        # compiler, and the compiler is only invoked on a miss
+        if not self.env.COMPILE_CACHE_DIR:
+            return super().exec_command(cmd, **kw)
+
+        # The object file path might come glued to the output flag (e.g. -o/path/to/file.o)
+        target = self.outputs[0].abspath()
+        command = [arg for arg in cmd if not arg.endswith(target)]
+        preprocess = subprocess.run([arg for arg in command
+                                     if arg not in self.env.CC_TGT_F and arg not in self.env.CC_DEPS_F] + ['-E'],
+                                    cwd=(kw.get('cwd') or self.get_cwd()).abspath(),
+                                    capture_output=True, check=False)
+        if preprocess.returncode:
+            # Let the compiler report the error
+            return super().exec_command(cmd, **kw)
+
+        # The depfile is cached together with the object file, as it is not generated on a hit
+        targets = [target, self.depfile_path()] if self.env.CC_DEPS_F else [target]
+        key = compile_cache_key(cmd[0], command, preprocess.stdout)
+        if retrieve_objects(self.env.COMPILE_CACHE_DIR, key, targets):
+            return 0
+
+        ret = super().exec_command(cmd, **kw)
+        if not ret:
+            store_objects(self.env.COMPILE_CACHE_DIR, key, targets)
+        return ret
+
+    def depfile_path(self):
+        "Path of the depfile the compiler writes next to the object file when given -MMD"
+        target = self.outputs[0].abspath()
+        return target[:target.rindex('.')] + '.d'
+
+    def parse_depfile(self):
+        "Returns the nodes of the headers listed in the depfile written by the compiler"
+        with open(self.depfile_path(), encoding='utf-8') as f:
+            rules = f.read().replace('\\\n', ' ')
+
+        bld = self.generator.bld
+        cwd = self.get_cwd()
+        nodes = []
+        for rule in rules.splitlines():
+            _, _, prerequisites = rule.partition(': ')
+            for path in _depfile_splitter.split(prerequisites.strip()):
+                if not path:
+                    continue
+                path = path.replace('\\ ', ' ')
+                node = bld.root.find_node(path) if os.path.isabs(path) else cwd.find_node(path)
+                if node is None:
+                    Logs.warn(f'Dependency {path} of {self} not found')
+                elif node is not self.inputs[0]:
+                    nodes.append(node)
+        return nodes
+
+    def post_run(self):
+        # With compiler generated dependencies (HEADER_DEPS set to compiler), the headers
+        # listed in the depfile are stored as the implicit dependencies of the task
+        if self.env.HEADER_DEPS == 'compiler':
+            bld = self.generator.bld
+            bld.node_deps[self.uid()] = self.parse_depfile()
+            bld.raw_deps[self.uid()] = []
+            try:
+                del self.cache_sig
+            except AttributeError:
+                pass
+        super().post_run()
+
+    def sig_implicit_deps(self):
+        # With compiler generated dependencies (HEADER_DEPS set to compiler), the headers
+        # listed in the depfile of the previous compilation are hashed, instead of running the
+        # waf preprocessor scan. A task which was never compiled has no dependency yet, and it
+        # runs anyway
+        if self.env.HEADER_DEPS != 'compiler':
+            return super().sig_implicit_deps()
+
+        bld = self.generator.bld
+        try:
+            return self.compute_sig_implicit_deps()
+        except EnvironmentError:
+            # A header has been removed or renamed, the dependencies are stale and the task
+            # must run to get fresh ones
+            for node in bld.node_deps.get(self.uid(), []):
+                if not node.is_bld() and not node.exists():
+                    try:
+                        del node.parent.children[node.name]
+                    except KeyError:
+                        pass
+        bld.node_deps[self.uid()] = []
+        bld.raw_deps[self.uid()] = []
+        return Utils.SIG_NIL
+
+
+class analyze(Task.Task):
+    "Runs the GCC static analyzer on C files, storing its findings as JSON"
+    run_str = '${CC} ${ARCH_ST:ARCH} ${CFLAGS} ${ANALYZER_FLAGS} ${FRAMEWORKPATH_ST:FRAMEWORKPATH} ${CPPPATH_ST:INCPATHS} ${DEFINES_ST:DEFINES} ${CC_SRC_F}${SRC} ${CC_TGT_F}/dev/null ${CPPFLAGS}'
+    ext_in = ['.h']
+    scan = c_preproc.scan
+    color = 'PINK'
+
+    def exec_command(self, cmd, **kw):
+        # The analyzer findings are written by GCC to the standard error, as a JSON array
+        # (-fdiagnostics-format=json), and they are stored in the output of the task
+        result = subprocess.run(cmd, cwd=(kw.get('cwd') or self.get_cwd()).abspath(),
+                                capture_output=True, check=False)
+        if result.returncode:
+            Logs.error(result.stderr.decode('utf-8', 'replace'))
+        else:
+            self.outputs[0].write(result.stderr or b'[]', 'wb')
+        return result.returncode
+
+
+@feature('analyze')
+@after_method('process_source')
+def map_analyze(self):
+    for compiled_task in getattr(self, 'compiled_tasks', []):
+        if compiled_task.__class__.__name__ == 'c':
+            self.create_task('analyze', src=compiled_task.inputs[0],
+                             tgt=compiled_task.outputs[0].change_ext('.analyze.json'))
+
+
+class unity(Task.Task):
+    "Generates a unity source, which includes a batch of C files to be compiled as one"
+    color = 'CYAN'
+
+    def run(self):
+        # Sources are included by their path relative to the unity source, so that the
+        # waf preprocessor scan resolves them as well as the compiler does
+        unity_dir = self.outputs[0].parent
+        self.outputs[0].write(''.join(f'#include "{node.path_from(unity_dir)}"\n' for node in self.inputs))
+
+
+@feature('unity')
+@before_method('process_source')
+def apply_unity(self):
+    # Replaces each batch of sources listed in unity_batches by a generated unity source.
+    # Batches are lists of paths relative to the task generator path, as set by
+    # parse_project_sources; files of a batch not being built are skipped, and batches left
+    # with a single file are compiled as they are.
+    sources = self.to_nodes(getattr(self, 'source', []))
+    for index, batch in enumerate(getattr(self, 'unity_batches', [])):
+        nodes = [node for node in (self.path.find_resource(path) for path in batch) if node in sources]
+        if len(nodes) < 2:
+            continue
+        unity_node = self.path.find_or_declare(f'{self.target}.unity/unity_{index}.c')
+        self.create_task('unity', nodes, unity_node)
+        sources = [node for node in sources if node not in nodes] + [unity_node]
+    self.source = sources
+
+
+class pch(Task.Task):
+    "Precompiles a C header, with the same flags as the C files of its task generator"
+    run_str = '${CC} ${ARCH_ST:ARCH} ${CFLAGS} ${FRAMEWORKPATH_ST:FRAMEWORKPATH} ${CPPPATH_ST:INCPATHS} ${DEFINES_ST:DEFINES} -x c-header ${SRC} -o ${TGT[0].abspath()} ${CPPFLAGS}'
+    ext_in = ['.h']
+    scan = c_preproc.scan
+    color = 'BLUE'
+
+
+@feature('pch')
+@after_method('process_source')
+@before_method('apply_incpaths')
+def apply_pch(self):
+    # Precompiles each header listed in pch, given as it is included by the sources (e.g.
+    # fpga_design_config/fpga_design_config.h), into <target>.pch/<header>.gch. The
+    # directory is searched first for includes, so GCC uses the precompiled header when it
+    # is the first one included by a source, and falls back to the header otherwise, or if
+    # the flags or the macros defined before it do not match.
+    # The compiler does not list the headers included trough a precompiled header in its
+    # depfiles, so the C tasks depend on the precompiled headers themselves, which are built
+    # again whenever any header they include changes.
+    includes = self.to_list(getattr(self, 'includes', []))
+    include_nodes = self.to_incnodes(includes + self.env.INCLUDES)
+    pch_dir = self.path.get_bld().make_node(f'{self.target}.pch')
+
+    for header in self.to_list(getattr(self, 'pch', [])):
+        # The header is looked up as the compiler does, in the include paths in order
+        node = next(filter(None, (inc.find_resource(header) for inc in include_nodes)), None)
+        if node is None:
+            raise Errors.WafError(f'Could not find the precompiled header {header} in the include paths of {self.name}')
+        gch_node = pch_dir.find_or_declare(f'{header}.gch')
+        self.create_task('pch', node, gch_node)
+        for compiled_task in getattr(self, 'compiled_tasks', []):
+            if compiled_task.__class__.__name__ == 'c':
+                compiled_task.dep_nodes.append(gch_node)
+
+    self.includes = [pch_dir] + includes
+
+
+class fpga_design_config(Task.Task):
+    "Generates the fpga_design_config headers from the MSS configuration exported by Libero"
+    ext_out = ['.h']  # generated before any C file or precompiled header is compiled
+    color = 'CYAN'
+
+    def run(self):
+        written = fpga_design_config_generator.generate_fpga_design_config(self.inputs[0].abspath(),
+                                                                           self.headers_dir.abspath())
+        for header in written:
+            Logs.info(f'Regenerated {os.path.relpath(header, self.generator.bld.path.abspath())}')
+
+
+@feature('fpga_design_config')
+@before_method('process_source')
+def apply_fpga_design_config(self):
+    # Regenerates the headers of fpga_design_headers (e.g. include/fpga_design_config) from
+    # the XML exported by the MSS Configurator, fpga_design_xml, whenever the XML or the
+    # generator change. Only the headers whose content changes are written, so the others
+    # keep their modification time and only the sources including the headers which really
+    # changed are compiled again.
+    xml_node = self.path.find_resource(self.fpga_design_xml)
+    if xml_node is None:
+        raise Errors.WafError(f'Could not find the MSS configuration {self.fpga_design_xml}')
+    headers_dir = self.path.find_dir(self.fpga_design_headers) or self.path.make_node(self.fpga_design_headers)
+    headers = [path for path, _ in fpga_design_config_generator.SECTION_HEADERS.values()]
+    headers.append(fpga_design_config_generator.DESIGN_CONFIG_HEADER)
+
+    task = self.create_task('fpga_design_config', xml_node, [headers_dir.make_node(path) for path in headers])
+    task.headers_dir = headers_dir
+    task.dep_nodes.append(self.bld.root.find_node(fpga_design_config_generator.__file__))
+
 
 class cprogram(link_task):
     "Links object files into c programs"
@@ -39,6 +269,17 @@ class cprogram(link_task):
     inst_to = '${BINDIR}'
 
 
+@feature('cprogram')
+@after_method('apply_link')
+def apply_linker_script_deps(self):
+    # Links again whenever the linker script set by LINKER_SCRIPT changes, as its path on the
+    # command line does not change when it is generated again from the design configuration
+    if self.env.LINKER_SCRIPT:
+        node = self.bld.root.find_node(self.env.LINKER_SCRIPT)
+        if node:
+            self.link_task.dep_nodes.append(node)
+
+
 class cshlib(cprogram):
     "Links object files into c shared libraries"
     inst_to = '${LIBDIR}'
@@ -111,7 +352,26 @@ def map_bin(self):
     link_output = self.link_task.outputs[0]
     if not self.bin_target:
         self.bin_target = link_output.change_ext('.bin').name
-    self.create_task('bin', src=link_output, tgt=self.path.find_or_declare(self.bin_target))
+    self.bin_task = self.create_task('bin', src=link_output, tgt=self.path.find_or_declare(self.bin_target))
+
+
+class mss_header(Task.Task):
+    "Prepends the bootmode 1 MSS header to the binary and converts it to intel hex"
+    vars = ['MSS_HEADER_OBJCOPY']
+    color = 'CYAN'
+
+    def run(self):
+        bind_mss_header_to_bin(self.inputs[0].abspath(), ''.join(self.env.MSS_HEADER_OBJCOPY) or None)
+
+
+@feature('mss_header')
+@after_method('map_bin')
+def map_mss_header(self):
+    bin_output = self.bin_task.outputs[0]
+    base_name = bin_output.name.rsplit('.', 1)[0]
+    self.create_task('mss_header', src=bin_output,
+                     tgt=[bin_output.parent.find_or_declare(base_name + '-bm1-p0.bin'),
+                          bin_output.parent.find_or_declare(base_name + '-bm1-p0.hex')])
 
 
 class hex(Task.Task):
@@ -12,8 +12,6 @@ common_compiler_flags = [
     # Place each function or data in a separate section, so the linker can discard unused ones
     '-fdata-sections',
     '-ffunction-sections',
-    # Always run GCC static analyzer
-    '-fanalyzer',
     # Put global and static data smaller than 8 bytes into a special section
     '-msmall-data-limit=8',
     # Do not assume that unaligned memory references are handled by the system
@@ -23,6 +21,20 @@ common_compiler_flags = [
     '-fdiagnostics-color=always',
 ]
 
+analyzer_flags = [
+    # GCC static analyzer, only run by the analyze_<variant> commands
+    '-fanalyzer',
+    # Write the findings to the standard error as JSON
+    '-fdiagnostics-format=json',
+]
+
+lto_flags = [
+    # Link time optimization, only used by the release_lto variant
+    '-flto',
+    # Optimize the whole program as a single partition, which gives the smallest code
+    '-flto-partition=one',
+]
+
 wall_flags = [
     # This section contains the warnings usually coming from  '-Wall',
     '-Waddress',
@@ -228,6 +240,14 @@ def add_gcc_flags(conf):
     # This is global as we are using GNU C extensions
     conf.env.append_unique('CFLAGS', ['-std=gnu11'])
 
+@conf
+def add_analyzer_flags(conf):
+    conf.env.append_unique('ANALYZER_FLAGS', analyzer_flags)
+
+@conf
+def add_lto_flags(conf):
+    conf.env.append_unique('LTO_FLAGS', lto_flags)
+
 @conf
 def add_wall_gcc_flags(conf):
     conf.env.append_unique('CFLAGS', wall_flags)
@@ -250,6 +270,8 @@ def add_security_flags(conf):
 
 def configure(conf):
     conf.add_gcc_flags()
+    conf.add_analyzer_flags()
+    conf.add_lto_flags()
     #conf.add_wall_gcc_flags()
     #conf.add_wextra_gcc_flags()
     #conf.add_pedantinc_gcc_flags()
@@ -18,14 +18,21 @@ def configure(conf):
         ' --file /usr/share/openocd/scripts/board/microsemi-riscv.cfg',
     ]
 
-    gdb_openocd_flags = [
+    # The GDB commands are split so that the port of the GDB server and whether the
+    # OpenOCD session is closed after loading can be chosen when programming
+    gdb_openocd_init_flags = [
           ' --batch'
           ' -ex "set arch riscv:rv64"'
           ' -ex "set mem inaccessible-by-default off"'
-          ' -ex "target extended-remote localhost:3333"'
+    ]
+
+    gdb_openocd_load_flags = [
           ' -ex "monitor reset halt"'
           ' -ex "load"'
           ' -ex "monitor resume"'
+    ]
+
+    gdb_openocd_exit_flags = [
           ' -ex "monitor shutdown"'
           ' -ex "quit"'
     ]
@@ -45,4 +52,8 @@ def configure(conf):
 
     conf.find_fp6_openocd()
     conf.env.OPENOCD_ARGS = openocd_args
-    conf.env.GDB_OPENOCD_FLAGS = gdb_openocd_flags
+    conf.env.GDB_OPENOCD_INIT_FLAGS = gdb_openocd_init_flags
+    conf.env.GDB_OPENOCD_LOAD_FLAGS = gdb_openocd_load_flags
+    conf.env.GDB_OPENOCD_EXIT_FLAGS = gdb_openocd_exit_flags
+    # OpenOCD command selecting the debug probe by its serial number
+    conf.env.OPENOCD_PROBE_COMMAND = 'adapter serial'
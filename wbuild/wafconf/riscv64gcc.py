@@ -27,7 +27,7 @@ def find_riscv64gcc(conf):
     conf.find_program('riscv64-unknown-elf-objdump', var='OBJDUMP', mandatory=True)
     conf.find_program('riscv64-unknown-elf-gcc-ranlib', var='RANLIB', mandatory=True)
     conf.find_program('riscv64-unknown-elf-strip', var='STRIP', mandatory=True)
-    conf.find_program('riscv64-unknown-elf-size', var='SIZE', mandatory=True)
+    conf.find_program('riscv64-unknown-elf-size', var='SIZE', mandatory=False)
     conf.find_program('riscv64-unknown-elf-gcc', var='LINK_CC', mandatory=True)
     conf.find_program('riscv64-unknown-elf-gdb', var='GDB', mandatory=False)
     conf.get_cc_version(cc, gcc=True)
@@ -28,7 +28,7 @@ def find_riscv64gcc(conf):
     conf.find_program('riscv-rtems6-objdump', var='OBJDUMP', mandatory=True)
     conf.find_program('riscv-rtems6-gcc-ranlib', var='RANLIB', mandatory=True)
     conf.find_program('riscv-rtems6-strip', var='STRIP', mandatory=True)
-    conf.find_program('riscv-rtems6-size', var='SIZE', mandatory=True)
+    conf.find_program('riscv-rtems6-size', var='SIZE', mandatory=False)
     conf.find_program('riscv-rtems6-gcc', var='LINK_CC', mandatory=True)
     conf.find_program('riscv-rtems6-gdb', var='GDB', mandatory=False)
     conf.find_program('riscv-rtems6-gcov', var='GCOV', mandatory=False)